@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estimacion de Parametros del Modelo de Tumor
+
+Ajusta (P0, beta0, alpha) a series de mediciones observadas usando la
+solucion analitica P(t) = P_0 * exp(beta_0/alpha * (1 - e^(-alpha*t)))
+y su jacobiano analitico (ModeloTumorAnalitico.jacobiano).
+
+Todas las series se ajustan a la vez: el paso de Levenberg-Marquardt
+(Gauss-Newton amortiguado) se resuelve en lote como N sistemas 3x3, sin
+ciclos de Python sobre las series. Las mediciones se leen en bloque desde
+archivos CSV o NPY.
+
+Formato de archivo:
+    - Fila 0: tiempos de medicion t_1, ..., t_M
+    - Filas 1..N: una serie por fila (NaN para mediciones faltantes)
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import os
+import numpy as np
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+
+# Cota inferior para P0 y alpha durante la iteracion (ambos deben ser positivos)
+_MINIMO_POSITIVO = 1e-12
+
+
+def cargar_series(ruta):
+    """
+    Lee en bloque un archivo de series de mediciones (.csv o .npy).
+
+    Parametros:
+    -----------
+    ruta : str
+        Ruta del archivo. La fila 0 contiene los tiempos y cada fila
+        siguiente una serie (NaN o celda vacia para datos faltantes).
+
+    Retorna:
+    --------
+    tuple : (t, P_obs)
+        t : array de forma (M,) con los tiempos
+        P_obs : array de forma (N, M) con las mediciones
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+
+    if extension == '.npy':
+        datos = np.load(ruta)
+    elif extension == '.csv':
+        datos = np.genfromtxt(ruta, delimiter=',', dtype=float)
+    else:
+        raise ValueError(f"Formato no soportado: '{extension}' (use .csv o .npy)")
+
+    datos = np.atleast_2d(datos)
+    return datos[0], datos[1:]
+
+
+def guardar_series(ruta, t, P_obs):
+    """
+    Guarda series de mediciones con el mismo formato que cargar_series().
+
+    Parametros:
+    -----------
+    ruta : str
+        Ruta del archivo (.csv o .npy)
+    t : array_like
+        Tiempos de medicion, forma (M,)
+    P_obs : array_like
+        Mediciones, forma (N, M)
+    """
+    datos = np.vstack([np.asarray(t, dtype=float), np.atleast_2d(P_obs)])
+
+    if ruta.lower().endswith('.npy'):
+        np.save(ruta, datos)
+    else:
+        np.savetxt(ruta, datos, delimiter=',')
+
+
+def estimacion_inicial(t, P_obs):
+    """
+    Calcula un punto de partida razonable para cada serie.
+
+    - P0: primera medicion valida
+    - alpha: 3 / (duracion de la serie), de modo que e^(-alpha*t) decae ~95%
+    - beta0: despejado de la formula cerrada usando la ultima medicion valida
+
+    Parametros:
+    -----------
+    t : array_like
+        Tiempos, forma (M,) o (N, M)
+    P_obs : array_like
+        Mediciones, forma (N, M)
+
+    Retorna:
+    --------
+    array : Parametros iniciales, forma (N, 3) con columnas (P0, beta0, alpha)
+    """
+    P_obs = np.atleast_2d(P_obs)
+    t = np.broadcast_to(t, P_obs.shape)
+    validos = np.isfinite(P_obs) & (P_obs > 0)
+    filas = np.arange(P_obs.shape[0])
+
+    # Indices de la primera y ultima medicion valida de cada serie
+    i_primero = np.argmax(validos, axis=1)
+    i_ultimo = P_obs.shape[1] - 1 - np.argmax(validos[:, ::-1], axis=1)
+
+    t_primero, t_ultimo = t[filas, i_primero], t[filas, i_ultimo]
+    P_primero, P_ultimo = P_obs[filas, i_primero], P_obs[filas, i_ultimo]
+
+    duracion = np.maximum(t_ultimo - t_primero, _MINIMO_POSITIVO)
+    alpha = 3.0 / duracion
+    crecimiento = np.log(np.maximum(P_ultimo, _MINIMO_POSITIVO) / np.maximum(P_primero, _MINIMO_POSITIVO))
+    beta0 = alpha * crecimiento / (np.exp(-alpha * t_primero) - np.exp(-alpha * t_ultimo))
+
+    return np.column_stack([P_primero, np.maximum(beta0, _MINIMO_POSITIVO), alpha])
+
+
+def _residuos_y_jacobiano(theta, t, P_obs, pesos, escala):
+    """
+    Evalua residuos y jacobiano de todas las series con un solo modelo broadcast.
+
+    Retorna:
+    --------
+    tuple : (residuos, J) con formas (N, M) y (N, M, 3)
+    """
+    modelo = ModeloTumorAnalitico(theta[:, 0:1], theta[:, 1:2], theta[:, 2:3])
+    P = modelo.resolver(t)
+    J = modelo.jacobiano(t)
+
+    if escala == 'log':
+        residuos = np.log(P_obs) - np.log(P)
+        J = J / P[..., None]
+    else:
+        residuos = P_obs - P
+
+    residuos = np.where(pesos, residuos, 0.0)
+    J = np.where(pesos[..., None], J, 0.0)
+    return residuos, J
+
+
+def ajustar_lote(t, P_obs, theta_inicial=None, escala='lineal', max_iter=100,
+                 tol=1e-10, lambda_inicial=1e-3):
+    """
+    Ajusta (P0, beta0, alpha) a N series simultaneamente con Levenberg-Marquardt.
+
+    En cada iteracion se resuelven en lote los N sistemas
+        (J^T J + lambda * diag(J^T J)) delta = J^T r
+    y cada serie ajusta su propio lambda segun si el paso reduce su costo.
+
+    Parametros:
+    -----------
+    t : array_like
+        Tiempos, forma (M,) si es comun a todas las series o (N, M)
+    P_obs : array_like
+        Mediciones, forma (N, M). Los NaN se ignoran.
+    theta_inicial : array_like, opcional
+        Parametros iniciales (N, 3). Por defecto usa estimacion_inicial().
+    escala : str, opcional
+        'lineal' ajusta P directamente; 'log' ajusta log(P), apropiado para
+        ruido multiplicativo (default: 'lineal')
+    max_iter : int, opcional
+        Numero maximo de iteraciones (default: 100)
+    tol : float, opcional
+        Tolerancia relativa sobre el paso y la reduccion del costo (default: 1e-10)
+    lambda_inicial : float, opcional
+        Amortiguamiento inicial de Levenberg-Marquardt (default: 1e-3)
+
+    Retorna:
+    --------
+    dict : Con claves
+        'P0', 'beta0', 'alpha' : arrays (N,) de parametros ajustados
+        'costo' : array (N,) con la suma de residuos al cuadrado / 2
+        'iteraciones' : array (N,) de iteraciones usadas por serie
+        'convergio' : array (N,) booleano; False si la serie tiene menos de
+                      3 observaciones validas (no se ajusta), se estanco
+                      (lambda > 1e12), agoto max_iter o termino con
+                      parametros no finitos
+    """
+    if escala not in ('lineal', 'log'):
+        raise ValueError("escala debe ser 'lineal' o 'log'")
+
+    P_obs = np.atleast_2d(np.asarray(P_obs, dtype=float))
+    t = np.asarray(t, dtype=float)
+    pesos = np.isfinite(P_obs)
+    if escala == 'log':
+        pesos &= P_obs > 0
+    P_obs = np.where(pesos, P_obs, 1.0)
+
+    if theta_inicial is None:
+        theta = estimacion_inicial(t, np.where(pesos, P_obs, np.nan))
+    else:
+        theta = np.array(theta_inicial, dtype=float).reshape(-1, 3)
+
+    n_series = P_obs.shape[0]
+    lam = np.full(n_series, lambda_inicial)
+    # Tres parametros: con menos de 3 observaciones la serie no se ajusta
+    activa = pesos.sum(axis=1) >= 3
+    convergio = np.zeros(n_series, dtype=bool)
+    iteraciones = np.zeros(n_series, dtype=int)
+
+    r, J = _residuos_y_jacobiano(theta, t, P_obs, pesos, escala)
+    costo = 0.5 * np.sum(r**2, axis=1)
+
+    for _ in range(max_iter):
+        if not activa.any():
+            break
+
+        # Ecuaciones normales en lote: (N, 3, 3) y (N, 3)
+        JTJ = np.einsum('nmi,nmj->nij', J, J)
+        JTr = np.einsum('nmi,nm->ni', J, r)
+        diagonal = np.einsum('nii->ni', JTJ) + _MINIMO_POSITIVO
+        A = JTJ + (lam[:, None] * diagonal)[:, :, None] * np.eye(3)
+
+        delta = np.linalg.solve(A, JTr[..., None])[..., 0]
+        delta[~activa] = 0.0
+
+        theta_nuevo = theta + delta
+        theta_nuevo[:, 0] = np.maximum(theta_nuevo[:, 0], _MINIMO_POSITIVO)
+        theta_nuevo[:, 2] = np.maximum(theta_nuevo[:, 2], _MINIMO_POSITIVO)
+
+        r_nuevo, J_nuevo = _residuos_y_jacobiano(theta_nuevo, t, P_obs, pesos, escala)
+        costo_nuevo = 0.5 * np.sum(r_nuevo**2, axis=1)
+
+        # Aceptar el paso solo en las series donde reduce el costo
+        acepta = activa & np.isfinite(costo_nuevo) & (costo_nuevo <= costo)
+        reduccion = np.where(acepta, costo - costo_nuevo, 0.0)
+        paso_relativo = np.linalg.norm(delta, axis=1) / (np.linalg.norm(theta, axis=1) + tol)
+
+        theta[acepta] = theta_nuevo[acepta]
+        r[acepta], J[acepta] = r_nuevo[acepta], J_nuevo[acepta]
+        costo_anterior = costo.copy()
+        costo[acepta] = costo_nuevo[acepta]
+
+        lam = np.where(acepta, lam * 0.3, lam * 10.0)
+        iteraciones += activa
+
+        converge = (acepta & np.all(np.isfinite(theta), axis=1)
+                    & ((paso_relativo < tol) | (reduccion <= tol * costo_anterior)))
+        # Estancada: lambda crecio sin aceptar pasos; termina sin converger
+        estancada = activa & ~acepta & (lam > 1e12)
+        convergio |= converge
+        activa &= ~(converge | estancada)
+
+    return {
+        'P0': theta[:, 0],
+        'beta0': theta[:, 1],
+        'alpha': theta[:, 2],
+        'costo': costo,
+        'iteraciones': iteraciones,
+        'convergio': convergio,
+    }
+
+
+def ajustar_archivo(ruta, **kwargs):
+    """
+    Lee un archivo de series (CSV/NPY) y ajusta todas las series en lote.
+
+    Parametros:
+    -----------
+    ruta : str
+        Ruta del archivo (ver cargar_series)
+    **kwargs :
+        Argumentos adicionales para ajustar_lote()
+
+    Retorna:
+    --------
+    dict : Resultado de ajustar_lote()
+    """
+    t, P_obs = cargar_series(ruta)
+    return ajustar_lote(t, P_obs, **kwargs)
+
+
+if __name__ == '__main__':
+    import time
+
+    print("=== Ajuste en Lote de (P0, beta0, alpha) ===\n")
+
+    # Generar series sinteticas con ruido multiplicativo
+    rng = np.random.default_rng(0)
+    n_series = 5000
+    t = np.linspace(0, 10, 25)
+
+    P0_real = rng.uniform(50, 150, n_series)
+    beta0_real = rng.uniform(1.0, 3.0, n_series)
+    alpha_real = rng.uniform(0.3, 1.0, n_series)
+
+    modelo = ModeloTumorAnalitico(P0_real[:, None], beta0_real[:, None], alpha_real[:, None])
+    P_obs = modelo.resolver(t) * np.exp(0.02 * rng.standard_normal((n_series, t.size)))
+
+    inicio = time.perf_counter()
+    resultado = ajustar_lote(t, P_obs, escala='log')
+    duracion = time.perf_counter() - inicio
+
+    print(f"Series ajustadas: {n_series} en {duracion:.3f} s")
+    print(f"Convergieron: {resultado['convergio'].sum()} / {n_series}")
+    print(f"Iteraciones medias: {resultado['iteraciones'].mean():.1f}\n")
+
+    for nombre, real in [('P0', P0_real), ('beta0', beta0_real), ('alpha', alpha_real)]:
+        error_rel = np.abs(resultado[nombre] - real) / real
+        print(f"  {nombre:>6}: error relativo mediano = {np.median(error_rel):.2e}")
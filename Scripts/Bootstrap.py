@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Intervalos de Confianza Bootstrap para los Parametros Ajustados
+
+Remuestrea una serie de mediciones y reajusta (P0, beta0, alpha) miles de
+veces para obtener intervalos de confianza de los parametros y de las
+cantidades derivadas (limite asintotico y factor de crecimiento).
+
+Esquemas de remuestreo:
+    'residuos' : P* = P_ajustado (+ o *) residuo remuestreado (tiempos fijos)
+    'casos'    : se remuestrean los pares (t_j, P_j) con reemplazo
+
+Las replicas no se ajustan en un ciclo: cada lote de B replicas es una
+sola llamada a ajustar_lote (Levenberg-Marquardt en lote, con tiempos
+(B, M) para el esquema de casos), y los lotes se reparten entre procesos.
+
+Intervalos: percentil y BCa (sesgo corregido y acelerado, con la
+aceleracion estimada por jackknife, que tambien es un unico ajuste en lote).
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import norm
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Ajuste_Parametros import ajustar_lote
+
+
+CANTIDADES = ('P0', 'beta0', 'alpha', 'limite_asintotico', 'factor_crecimiento')
+
+
+def _cantidades(ajuste):
+    """Parametros ajustados y cantidades derivadas, forma (N, 5)."""
+    modelo = ModeloTumorAnalitico(ajuste['P0'], ajuste['beta0'], ajuste['alpha'])
+    with np.errstate(over='ignore'):
+        return np.column_stack([ajuste['P0'], ajuste['beta0'], ajuste['alpha'],
+                                modelo.limite_asintotico(), modelo.factor_crecimiento()])
+
+
+def _replicas_bootstrap(argumentos):
+    """
+    Genera y ajusta un lote de replicas bootstrap.
+
+    Es una funcion de modulo para poder ejecutarse en un proceso hijo.
+
+    Retorna:
+    --------
+    tuple : (replicas (B, 5), convergio (B,))
+    """
+    t, P_obs, P_ajustado, residuos, theta, metodo, escala, B, semilla = argumentos
+    rng = np.random.default_rng(semilla)
+    M = len(t)
+
+    if metodo == 'residuos':
+        r = residuos[rng.integers(len(residuos), size=(B, M))]
+        P_rep = P_ajustado * np.exp(r) if escala == 'log' else P_ajustado + r
+        t_rep = t
+    else:
+        indices = rng.integers(M, size=(B, M))
+        t_rep, P_rep = t[indices], P_obs[indices]
+
+    ajuste = ajustar_lote(t_rep, P_rep, theta_inicial=np.tile(theta, (B, 1)), escala=escala)
+    return _cantidades(ajuste), ajuste['convergio']
+
+
+def intervalos_bca(replicas, estimacion, jackknife, nivel=0.95):
+    """
+    Intervalos BCa a partir de las replicas y del jackknife.
+
+    z0 = Phi^-1(fraccion de replicas < estimacion)
+    a  = sum(d^3) / (6 * sum(d^2)^(3/2)),  d = media_jackknife - jackknife_i
+    niveles ajustados: Phi(z0 + (z0 + z) / (1 - a (z0 + z)))
+
+    Parametros:
+    -----------
+    replicas : array_like
+        Replicas bootstrap, forma (B, q)
+    estimacion : array_like
+        Estimacion con los datos originales, forma (q,)
+    jackknife : array_like
+        Estimaciones dejando fuera una observacion (solo ajustes
+        convergidos), forma (M, q)
+    nivel : float, opcional
+        Nivel de confianza (default: 0.95)
+
+    Retorna:
+    --------
+    array : Limites (inferior, superior), forma (q, 2)
+    """
+    replicas = np.asarray(replicas)
+    proporcion = np.mean(replicas < estimacion, axis=0)
+    proporcion = np.clip(proporcion, 1 / replicas.shape[0], 1 - 1 / replicas.shape[0])
+    z0 = norm.ppf(proporcion)
+
+    jackknife = np.asarray(jackknife)
+    d = jackknife.mean(axis=0) - jackknife
+    with np.errstate(invalid='ignore', divide='ignore'):
+        a = np.sum(d**3, axis=0) / (6 * np.sum(d**2, axis=0)**1.5)
+    a = np.nan_to_num(a)
+
+    z = norm.ppf([(1 - nivel) / 2, (1 + nivel) / 2])[:, None]
+    niveles = norm.cdf(z0 + (z0 + z) / (1 - a * (z0 + z)))
+
+    return np.array([[np.quantile(replicas[:, j], niveles[0, j]),
+                      np.quantile(replicas[:, j], niveles[1, j])]
+                     for j in range(replicas.shape[1])])
+
+
+def bootstrap_parametros(t, P_obs, n_bootstrap=2000, metodo='residuos', escala='log',
+                         nivel=0.95, n_procesos=1, tam_lote=500, semilla=None):
+    """
+    Intervalos bootstrap de (P0, beta0, alpha) y de las cantidades derivadas.
+
+    Parametros:
+    -----------
+    t : array_like
+        Tiempos de medicion, forma (M,)
+    P_obs : array_like
+        Mediciones, forma (M,) (sin faltantes)
+    n_bootstrap : int, opcional
+        Numero de replicas (default: 2000)
+    metodo : str, opcional
+        'residuos' o 'casos' (default: 'residuos')
+    escala : str, opcional
+        Escala del ajuste y de los residuos, 'log' (ruido multiplicativo) o
+        'lineal' (default: 'log')
+    nivel : float, opcional
+        Nivel de confianza (default: 0.95)
+    n_procesos : int, opcional
+        Procesos para ajustar los lotes (default: 1)
+    tam_lote : int, opcional
+        Replicas ajustadas por llamada a ajustar_lote (default: 500)
+    semilla : int, opcional
+        Semilla raiz; los lotes reciben flujos independientes
+
+    Retorna:
+    --------
+    dict : Con claves 'cantidades' (nombres), 'estimacion' (5,),
+           'error_estandar' (5,), 'percentil' (5, 2), 'bca' (5, 2),
+           'replicas' (B, 5), 'convergieron' y 'tiempo_s'
+    """
+    if metodo not in ('residuos', 'casos'):
+        raise ValueError("metodo debe ser 'residuos' o 'casos'")
+
+    t = np.asarray(t, dtype=float)
+    P_obs = np.asarray(P_obs, dtype=float)
+    M = len(t)
+
+    # Ajuste original y residuos centrados en la escala del ajuste
+    ajuste = ajustar_lote(t, P_obs[None, :], escala=escala)
+    theta = np.array([ajuste['P0'][0], ajuste['beta0'][0], ajuste['alpha'][0]])
+    estimacion = _cantidades(ajuste)[0]
+    P_ajustado = ModeloTumorAnalitico(*theta).resolver(t)
+    residuos = np.log(P_obs / P_ajustado) if escala == 'log' else P_obs - P_ajustado
+    residuos = residuos - residuos.mean()
+
+    # Lotes de replicas repartidos entre procesos, cada uno con su semilla
+    tamanos = [min(tam_lote, n_bootstrap - i) for i in range(0, n_bootstrap, tam_lote)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    tareas = [(t, P_obs, P_ajustado, residuos, theta, metodo, escala, B, s)
+              for B, s in zip(tamanos, semillas)]
+
+    inicio = time.perf_counter()
+    if n_procesos > 1:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            resultados = list(ejecutor.map(_replicas_bootstrap, tareas))
+    else:
+        resultados = [_replicas_bootstrap(tarea) for tarea in tareas]
+    duracion = time.perf_counter() - inicio
+
+    replicas = np.vstack([r[0] for r in resultados])
+    convergio = np.concatenate([r[1] for r in resultados])
+    validas = replicas[convergio & np.all(np.isfinite(replicas), axis=1)]
+
+    # Jackknife en un solo ajuste en lote: fila i = datos sin la observacion i
+    sin_i = ~np.eye(M, dtype=bool)
+    t_jk = np.broadcast_to(t, (M, M))[sin_i].reshape(M, M - 1)
+    P_jk = np.broadcast_to(P_obs, (M, M))[sin_i].reshape(M, M - 1)
+    ajuste_jk = ajustar_lote(t_jk, P_jk, theta_inicial=np.tile(theta, (M, 1)), escala=escala)
+    jackknife = _cantidades(ajuste_jk)
+    jackknife = jackknife[ajuste_jk['convergio'] & np.all(np.isfinite(jackknife), axis=1)]
+
+    alfa = (1 - nivel) / 2
+    return {
+        'cantidades': CANTIDADES,
+        'estimacion': estimacion,
+        'error_estandar': validas.std(axis=0, ddof=1),
+        'percentil': np.quantile(validas, [alfa, 1 - alfa], axis=0).T,
+        'bca': intervalos_bca(validas, estimacion, jackknife, nivel),
+        'replicas': validas,
+        'convergieron': len(validas),
+        'tiempo_s': duracion,
+    }
+
+
+if __name__ == '__main__':
+    import os
+
+    print("=== Intervalos Bootstrap de los Parametros del Modelo ===\n")
+
+    # Serie sintetica con ruido multiplicativo del 5%
+    rng = np.random.default_rng(4)
+    t = np.linspace(0, 8, 20)
+    verdad = ModeloTumorAnalitico(100.0, 2.0, 0.5)
+    P_obs = verdad.resolver(t) * np.exp(0.05 * rng.standard_normal(t.size))
+    valores_reales = [100.0, 2.0, 0.5, verdad.limite_asintotico(), verdad.factor_crecimiento()]
+
+    n_procesos = min(4, os.cpu_count() or 1)
+    for metodo in ['residuos', 'casos']:
+        res = bootstrap_parametros(t, P_obs, n_bootstrap=5000, metodo=metodo,
+                                   n_procesos=n_procesos, semilla=11)
+        print(f"Metodo '{metodo}': {res['convergieron']} replicas en {res['tiempo_s']:.2f} s")
+        print(f"{'Cantidad':>19} {'Real':>10} {'Estim.':>10} {'Percentil 95%':>23} {'BCa 95%':>23}")
+        for j, nombre in enumerate(res['cantidades']):
+            p_inf, p_sup = res['percentil'][j]
+            b_inf, b_sup = res['bca'][j]
+            print(f"{nombre:>19} {valores_reales[j]:10.3f} {res['estimacion'][j]:10.3f} "
+                  f"[{p_inf:9.3f}, {p_sup:9.3f}] [{b_inf:9.3f}, {b_sup:9.3f}]")
+        print()
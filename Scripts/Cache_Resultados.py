@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de Resultados en Disco Direccionado por Contenido
+
+Los scripts recalculan las mismas trayectorias en cada ejecucion. Este
+modulo las guarda en disco con una clave SHA-256 de todo lo que determina
+el resultado:
+- la clase (modulo y nombre) y la version del codigo: el hash del archivo
+  fuente de cada clase de su jerarquia (un cambio en ModeloTumorRK4.py o en
+  ModeloTumorBase.py invalida las entradas de RK4 automaticamente)
+- los argumentos del constructor, normalizados con su firma (P0=100 y 100
+  posicional dan la misma clave; los floats se hashean por su valor binario
+  exacto y los arrays por dtype, forma y bytes)
+
+Formato y concurrencia:
+- un .npz sin comprimir por entrada; los atributos escalares van en JSON
+  dentro del mismo archivo y la lectura usa allow_pickle=False
+- escritura atomica: archivo temporal (.tmp, no cuenta como entrada) en el
+  mismo directorio + os.replace, de modo que un lector ve la entrada
+  completa o no la ve
+- un lector que pierde la carrera con un desalojo o encuentra un archivo
+  ilegible lo trata como fallo y recalcula
+- desalojo por tamano: al superar limite_bytes se borran las entradas usadas
+  hace mas tiempo (cada acierto actualiza la fecha del archivo)
+
+El directorio se elige con la variable de entorno TUMOR_CACHE y el cache se
+desactiva con TUMOR_SIN_CACHE=1.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+
+# Directorio del cache (se puede cambiar con la variable de entorno TUMOR_CACHE)
+DIRECTORIO_CACHE = os.environ.get('TUMOR_CACHE',
+                                  os.path.join(os.path.expanduser('~'), '.cache', 'modelo_tumor'))
+
+# Tamano maximo por defecto del cache en disco
+LIMITE_BYTES = 256 * 2**20
+
+# Clave del JSON con los atributos escalares dentro de cada .npz
+_CLAVE_ESCALARES = '__escalares__'
+
+
+def guardar_atomico(ruta, **arrays):
+    """
+    Escribe un .npz en un archivo temporal y lo renombra (sin archivos a medias).
+
+    Parametros:
+    -----------
+    ruta : str
+        Ruta final del archivo
+    **arrays :
+        Arrays a guardar (como en np.savez)
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    # Sufijo .tmp: _entradas() solo cuenta los .npz, asi que un temporal a
+    # medio escribir nunca se desaloja ni suma al tamano del cache
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as archivo:
+            np.savez(archivo, **arrays)
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def version_codigo(objeto):
+    """
+    Hash del codigo fuente de una clase (y sus bases) o de una funcion.
+
+    Parametros:
+    -----------
+    objeto : type or callable
+        Clase o funcion
+
+    Retorna:
+    --------
+    str : SHA-256 de los archivos fuente involucrados
+    """
+    clases = inspect.getmro(objeto) if inspect.isclass(objeto) else (objeto,)
+    archivos = []
+    for c in clases:
+        try:
+            archivo = inspect.getsourcefile(c)
+        except TypeError:
+            continue  # builtins (object, ABC, ...)
+        if archivo and archivo not in archivos:
+            archivos.append(archivo)
+
+    resumen = hashlib.sha256()
+    for archivo in archivos:
+        with open(archivo, 'rb') as f:
+            resumen.update(f.read())
+    return resumen.hexdigest()
+
+
+def _normalizar(valor):
+    """Representacion JSON determinista de una parte de la clave."""
+    if isinstance(valor, np.ndarray):
+        valor = np.ascontiguousarray(valor)
+        return {'ndarray': str(valor.dtype), 'forma': list(valor.shape),
+                'sha256': hashlib.sha256(valor.tobytes()).hexdigest()}
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, bool) or valor is None or isinstance(valor, str):
+        return valor
+    if isinstance(valor, int):
+        return {'int': str(valor)}
+    if isinstance(valor, float):
+        return {'float': valor.hex()}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v) for k, v in sorted(valor.items())}
+    if inspect.isclass(valor) or callable(valor):
+        # Solo el nombre y el codigo: la misma clase da la misma clave al
+        # importarla o al ejecutar su archivo como __main__. Las lambdas y
+        # funciones locales comparten nombre ('<lambda>', '<locals>') y sus
+        # variables capturadas no entran en la clave: se rechazan
+        if '<' in valor.__qualname__:
+            raise TypeError(f"No se puede usar {valor.__qualname__} en una clave de cache: "
+                            "use una funcion definida a nivel de modulo")
+        return {'codigo': valor.__qualname__, 'version': version_codigo(valor)}
+    raise TypeError(f"No se puede usar {type(valor).__name__} en una clave de cache")
+
+
+def _serializable(valor):
+    """True si el atributo se puede guardar sin pickle."""
+    if isinstance(valor, np.ndarray):
+        return valor.dtype.kind in 'biufcU'
+    return isinstance(valor, (bool, int, float, str, np.generic)) or valor is None
+
+
+class CacheResultados:
+    """
+    Cache persistente de resultados (arrays) con clave de contenido.
+
+    Atributos:
+    ----------
+    directorio : str
+        Directorio de las entradas .npz
+    limite_bytes : int
+        Tamano maximo total antes de desalojar
+    activo : bool
+        Si es False todo se recalcula y nada se escribe
+    aciertos, fallos : int
+        Contadores de lecturas servidas desde disco y recalculadas
+    """
+
+    def __init__(self, directorio=None, limite_bytes=LIMITE_BYTES, activo=None):
+        """
+        Inicializa el cache.
+
+        Parametros:
+        -----------
+        directorio : str, opcional
+            Directorio del cache (default: DIRECTORIO_CACHE)
+        limite_bytes : int, opcional
+            Tamano maximo total en bytes (default: 256 MiB)
+        activo : bool, opcional
+            Usar el disco (default: True salvo TUMOR_SIN_CACHE=1)
+        """
+        self.directorio = DIRECTORIO_CACHE if directorio is None else directorio
+        self.limite_bytes = limite_bytes
+        self.activo = (os.environ.get('TUMOR_SIN_CACHE') != '1') if activo is None else activo
+        self.aciertos = 0
+        self.fallos = 0
+
+    def clave(self, *partes):
+        """
+        Clave SHA-256 de una secuencia de partes (clases, numeros, arrays, ...).
+
+        Parametros:
+        -----------
+        *partes :
+            Todo lo que determina el resultado
+
+        Retorna:
+        --------
+        str : Clave hexadecimal
+        """
+        descripcion = json.dumps([_normalizar(p) for p in partes], sort_keys=True)
+        return hashlib.sha256(descripcion.encode()).hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.npz")
+
+    def leer(self, clave):
+        """
+        Lee una entrada; None si no existe o no se puede leer.
+
+        Parametros:
+        -----------
+        clave : str
+            Clave de la entrada
+
+        Retorna:
+        --------
+        dict or None : Arrays guardados
+        """
+        if not self.activo:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            with np.load(ruta, allow_pickle=False) as datos:
+                resultado = {nombre: datos[nombre] for nombre in datos.files}
+            os.utime(ruta)  # marca de uso para el desalojo LRU
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Entrada ilegible (p. ej. de una version anterior): se recalcula
+            return None
+        return resultado
+
+    def escribir(self, clave, **arrays):
+        """
+        Guarda una entrada de forma atomica y desaloja si hace falta.
+
+        Parametros:
+        -----------
+        clave : str
+            Clave de la entrada
+        **arrays :
+            Arrays a guardar
+        """
+        if not self.activo:
+            return
+        os.makedirs(self.directorio, exist_ok=True)
+        guardar_atomico(self._ruta(clave), **arrays)
+        self.desalojar()
+
+    def calcular(self, clave, funcion):
+        """
+        Retorna la entrada guardada o la calcula con funcion() y la guarda.
+
+        Parametros:
+        -----------
+        clave : str
+            Clave de la entrada (ver clave())
+        funcion : callable
+            Sin argumentos; retorna un dict de arrays
+
+        Retorna:
+        --------
+        dict : Arrays del resultado
+        """
+        resultado = self.leer(clave)
+        if resultado is not None:
+            self.aciertos += 1
+            return resultado
+
+        self.fallos += 1
+        resultado = funcion()
+        self.escribir(clave, **resultado)
+        return resultado
+
+    def modelo(self, clase, *args, **kwargs):
+        """
+        Construye un modelo o lo restaura desde el disco.
+
+        La clave combina la clase, la version de su codigo y los argumentos
+        normalizados con la firma del constructor. En un fallo se construye
+        el modelo y se guardan sus atributos (arrays y escalares); en un
+        acierto se crea la instancia sin ejecutar __init__ y se restauran,
+        salvo tiempo_integracion, que queda en 0.0 porque no se integro nada
+        (estadisticas_trabajo() de un modelo restaurado no mide el calculo
+        original). Los modelos con atributos que no se pueden guardar sin pickle se
+        construyen siempre.
+
+        Parametros:
+        -----------
+        clase : type
+            Subclase de ModeloTumorBase
+        *args, **kwargs :
+            Argumentos del constructor
+
+        Retorna:
+        --------
+        ModeloTumorBase : Instancia de clase
+        """
+        argumentos = inspect.signature(clase).bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        clave = self.clave(clase, dict(argumentos.arguments))
+
+        guardado = self.leer(clave)
+        if guardado is not None and _CLAVE_ESCALARES in guardado:
+            self.aciertos += 1
+            modelo = clase.__new__(clase)
+            modelo.__dict__.update(json.loads(str(guardado.pop(_CLAVE_ESCALARES))))
+            modelo.__dict__.update(guardado)
+            modelo.tiempo_integracion = 0.0
+            return modelo
+
+        self.fallos += 1
+        modelo = clase(*args, **kwargs)
+        atributos = vars(modelo)
+        if all(_serializable(v) for v in atributos.values()):
+            arrays = {k: v for k, v in atributos.items() if isinstance(v, np.ndarray)}
+            escalares = {k: (v.item() if isinstance(v, np.generic) else v)
+                         for k, v in atributos.items() if not isinstance(v, np.ndarray)}
+            self.escribir(clave, **arrays, **{_CLAVE_ESCALARES: json.dumps(escalares)})
+        return modelo
+
+    def _entradas(self):
+        """Lista (ruta, tamano, ultimo uso) de las entradas en disco."""
+        entradas = []
+        try:
+            nombres = os.listdir(self.directorio)
+        except FileNotFoundError:
+            return entradas
+        for nombre in nombres:
+            if not nombre.endswith('.npz'):
+                continue
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                info = os.stat(ruta)
+            except FileNotFoundError:
+                continue
+            entradas.append((ruta, info.st_size, info.st_mtime))
+        return entradas
+
+    def tamano_total(self):
+        """
+        Retorna el tamano total de las entradas en bytes.
+
+        Retorna:
+        --------
+        int : Bytes ocupados
+        """
+        return sum(tamano for _, tamano, _ in self._entradas())
+
+    def desalojar(self):
+        """
+        Borra las entradas menos usadas hasta quedar bajo limite_bytes.
+
+        Retorna:
+        --------
+        int : Numero de entradas borradas
+        """
+        entradas = sorted(self._entradas(), key=lambda e: e[2])
+        total = sum(tamano for _, tamano, _ in entradas)
+        borradas = 0
+        for ruta, tamano, _ in entradas:
+            if total <= self.limite_bytes:
+                break
+            try:
+                os.remove(ruta)
+                borradas += 1
+            except FileNotFoundError:
+                pass  # otro proceso ya la borro
+            total -= tamano
+        return borradas
+
+    def limpiar(self):
+        """Borra todas las entradas del cache."""
+        for ruta, _, _ in self._entradas():
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+
+
+_cache_por_defecto = None
+
+
+def cache_por_defecto():
+    """
+    Instancia compartida del cache (directorio y limite por defecto).
+
+    Retorna:
+    --------
+    CacheResultados : Cache compartido por los scripts
+    """
+    global _cache_por_defecto
+    if _cache_por_defecto is None:
+        _cache_por_defecto = CacheResultados()
+    return _cache_por_defecto
+
+
+if __name__ == '__main__':
+    from ModeloTumorRK4 import ModeloTumorRK4
+    from ModeloTumorEuler import ModeloTumorEuler
+
+    print("=== Cache de Resultados en Disco ===\n")
+
+    cache = CacheResultados(directorio=os.path.join(tempfile.gettempdir(), 'cache_tumor_demo'))
+    cache.limpiar()
+
+    # Primera construccion: se integra y se guarda; segunda: se lee del disco
+    for intento in ['calculo', 'cache']:
+        inicio = time.perf_counter()
+        modelo = cache.modelo(ModeloTumorEuler, 100, 2.0, 0.5, h=1e-4)
+        print(f"Euler h=1e-4 ({intento}): {(time.perf_counter() - inicio) * 1000:8.2f} ms, "
+              f"P(10) = {modelo.resolver(10.0):.6f}")
+
+    # Argumentos con nombre o posicionales dan la misma clave
+    modelo = cache.modelo(ModeloTumorEuler, P0=100, beta0=2.0, alpha=0.5, h=0.0001, t_max=10.0)
+    print(f"Misma clave con argumentos por nombre: aciertos={cache.aciertos}, fallos={cache.fallos}")
+    print(f"Atributos restaurados: {modelo.nombre}, pasos={modelo.pasos}, "
+          f"tiempo_umbral(1000)={modelo.tiempo_umbral(1000.0):.4f}\n")
+
+    # Desalojo: muchas trayectorias distintas con un limite de 0.5 MiB
+    cache.limite_bytes = 2**19
+    for h in np.linspace(1e-3, 2e-3, 12):
+        cache.modelo(ModeloTumorRK4, 100, 2.0, 0.5, h=h)
+    print(f"Tras 12 trayectorias RK4: {len(cache._entradas())} entradas, "
+          f"{cache.tamano_total() / 2**20:.2f} MiB (limite {cache.limite_bytes / 2**20:.1f} MiB)")
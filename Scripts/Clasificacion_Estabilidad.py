@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Clasificacion en Lote de Sistemas Lineales 2x2 (Plano Traza-Determinante)
+Parte C - Plano de Fase y Estabilidad
+
+Para X' = J X con J = [[a, b], [c, d]] todo se obtiene en forma cerrada:
+
+T = a + d,   D = ad - bc,   Delta = T^2 - 4D
+lambda_{1,2} = (T +/- sqrt(Delta)) / 2
+v = (b, lambda - a)  si b != 0,   v = (lambda - d, c)  si c != 0
+
+y el tipo de punto critico depende solo de (T, D, Delta):
+
+D < 0                      -> silla
+D > 0, Delta > 0           -> nodo (estable si T < 0)
+D > 0, Delta = 0           -> nodo degenerado (estable si T < 0)
+D > 0, Delta < 0, T != 0   -> espiral (estable si T < 0)
+D > 0, T = 0               -> centro
+D = 0                      -> degenerado (equilibrios no aislados)
+
+Todas las operaciones se aplican a un arreglo (N, 2, 2) de jacobianos sin
+ciclos de Python, de modo que se pueden barrer familias enteras de
+modelos de compartimentos y dibujar millones de puntos en el plano T-D.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import numpy as np
+
+
+# Codigo entero de cada tipo (indice en TIPOS)
+TIPOS = (
+    'silla',
+    'nodo estable',
+    'nodo inestable',
+    'nodo degenerado estable',
+    'nodo degenerado inestable',
+    'espiral estable',
+    'espiral inestable',
+    'centro',
+    'degenerado',
+)
+
+
+def clasificar_sistemas(J, tol=1e-12):
+    """
+    Clasifica en lote el punto critico de X' = J X para N matrices 2x2.
+
+    Parametros:
+    -----------
+    J : array_like
+        Jacobianos, forma (N, 2, 2) (o (2, 2) para uno solo)
+    tol : float, opcional
+        Tolerancia relativa (a la escala de cada matriz) para decidir que
+        T, D o Delta son cero (default: 1e-12)
+
+    Retorna:
+    --------
+    dict : Con claves
+        'traza', 'determinante', 'discriminante' : arrays (N,)
+        'autovalores' : array complejo (N, 2)
+        'autovectores' : array complejo (N, 2, 2), columnas unitarias
+        'tipo' : array int (N,) con indices en TIPOS
+        'nombre' : array de str (N,) con el nombre del tipo
+        'estable' : array bool (N,), ambas partes reales < 0
+    """
+    J = np.asarray(J, dtype=float)
+    una_sola = J.ndim == 2
+    J = J.reshape(-1, 2, 2)
+    a, b, c, d = J[:, 0, 0], J[:, 0, 1], J[:, 1, 0], J[:, 1, 1]
+
+    T = a + d
+    D = a * d - b * c
+    Delta = T**2 - 4 * D
+
+    # Ceros relativos a la escala de cada matriz
+    escala = np.max(np.abs(J), axis=(1, 2))
+    cero_T = np.abs(T) <= tol * escala
+    cero_D = np.abs(D) <= tol * escala**2
+    cero_Delta = np.abs(Delta) <= tol * escala**2
+
+    # Autovalores: la raiz "grande" sin cancelacion y la otra por D / lambda_1
+    raiz = np.sqrt(np.where(cero_Delta, 0.0, Delta).astype(complex))
+    signo = np.where(T >= 0, 1.0, -1.0)
+    lambda_1 = (T + signo * raiz) / 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lambda_2 = np.where(np.abs(lambda_1) > 0, D / lambda_1, (T - signo * raiz) / 2)
+    # Con Delta < 0 los autovalores son conjugados exactos
+    complejos = (Delta < 0) & ~cero_Delta
+    lambda_2 = np.where(complejos, np.conj(lambda_1), lambda_2)
+    autovalores = np.stack([lambda_1, lambda_2], axis=1)
+
+    # Autovectores (b, lambda - a) o (lambda - d, c); base canonica si J es diagonal
+    lam = autovalores
+    usa_b = (np.abs(b) > tol * escala)[:, None]
+    usa_c = (np.abs(c) > tol * escala)[:, None]
+    # J diagonal: e1 para el autovalor mas cercano a a, e2 para el otro
+    # (y e1, e2 si el autovalor es doble)
+    canonica_e1 = np.abs(lam - a[:, None]) <= np.abs(lam - d[:, None])
+    canonica_e1[:, 1] &= ~cero_Delta
+    V = np.empty((len(T), 2, 2), dtype=complex)
+    V[:, 0, :] = np.where(usa_b, b[:, None], np.where(usa_c, lam - d[:, None], canonica_e1))
+    V[:, 1, :] = np.where(usa_b, lam - a[:, None], np.where(usa_c, c[:, None], ~canonica_e1))
+    V /= np.sqrt(np.abs(V[:, 0:1, :])**2 + np.abs(V[:, 1:2, :])**2)
+
+    # Tipo del punto critico
+    tipo = np.full(len(T), TIPOS.index('degenerado'))
+    positivo = ~cero_D & (D > 0)
+    estable_T = T < 0
+    tipo[~cero_D & (D < 0)] = TIPOS.index('silla')
+    nodo = positivo & ~cero_Delta & (Delta > 0)
+    tipo[nodo & estable_T] = TIPOS.index('nodo estable')
+    tipo[nodo & ~estable_T] = TIPOS.index('nodo inestable')
+    degenerado = positivo & cero_Delta
+    tipo[degenerado & estable_T] = TIPOS.index('nodo degenerado estable')
+    tipo[degenerado & ~estable_T] = TIPOS.index('nodo degenerado inestable')
+    espiral = positivo & complejos & ~cero_T
+    tipo[espiral & estable_T] = TIPOS.index('espiral estable')
+    tipo[espiral & ~estable_T] = TIPOS.index('espiral inestable')
+    tipo[positivo & complejos & cero_T] = TIPOS.index('centro')
+
+    estable = np.all(autovalores.real < 0, axis=1) & ~cero_D & ~cero_T
+
+    resultado = {
+        'traza': T,
+        'determinante': D,
+        'discriminante': Delta,
+        'autovalores': autovalores,
+        'autovectores': V,
+        'tipo': tipo,
+        'nombre': np.array(TIPOS)[tipo],
+        'estable': estable,
+    }
+    if una_sola:
+        resultado = {clave: valor[0] for clave, valor in resultado.items()}
+    return resultado
+
+
+def graficar_mapa_traza_determinante(traza, determinante, bins=600, rango=None,
+                                     figsize=(11, 8), guardar=None):
+    """
+    Dibuja la densidad de (T, D) en el plano traza-determinante.
+
+    Usa un histograma 2D (escala logaritmica), asi que el costo no depende
+    de cuantos millones de puntos se grafiquen. Se superponen la parabola
+    D = T^2/4 y los ejes que separan las regiones de clasificacion.
+
+    Parametros:
+    -----------
+    traza, determinante : array_like
+        Coordenadas de cada sistema, forma (N,)
+    bins : int, opcional
+        Bins por eje (default: 600)
+    rango : tuple, opcional
+        ((T_min, T_max), (D_min, D_max)) (default: percentiles 0.5-99.5)
+    figsize : tuple, opcional
+        Tamano de la figura (default: (11, 8))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+
+    Retorna:
+    --------
+    tuple : (fig, ax)
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LogNorm
+
+    traza = np.asarray(traza)
+    determinante = np.asarray(determinante)
+    if rango is None:
+        rango = (tuple(np.percentile(traza, [0.5, 99.5])), tuple(np.percentile(determinante, [0.5, 99.5])))
+
+    conteo, bordes_T, bordes_D = np.histogram2d(traza, determinante, bins=bins, range=rango)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    imagen = ax.pcolormesh(bordes_T, bordes_D, np.where(conteo > 0, conteo, np.nan).T,
+                           norm=LogNorm(), cmap='viridis', shading='auto')
+    fig.colorbar(imagen, ax=ax, label='Numero de sistemas')
+
+    # Fronteras: D = T^2/4 (nodos vs espirales), D = 0 (sillas), T = 0 (estabilidad)
+    T_linea = np.linspace(*rango[0], 400)
+    ax.plot(T_linea, T_linea**2 / 4, 'r-', linewidth=2, label='D = T^2/4')
+    ax.axhline(0, color='black', linewidth=1.5)
+    ax.axvline(0, color='black', linewidth=1.5, linestyle='--')
+
+    # Etiquetas de regiones
+    T_min, T_max = rango[0]
+    D_min, D_max = rango[1]
+    etiquetas = [(0.75 * T_min, 0.9 * D_max, 'Espiral estable'),
+                 (0.75 * T_max, 0.9 * D_max, 'Espiral inestable'),
+                 (0.5 * (T_min + T_max), 0.5 * D_min, 'Sillas')]
+    for x, y, texto in etiquetas:
+        ax.text(x, y, texto, ha='center', fontsize=11, fontweight='bold',
+                bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+
+    ax.set_xlim(rango[0])
+    ax.set_ylim(rango[1])
+    ax.set_xlabel('Traza T', fontsize=12)
+    ax.set_ylabel('Determinante D', fontsize=12)
+    ax.set_title(f'Plano Traza-Determinante ({len(traza):,} sistemas)', fontsize=14, fontweight='bold')
+    ax.legend(loc='lower right')
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, ax
+
+
+if __name__ == '__main__':
+    import time
+
+    print("=== Clasificacion de Sistemas Lineales 2x2 ===\n")
+
+    # Sistema de la Parte C: x' = x - y, y' = 2x - 3y
+    res = clasificar_sistemas([[1, -1], [2, -3]])
+    print("J = [[1, -1], [2, -3]]")
+    print(f"  T = {res['traza']}, D = {res['determinante']}, Delta = {res['discriminante']}")
+    # D = 1*(-3) - (-1)*2 = -1 < 0: autovalores -1 +/- sqrt(2) de signos opuestos
+    print(f"  Autovalores: {res['autovalores'].real} (-1 +/- sqrt(2), de signos opuestos)")
+    print(f"  Autovectores (columnas):\n{res['autovectores'].real}")
+    print(f"  Tipo: {res['nombre']} | estable: {res['estable']}\n")
+
+    # Familia aleatoria de jacobianos
+    rng = np.random.default_rng(0)
+    N = 2_000_000
+    J = rng.normal(size=(N, 2, 2))
+
+    inicio = time.perf_counter()
+    res = clasificar_sistemas(J)
+    duracion = time.perf_counter() - inicio
+    print(f"{N:,} sistemas clasificados en {duracion:.2f} s")
+
+    inicio = time.perf_counter()
+    referencia = np.linalg.eigvals(J)
+    print(f"np.linalg.eigvals en el mismo lote: {time.perf_counter() - inicio:.2f} s")
+    error = np.max(np.abs(np.sort_complex(res['autovalores']) - np.sort_complex(referencia)))
+    print(f"Diferencia maxima de autovalores: {error:.2e}")
+    residuo = np.einsum('nij,njk->nik', J, res['autovectores']) - res['autovectores'] * res['autovalores'][:, None, :]
+    print(f"Residuo maximo |J v - lambda v|: {np.max(np.abs(residuo)):.2e}\n")
+
+    conteo = np.bincount(res['tipo'], minlength=len(TIPOS))
+    for nombre, n in zip(TIPOS, conteo):
+        print(f"  {nombre:>26}: {n:9d}")
+
+    import matplotlib.pyplot as plt
+
+    graficar_mapa_traza_determinante(res['traza'], res['determinante'])
+    plt.show()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Numeros de Condicion del Problema (Tarea 2.2)
+
+Numero de condicion relativo de P(t) respecto a cada parametro x:
+
+kappa_x(t) = | x / P * dP/dx |
+
+A partir de las derivadas analiticas (ModeloTumorAnalitico.jacobiano), con
+E = e^(-alpha t) y g = (1 - E) / alpha, el factor P se cancela:
+
+kappa_P0    = 1
+kappa_beta0 = beta_0 * g                      (= log P(t)/P0)
+kappa_alpha = | beta_0 * (t E - g) |
+
+de modo que se evaluan sin desbordamiento aunque P(t) no quepa en float64.
+Una perturbacion relativa eps en todos los parametros a la vez cambia P
+en a lo sumo kappa_total * eps, con kappa_total = suma de los kappa_x, y se
+pierden aproximadamente log10(kappa_total) digitos.
+
+Todo se calcula por broadcasting: mapa_condicionamiento() evalua una malla
+densa de dos parametros (o de un parametro y t) en una sola pasada.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import numpy as np
+
+
+# Ejes validos de los mapas
+VARIABLES = ('P0', 'beta0', 'alpha', 't')
+
+
+def numeros_condicion(P0, beta0, alpha, t):
+    """
+    Numeros de condicion relativos de P(t) respecto a P0, beta0 y alpha.
+
+    Todos los argumentos se combinan por broadcasting. alpha = 0 usa el
+    limite g = t.
+
+    Parametros:
+    -----------
+    P0 : float or array_like
+        Poblacion inicial
+    beta0 : float or array_like
+        Tasa de crecimiento inicial (beta_0)
+    alpha : float or array_like
+        Tasa de decrecimiento exponencial (alpha)
+    t : float or array_like
+        Tiempo(s)
+
+    Retorna:
+    --------
+    dict : Con claves 'P0', 'beta0', 'alpha', 'total' (suma de los tres) y
+           'amplificacion' (|dP/dP0| = P/P0, factor absoluto de la
+           perturbacion en P0), todos con la forma del broadcast
+    """
+    P0, beta0, alpha, t = np.broadcast_arrays(*(np.asarray(x, dtype=float)
+                                                for x in (P0, beta0, alpha, t)))
+    E = np.exp(-alpha * t)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        g = np.where(alpha == 0, t, -np.expm1(-alpha * t) / alpha)
+
+    kappa_P0 = np.ones_like(P0)
+    kappa_beta0 = np.abs(beta0 * g)
+    kappa_alpha = np.abs(beta0 * (t * E - g))
+
+    with np.errstate(over='ignore'):
+        amplificacion = np.exp(beta0 * g)
+
+    return {
+        'P0': kappa_P0,
+        'beta0': kappa_beta0,
+        'alpha': kappa_alpha,
+        'total': kappa_P0 + kappa_beta0 + kappa_alpha,
+        'amplificacion': amplificacion,
+    }
+
+
+def digitos_perdidos(kappa):
+    """
+    Digitos significativos que se pierden: log10(max(kappa, 1)).
+
+    Parametros:
+    -----------
+    kappa : float or array_like
+        Numero(s) de condicion
+
+    Retorna:
+    --------
+    float or array_like : Digitos perdidos
+    """
+    return np.log10(np.maximum(kappa, 1.0))
+
+
+def mal_condicionado(kappa, umbral=100.0):
+    """
+    Clasifica como mal condicionado si kappa > umbral.
+
+    Con el umbral por defecto se pierden mas de dos digitos de los datos.
+
+    Parametros:
+    -----------
+    kappa : float or array_like
+        Numero(s) de condicion
+    umbral : float, opcional
+        Numero de condicion maximo aceptado (default: 100)
+
+    Retorna:
+    --------
+    bool or array of bool : True donde el problema esta mal condicionado
+    """
+    return np.asarray(kappa) > umbral
+
+
+def mapa_condicionamiento(valores_x, valores_y, ejes=('beta0', 'alpha'), P0=1.0, beta0=2.0,
+                          alpha=0.5, t=10.0):
+    """
+    Numeros de condicion sobre una malla de dos variables, en una pasada.
+
+    Parametros:
+    -----------
+    valores_x, valores_y : array_like
+        Valores de cada eje, formas (nx,) y (ny,)
+    ejes : tuple of str, opcional
+        Variables de los ejes (x, y), de VARIABLES (default: ('beta0', 'alpha'))
+    P0, beta0, alpha, t : float, opcional
+        Valores fijos de las variables que no son ejes
+
+    Retorna:
+    --------
+    dict : Salida de numeros_condicion con arrays (ny, nx), mas 'ejes',
+           'x', 'y' y 'fijos' (valores de las otras variables)
+    """
+    if len(ejes) != 2 or ejes[0] == ejes[1] or not set(ejes) <= set(VARIABLES):
+        raise ValueError(f"ejes debe ser un par de variables distintas de {VARIABLES}")
+
+    valores = {'P0': P0, 'beta0': beta0, 'alpha': alpha, 't': t}
+    x = np.asarray(valores_x, dtype=float)
+    y = np.asarray(valores_y, dtype=float)
+    valores[ejes[0]] = x[None, :]
+    valores[ejes[1]] = y[:, None]
+
+    mapa = numeros_condicion(**valores)
+    mapa.update({'ejes': tuple(ejes), 'x': x, 'y': y,
+                 'fijos': {v: valores[v] for v in VARIABLES if v not in ejes}})
+    return mapa
+
+
+def graficar_mapas_condicionamiento(mapa, umbral=100.0, figsize=(18, 5.5), guardar=None):
+    """
+    Mapas de calor (escala log) de kappa_beta0, kappa_alpha y kappa_total.
+
+    La curva blanca marca kappa = umbral: del lado claro el problema esta
+    mal condicionado.
+
+    Parametros:
+    -----------
+    mapa : dict
+        Salida de mapa_condicionamiento
+    umbral : float, opcional
+        Umbral de mal condicionamiento (default: 100)
+    figsize : tuple, opcional
+        Tamano de la figura (ancho, alto) en pulgadas (default: (18, 5.5))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+
+    Retorna:
+    --------
+    tuple : (fig, ejes)
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LogNorm
+
+    fig, ejes = plt.subplots(1, 3, figsize=figsize)
+    nombre_x, nombre_y = mapa['ejes']
+
+    # Misma escala de color en los tres paneles
+    positivos = np.concatenate([mapa[c][mapa[c] > 0].ravel() for c in ('beta0', 'alpha', 'total')])
+    norma = LogNorm(vmin=max(positivos.min(), 1e-3), vmax=positivos.max())
+
+    for ax, clave in zip(ejes, ['beta0', 'alpha', 'total']):
+        kappa = np.where(mapa[clave] > 0, mapa[clave], np.nan)
+        imagen = ax.pcolormesh(mapa['x'], mapa['y'], kappa, norm=norma, cmap='viridis',
+                               shading='auto')
+        if np.nanmin(kappa) < umbral < np.nanmax(kappa):
+            ax.contour(mapa['x'], mapa['y'], mapa[clave], levels=[umbral], colors='white',
+                       linewidths=2)
+        ax.set_xlabel(nombre_x, fontsize=13)
+        ax.set_ylabel(nombre_y, fontsize=13)
+        ax.set_title(f'kappa_{clave}', fontsize=14, fontweight='bold')
+        fig.colorbar(imagen, ax=ax)
+
+    fijos = ', '.join(f'{v}={valor:g}' for v, valor in mapa['fijos'].items())
+    fig.suptitle(f'Numeros de condicion relativos de P(t) (curva blanca: kappa = {umbral:g}; '
+                 f'fijos: {fijos})', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, ejes
+
+
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+    print("=== Numeros de Condicion del Modelo de Tumor ===\n")
+
+    # Caso base: kappa en t = 10 y verificacion contra x/P * jacobiano
+    P0, beta0, alpha, t = 100.0, 2.0, 0.5, 10.0
+    kappa = numeros_condicion(P0, beta0, alpha, t)
+    modelo = ModeloTumorAnalitico(P0, beta0, alpha)
+    desde_jacobiano = np.abs(np.array([P0, beta0, alpha]) / modelo.resolver(t) * modelo.jacobiano(t))
+    print(f"P0={P0}, beta0={beta0}, alpha={alpha}, t={t}")
+    for j, clave in enumerate(['P0', 'beta0', 'alpha']):
+        print(f"  kappa_{clave:<6} = {kappa[clave]:.6f}   (x/P * dP/dx = {desde_jacobiano[j]:.6f})")
+    print(f"  kappa_total  = {kappa['total']:.4f} -> {digitos_perdidos(kappa['total']):.2f} digitos perdidos")
+    print(f"  Amplificacion de una perturbacion absoluta en P0: {kappa['amplificacion']:.4f}")
+
+    # Perturbacion directa (Tarea 2.2, subtarea 1)
+    eps = 1e-6
+    cambio = abs(ModeloTumorAnalitico(P0, beta0 * (1 + eps), alpha).resolver(t) / modelo.resolver(t) - 1)
+    print(f"  Perturbacion relativa {eps:g} en beta0 -> cambio relativo en P: {cambio / eps:.6f} * eps\n")
+
+    # Malla densa (beta0, alpha) en una sola pasada
+    beta0s = np.linspace(0.1, 20, 1000)
+    alphas = np.linspace(0.02, 3, 1000)
+    inicio = time.perf_counter()
+    mapa = mapa_condicionamiento(beta0s, alphas, ejes=('beta0', 'alpha'), t=20.0)
+    duracion = time.perf_counter() - inicio
+    fraccion = np.mean(mal_condicionado(mapa['total']))
+    print(f"Malla {len(alphas)}x{len(beta0s)} en {duracion * 1000:.1f} ms: "
+          f"{100 * fraccion:.1f}% mal condicionado (kappa_total > 100)")
+    print(f"Maximo kappa_total: {mapa['total'].max():.2f} en beta0={beta0s[np.argmax(mapa['total']) % len(beta0s)]:.2f}, "
+          f"alpha={alphas[np.argmax(mapa['total']) // len(beta0s)]:.3f}")
+
+    graficar_mapas_condicionamiento(mapa, guardar='condicionamiento_beta0_alpha.png')
+
+    # Evolucion en el tiempo: malla (t, alpha) con beta0 fijo
+    mapa_t = mapa_condicionamiento(np.linspace(0, 30, 600), alphas, ejes=('t', 'alpha'), beta0=2.0)
+    graficar_mapas_condicionamiento(mapa_t, guardar='condicionamiento_t_alpha.png')
+    plt.show()
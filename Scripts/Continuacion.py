@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Continuacion Numerica de Ramas de Equilibrio (Pseudo-Longitud de Arco)
+Parte B - Modelo de Bifurcacion
+
+Sigue las raices de f(z; mu) = 0 en el plano (mu, z) sin integrar la EDO
+dz/dt = f(z; mu) en el tiempo. Cada punto de la rama x = (z, mu) se obtiene
+con un predictor-corrector:
+
+Predictor:  x* = x_n + ds * tau_n       (tau_n: tangente unitaria a la rama)
+Corrector:  Newton sobre  F(x) = 0
+                          tau_n . (x - x*) = 0   (condicion de pseudo-longitud de arco)
+
+El sistema aumentado es regular tambien en los pliegues (donde df/dz = 0 y
+la rama "da la vuelta" en mu), asi que la rama se recorre completa,
+incluidas las partes inestables que la integracion temporal no alcanza.
+
+Deteccion sobre la rama:
+- Estabilidad: estable si df/dz < 0
+- Pliegue: cambia el signo de dmu/ds
+- Punto de ramificacion: cambia el signo de df/dz sin pliegue
+  (en la horquilla mu z - z^3 aparece en (0, 0)); desde alli se salta a
+  la rama nueva desplazandose en la direccion ortogonal a la tangente.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class EcuacionParametrica(ABC):
+    """
+    Clase abstracta para EDOs escalares con un parametro: dz/dt = f(z; mu).
+
+    Igual que ModeloTumorBase.f, el lado derecho es el punto de extension:
+    las subclases solo definen f, y las derivadas se aproximan por
+    diferencias centradas salvo que las sobrescriban con la formula exacta.
+
+    Atributos:
+    ----------
+    nombre : str
+        Nombre descriptivo de la ecuacion
+    """
+
+    def __init__(self, nombre="Ecuacion parametrica"):
+        """
+        Inicializa la ecuacion.
+
+        Parametros:
+        -----------
+        nombre : str, opcional
+            Nombre descriptivo
+        """
+        self.nombre = nombre
+
+    @abstractmethod
+    def f(self, z, mu):
+        """
+        Lado derecho dz/dt = f(z; mu).
+
+        Parametros:
+        -----------
+        z : float or array_like
+            Estado
+        mu : float or array_like
+            Parametro de control
+
+        Retorna:
+        --------
+        float or array_like : f(z; mu)
+        """
+        pass
+
+    def df_dz(self, z, mu):
+        """Derivada parcial df/dz por diferencias centradas."""
+        h = 1e-7 * (1 + np.abs(z))
+        return (self.f(z + h, mu) - self.f(z - h, mu)) / (2 * h)
+
+    def df_dmu(self, z, mu):
+        """Derivada parcial df/dmu por diferencias centradas."""
+        h = 1e-7 * (1 + np.abs(mu))
+        return (self.f(z, mu + h) - self.f(z, mu - h)) / (2 * h)
+
+    def __repr__(self):
+        """Representacion en string de la ecuacion."""
+        return self.nombre
+
+
+class Horquilla(EcuacionParametrica):
+    """
+    Forma normal de la bifurcacion de horquilla: dz/dt = h + mu z - z^3.
+
+    Con h = 0 (caso del proyecto) los equilibrios son z = 0 y z = +/- sqrt(mu);
+    con h != 0 la horquilla se rompe (horquilla imperfecta) en una rama
+    continua y otra desconectada con un pliegue en mu = 3 (|h|/2)^(2/3).
+
+    Atributos adicionales:
+    ---------------------
+    imperfeccion : float
+        Termino constante h
+    """
+
+    def __init__(self, imperfeccion=0.0):
+        """
+        Inicializa la forma normal.
+
+        Parametros:
+        -----------
+        imperfeccion : float, opcional
+            Termino constante h (default: 0.0)
+        """
+        nombre = "mu z - z^3" if imperfeccion == 0 else f"{imperfeccion} + mu z - z^3"
+        super().__init__(nombre=nombre)
+        self.imperfeccion = imperfeccion
+
+    def f(self, z, mu):
+        """dz/dt = h + mu z - z^3."""
+        return self.imperfeccion + mu * z - z**3
+
+    def df_dz(self, z, mu):
+        """df/dz = mu - 3 z^2 (exacta)."""
+        return mu - 3 * z**2
+
+    def df_dmu(self, z, mu):
+        """df/dmu = z (exacta)."""
+        return z
+
+
+def _tangente(ecuacion, x, tau_anterior):
+    """
+    Tangente unitaria a la rama en x, orientada como tau_anterior.
+
+    Resuelve [F_z  F_mu; tau_anterior] tau = [0; 1].
+    """
+    A = np.array([[ecuacion.df_dz(*x), ecuacion.df_dmu(*x)], tau_anterior])
+    tau = np.linalg.solve(A, [0.0, 1.0])
+    return tau / np.linalg.norm(tau)
+
+
+def _corregir(ecuacion, x_pred, normal, max_iter=10, tol=1e-12):
+    """
+    Newton sobre F(x) = 0, normal . (x - x_pred) = 0.
+
+    Retorna:
+    --------
+    tuple : (x, convergio, iteraciones)
+    """
+    x = np.array(x_pred, dtype=float)
+    for k in range(1, max_iter + 1):
+        G = np.array([ecuacion.f(*x), normal @ (x - x_pred)])
+        A = np.array([[ecuacion.df_dz(*x), ecuacion.df_dmu(*x)], normal])
+        try:
+            delta = np.linalg.solve(A, -G)
+        except np.linalg.LinAlgError:
+            return x, False, k
+        x += delta
+        if np.linalg.norm(delta) <= tol * (1 + np.linalg.norm(x)):
+            return x, True, k
+    return x, False, max_iter
+
+
+def _refinar_pliegue(ecuacion, x, max_iter=8, tol=1e-12):
+    """
+    Ubica el pliegue resolviendo F = 0, df/dz = 0 con Newton.
+
+    Las derivadas de df/dz se aproximan por diferencias centradas; si Newton
+    no converge se conserva la estimacion por interpolacion.
+    """
+    x_ini = x.copy()
+    for _ in range(max_iter):
+        z, mu = x
+        hz, hm = 1e-6 * (1 + abs(z)), 1e-6 * (1 + abs(mu))
+        G = np.array([ecuacion.f(z, mu), ecuacion.df_dz(z, mu)])
+        A = np.array([[ecuacion.df_dz(z, mu), ecuacion.df_dmu(z, mu)],
+                      [(ecuacion.df_dz(z + hz, mu) - ecuacion.df_dz(z - hz, mu)) / (2 * hz),
+                       (ecuacion.df_dz(z, mu + hm) - ecuacion.df_dz(z, mu - hm)) / (2 * hm)]])
+        try:
+            delta = np.linalg.solve(A, -G)
+        except np.linalg.LinAlgError:
+            return x_ini
+        x = x + delta
+        if np.linalg.norm(delta) <= tol * (1 + np.linalg.norm(x)):
+            return x
+    return x_ini
+
+
+def continuar(ecuacion, z0, mu0, mu_min=-2.0, mu_max=2.0, z_max=10.0, ds=0.05,
+              ds_min=1e-6, ds_max=0.2, max_pasos=2000, direccion=1.0, tau_inicial=None):
+    """
+    Sigue una rama de equilibrios desde (z0, mu0) con pseudo-longitud de arco.
+
+    Parametros:
+    -----------
+    ecuacion : EcuacionParametrica
+        Ecuacion f(z; mu)
+    z0, mu0 : float
+        Punto de partida (aproximado; se corrige con mu fijo)
+    mu_min, mu_max : float, opcional
+        Ventana de mu; la rama termina al salir (default: [-2, 2])
+    z_max : float, opcional
+        La rama termina si |z| > z_max (default: 10.0)
+    ds : float, opcional
+        Paso inicial de longitud de arco (default: 0.05)
+    ds_min, ds_max : float, opcional
+        Limites del paso adaptativo (default: 1e-6, 0.2)
+    max_pasos : int, opcional
+        Maximo de puntos de la rama (default: 2000)
+    direccion : float, opcional
+        +1 recorre la rama hacia mu creciente al inicio, -1 al reves
+    tau_inicial : array_like, opcional
+        Orientacion inicial (z, mu) de la tangente (default: (0, direccion))
+
+    Retorna:
+    --------
+    dict : Con claves 'z', 'mu', 'df_dz', 'estable' (arrays), 'puntos'
+           (lista de dict con 'tipo' ('pliegue' o 'ramificacion'), 'z', 'mu',
+           'tangente') y 'newton' (sistemas lineales resueltos)
+    """
+    # Corregir el punto inicial con mu fijo
+    x, convergio, newton = _corregir(ecuacion, np.array([z0, mu0]), np.array([0.0, 1.0]))
+    if not convergio:
+        raise ValueError(f"No se encontro un equilibrio cerca de z={z0}, mu={mu0}")
+
+    tau_ref = np.array([0.0, direccion]) if tau_inicial is None else np.asarray(tau_inicial, float)
+    tau = _tangente(ecuacion, x, tau_ref)
+    newton += 1
+
+    puntos_rama = [x.copy()]
+    puntos = []
+
+    for _ in range(max_pasos):
+        # Predictor-corrector con paso adaptativo
+        while True:
+            x_pred = x + ds * tau
+            x_nuevo, convergio, iteraciones = _corregir(ecuacion, x_pred, tau)
+            newton += iteraciones
+            if convergio and np.linalg.norm(x_nuevo - x) < 2 * ds:
+                break
+            ds *= 0.5
+            if ds < ds_min:
+                return _empaquetar(ecuacion, puntos_rama, puntos, newton)
+
+        tau_nuevo = _tangente(ecuacion, x_nuevo, tau)
+        newton += 1
+
+        # Pliegue: dmu/ds cambia de signo; ramificacion: df/dz cambia sin pliegue
+        fz, fz_nuevo = ecuacion.df_dz(*x), ecuacion.df_dz(*x_nuevo)
+        if tau[1] * tau_nuevo[1] < 0:
+            s = tau[1] / (tau[1] - tau_nuevo[1])
+            puntos.append(_punto('pliegue', _refinar_pliegue(ecuacion, x + s * (x_nuevo - x)), tau))
+        elif fz * fz_nuevo < 0:
+            s = fz / (fz - fz_nuevo)
+            puntos.append(_punto('ramificacion', x + s * (x_nuevo - x), tau))
+
+        x, tau = x_nuevo, tau_nuevo
+        puntos_rama.append(x.copy())
+
+        if not (mu_min <= x[1] <= mu_max) or abs(x[0]) > z_max:
+            break
+
+        # Agrandar el paso si Newton convergio rapido
+        if iteraciones <= 3:
+            ds = min(1.3 * ds, ds_max)
+
+    return _empaquetar(ecuacion, puntos_rama, puntos, newton)
+
+
+def _punto(tipo, x, tau):
+    """Registro de un punto especial."""
+    return {'tipo': tipo, 'z': x[0], 'mu': x[1], 'tangente': tau}
+
+
+def _empaquetar(ecuacion, puntos_rama, puntos, newton):
+    """Arma el diccionario de resultado de una rama."""
+    X = np.array(puntos_rama)
+    fz = ecuacion.df_dz(X[:, 0], X[:, 1])
+    return {'z': X[:, 0], 'mu': X[:, 1], 'df_dz': fz, 'estable': fz < 0,
+            'puntos': puntos, 'newton': newton}
+
+
+def _unir(rama_atras, rama_adelante):
+    """Une dos recorridos desde el mismo punto en una sola rama ordenada."""
+    rama = {}
+    for clave in ('z', 'mu', 'df_dz', 'estable'):
+        rama[clave] = np.concatenate([rama_atras[clave][::-1], rama_adelante[clave][1:]])
+    rama['puntos'] = rama_atras['puntos'] + rama_adelante['puntos']
+    rama['newton'] = rama_atras['newton'] + rama_adelante['newton']
+    return rama
+
+
+def _rama_completa(ecuacion, z0, mu0, tau, **kwargs):
+    """Continua en ambos sentidos desde (z0, mu0) con orientacion tau."""
+    adelante = continuar(ecuacion, z0, mu0, tau_inicial=tau, **kwargs)
+    atras = continuar(ecuacion, z0, mu0, tau_inicial=-np.asarray(tau), **kwargs)
+    return _unir(atras, adelante)
+
+
+def diagrama_bifurcacion(ecuacion, z0=0.0, mu0=-1.0, otros_inicios=(), desplazamiento=1e-3,
+                         max_ramas=10, **kwargs):
+    """
+    Construye el diagrama de bifurcacion completo desde un equilibrio conocido.
+
+    Sigue la rama inicial en ambos sentidos y, en cada punto de ramificacion
+    nuevo, salta a la rama que cruza: se parte de x_b + delta * n (n ortogonal
+    a la tangente), se corrige sobre el hiperplano n . (x - x_b) = delta y se
+    continua en ambos sentidos.
+
+    Parametros:
+    -----------
+    ecuacion : EcuacionParametrica
+        Ecuacion f(z; mu)
+    z0, mu0 : float, opcional
+        Equilibrio de partida (default: z=0, mu=-1)
+    otros_inicios : sequence, opcional
+        Pares (z, mu) adicionales para ramas desconectadas de la inicial
+        (p. ej. en la horquilla imperfecta) (default: ())
+    desplazamiento : float, opcional
+        Distancia delta del salto de rama (default: 1e-3)
+    max_ramas : int, opcional
+        Maximo de ramas a seguir (default: 10)
+    **kwargs :
+        Argumentos de continuar() (mu_min, mu_max, ds, ...)
+
+    Retorna:
+    --------
+    dict : Con claves 'ramas' (lista de ramas de continuar()), 'puntos'
+           (puntos especiales sin repetir; las ramificaciones donde la rama
+           nueva tiene un pliegue se clasifican como 'horquilla') y 'newton'
+    """
+    ramas = [_rama_completa(ecuacion, z, mu, np.array([0.0, 1.0]), **kwargs)
+             for z, mu in [(z0, mu0)] + list(otros_inicios)]
+    procesados = []
+    pendientes = [p for rama in ramas for p in rama['puntos'] if p['tipo'] == 'ramificacion']
+
+    while pendientes and len(ramas) < max_ramas:
+        punto = pendientes.pop(0)
+        x_b = np.array([punto['z'], punto['mu']])
+        if any(np.linalg.norm(x_b - q) < 10 * desplazamiento for q in procesados):
+            continue
+        procesados.append(x_b)
+
+        # Salto ortogonal a la tangente de la rama conocida
+        n = np.array([-punto['tangente'][1], punto['tangente'][0]])
+        x_inicio = x_b + desplazamiento * n
+        x_nuevo, convergio, _ = _corregir(ecuacion, x_inicio, n)
+        if not convergio:
+            continue
+
+        rama = _rama_completa(ecuacion, x_nuevo[0], x_nuevo[1], n, **kwargs)
+        ramas.append(rama)
+        pendientes += [p for p in rama['puntos'] if p['tipo'] == 'ramificacion']
+
+        # Una rama nueva que se pliega en el punto de ramificacion forma una horquilla
+        if any(p['tipo'] == 'pliegue' and np.hypot(p['z'] - x_b[0], p['mu'] - x_b[1]) < 10 * desplazamiento
+               for p in rama['puntos']):
+            punto['tipo'] = 'horquilla'
+
+    # Puntos especiales sin duplicados (el mismo punto visto desde varias ramas)
+    puntos = []
+    for rama in ramas:
+        for p in rama['puntos']:
+            x_p = np.array([p['z'], p['mu']])
+            repetido = any(np.linalg.norm(x_p - np.array([q['z'], q['mu']])) < 10 * desplazamiento
+                           for q in puntos)
+            # El pliegue de una rama nueva en su ramificacion ya es la horquilla
+            pliegue_de_horquilla = (p['tipo'] == 'pliegue'
+                                    and any(np.linalg.norm(x_p - q) < 10 * desplazamiento
+                                            for q in procesados))
+            if repetido or pliegue_de_horquilla:
+                continue
+            puntos.append(p)
+
+    return {'ramas': ramas, 'puntos': puntos, 'newton': sum(r['newton'] for r in ramas)}
+
+
+def graficar_diagrama_bifurcacion(diagrama, figsize=(10, 7), guardar=None):
+    """
+    Grafica el diagrama: linea solida estable, discontinua inestable.
+
+    Parametros:
+    -----------
+    diagrama : dict
+        Salida de diagrama_bifurcacion()
+    figsize : tuple, opcional
+        Tamano de la figura (default: (10, 7))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+
+    Retorna:
+    --------
+    tuple : (fig, ax)
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    for rama in diagrama['ramas']:
+        # Cortar la rama en tramos de estabilidad constante
+        cortes = np.flatnonzero(np.diff(rama['estable'].astype(int))) + 1
+        for tramo in np.split(np.arange(len(rama['z'])), cortes):
+            tramo = np.append(tramo, min(tramo[-1] + 1, len(rama['z']) - 1))
+            estable = rama['estable'][tramo[0]]
+            ax.plot(rama['mu'][tramo], rama['z'][tramo], color='blue' if estable else 'red',
+                    linestyle='-' if estable else '--', linewidth=2.5)
+
+    marcadores = {'horquilla': ('o', 'black'), 'ramificacion': ('s', 'purple'), 'pliegue': ('^', 'green')}
+    for tipo, (marcador, color) in marcadores.items():
+        pts = [p for p in diagrama['puntos'] if p['tipo'] == tipo]
+        if pts:
+            ax.plot([p['mu'] for p in pts], [p['z'] for p in pts], marcador, color=color,
+                    markersize=10, label=tipo.capitalize(), zorder=5)
+
+    ax.plot([], [], 'b-', linewidth=2.5, label='Estable (df/dz < 0)')
+    ax.plot([], [], 'r--', linewidth=2.5, label='Inestable (df/dz > 0)')
+    ax.set_xlabel('Parametro mu', fontsize=12)
+    ax.set_ylabel('Equilibrio z*', fontsize=12)
+    ax.set_title('Diagrama de Bifurcacion (continuacion por longitud de arco)',
+                 fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best')
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, ax
+
+
+if __name__ == '__main__':
+    print("=== Continuacion por Pseudo-Longitud de Arco ===\n")
+
+    for ecuacion, otros in [(Horquilla(), ()), (Horquilla(imperfeccion=0.1), [(-1.35, 2.0)])]:
+        diagrama = diagrama_bifurcacion(ecuacion, z0=0.0, mu0=-2.0, otros_inicios=otros,
+                                        mu_min=-2.0, mu_max=2.0)
+        print(f"Ecuacion: dz/dt = {ecuacion}")
+        print(f"  Ramas: {len(diagrama['ramas'])}, puntos por rama: "
+              f"{[len(r['z']) for r in diagrama['ramas']]}")
+        print(f"  Sistemas de Newton resueltos: {diagrama['newton']}")
+        for p in diagrama['puntos']:
+            print(f"  {p['tipo']:>12}: mu = {p['mu']:+.5f}, z = {p['z']:+.5f}")
+
+        # Comparar con las ramas exactas z = +/- sqrt(mu) en la horquilla perfecta
+        if ecuacion.imperfeccion == 0:
+            for rama in diagrama['ramas'][1:]:
+                exacta = np.sign(rama['z']) * np.sqrt(np.maximum(rama['mu'], 0))
+                print(f"  Error max. contra z = +/- sqrt(mu): {np.max(np.abs(rama['z'] - exacta)):.2e}")
+        print()
+
+    # Los pliegues de la horquilla imperfecta estan en mu = 3 (h/2)^(2/3)
+    print(f"Pliegue teorico (h=0.1): mu = {3 * 0.05**(2/3):.5f}")
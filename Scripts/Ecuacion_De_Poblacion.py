@@ -75,6 +75,88 @@ class ModeloTumorAnalitico(ModeloTumorBase):
         """
         return self.resolver(t)
 
+    def resolver_log(self, t):
+        """
+        Calcula log(P(t)) con la formula cerrada, sin pasar por exp().
+
+        log P(t) = log(P_0) + beta_0/alpha * (1 - e^(-alpha*t))
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : log(P(t))
+        """
+        return np.log(self.P0) - (self.beta0 / self.alpha) * np.expm1(-self.alpha * t)
+
+    def tiempo_umbral(self, umbrales):
+        """
+        Calcula el primer tiempo en que P(t) alcanza cada umbral (inversa cerrada).
+
+        Con s = ln(c/P_0)/beta_0, P(t) = c equivale a g(t) = s, donde
+        g(t) = (1 - e^(-alpha*t))/alpha crece desde g(0) = 0:
+        t = -ln(1 - alpha*s) / alpha   (t = s si alpha = 0)
+
+        Hay solucion si s >= 0 y, con alpha > 0, ademas alpha*s < 1 (g esta
+        acotada por 1/alpha). Con alpha <= 0 g no esta acotada y todo s >= 0
+        se alcanza. En otro caso se retorna np.inf.
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce
+        """
+        c = np.asarray(umbrales, dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = np.log(c / self.P0) / self.beta0
+            if self.alpha == 0:
+                t = s
+            else:
+                t = -np.log1p(-self.alpha * s) / self.alpha
+
+        alcanzable = (s >= 0) & ((self.alpha <= 0) | (self.alpha * s < 1))
+        t = np.where(c == self.P0, 0.0, np.where(alcanzable, t, np.inf))
+        return t[()] if t.ndim == 0 else t
+
+    def jacobiano(self, t):
+        """
+        Derivadas analiticas de P(t) respecto a los parametros (P0, beta0, alpha).
+
+        Con E = e^(-alpha*t) y g = (1 - E)/alpha:
+        dP/dP0    = P / P0
+        dP/dbeta0 = P * g
+        dP/dalpha = P * beta0 * (t*E - g) / alpha
+
+        Si P0, beta0 y alpha son arrays, el calculo se hace por broadcasting
+        (por ejemplo, parametros de forma (N, 1) y t de forma (M,)).
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar las derivadas
+
+        Retorna:
+        --------
+        array : Derivadas apiladas en el ultimo eje, forma (..., 3)
+        """
+        E = np.exp(-self.alpha * t)
+        g = (1 - E) / self.alpha
+        P = self.P0 * np.exp(self.beta0 * g)
+
+        dP_dP0 = P / self.P0
+        dP_dbeta0 = P * g
+        dP_dalpha = P * self.beta0 * (t * E - g) / self.alpha
+
+        return np.stack(np.broadcast_arrays(dP_dP0, dP_dbeta0, dP_dalpha), axis=-1)
+
 
 
 # Aliases para compatibilidad con scripts antiguos
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estadisticas en Linea (Streaming)
+
+Acumuladores de memoria fija para estadisticas por punto de tiempo cuando
+las muestras (trayectorias, evaluaciones del modelo) llegan por bloques y
+no se pueden guardar todas:
+
+- AcumuladorMomentos: media y varianza por bloques (Welford/Chan). Dos
+  acumuladores se pueden combinar, lo que permite repartir el trabajo
+  entre procesos y sumar los resultados al final.
+- HistogramaCuantiles: cuantiles aproximados a partir de un histograma de
+  bins fijos por punto de tiempo (tambien combinable entre procesos).
+- CuantilP2: algoritmo P^2 de Jain y Chlamtac, cinco marcadores por
+  cuantil y por punto de tiempo, sin necesidad de conocer el rango.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import numpy as np
+
+
+class AcumuladorMomentos:
+    """
+    Media y varianza en una pasada, actualizadas por bloques de muestras.
+
+    Cada bloque se resume con (n_b, media_b, M2_b) y se combina con el
+    acumulado usando la formula de Chan et al.:
+        delta = media_b - media
+        media += delta * n_b / n
+        M2    += M2_b + delta^2 * n_a * n_b / n
+
+    Atributos:
+    ----------
+    n : int
+        Numero de muestras acumuladas
+    media : array
+        Media por componente (p. ej. por punto de tiempo)
+    m2 : array
+        Suma de cuadrados de desviaciones respecto a la media
+    """
+
+    def __init__(self, forma):
+        """
+        Inicializa un acumulador vacio.
+
+        Parametros:
+        -----------
+        forma : int or tuple
+            Forma de una muestra (p. ej. numero de puntos de tiempo)
+        """
+        self.n = 0
+        self.media = np.zeros(forma)
+        self.m2 = np.zeros(forma)
+
+    def _combinar_resumen(self, n_b, media_b, m2_b):
+        """Combina el resumen (n_b, media_b, m2_b) con el acumulado."""
+        if n_b == 0:
+            return
+        n_total = self.n + n_b
+        delta = media_b - self.media
+        self.media = self.media + delta * (n_b / n_total)
+        self.m2 = self.m2 + m2_b + delta**2 * (self.n * n_b / n_total)
+        self.n = n_total
+
+    def actualizar(self, bloque):
+        """
+        Agrega un bloque de muestras.
+
+        Parametros:
+        -----------
+        bloque : array_like
+            Muestras apiladas en el eje 0, forma (B, *forma)
+        """
+        bloque = np.asarray(bloque, dtype=float)
+        media_b = bloque.mean(axis=0)
+        m2_b = np.sum((bloque - media_b)**2, axis=0)
+        self._combinar_resumen(bloque.shape[0], media_b, m2_b)
+
+    def combinar(self, otro):
+        """
+        Incorpora otro acumulador (por ejemplo, el de otro proceso).
+
+        Parametros:
+        -----------
+        otro : AcumuladorMomentos
+            Acumulador con la misma forma
+        """
+        self._combinar_resumen(otro.n, otro.media, otro.m2)
+
+    def varianza(self, ddof=1):
+        """
+        Retorna la varianza muestral.
+
+        Parametros:
+        -----------
+        ddof : int, opcional
+            Grados de libertad descontados (default: 1)
+
+        Retorna:
+        --------
+        array : Varianza por componente (NaN si no hay muestras suficientes)
+        """
+        if self.n <= ddof:
+            return np.full_like(self.media, np.nan)
+        return self.m2 / (self.n - ddof)
+
+
+class HistogramaCuantiles:
+    """
+    Cuantiles aproximados por punto de tiempo con un histograma de bins fijos.
+
+    Cada punto de tiempo tiene su propio rango [limite_inf, limite_sup]
+    dividido en n_bins. Los valores fuera del rango se cuentan en el bin
+    extremo (y en fuera_de_rango). El error del cuantil esta acotado por el
+    ancho del bin. A diferencia de los estimadores secuenciales, dos
+    histogramas se combinan sumando conteos, asi que sirven para repartir
+    el muestreo entre procesos.
+
+    Atributos:
+    ----------
+    conteos : array
+        Conteos por punto y bin, forma (T, n_bins)
+    escala : str
+        'log' si los bins son uniformes en log(x); 'lineal' si en x
+    fuera_de_rango : int
+        Valores que cayeron fuera del rango y se recortaron
+    """
+
+    def __init__(self, limite_inf, limite_sup, n_bins=2048, escala='log'):
+        """
+        Inicializa el histograma.
+
+        Parametros:
+        -----------
+        limite_inf, limite_sup : array_like
+            Rango por punto de tiempo, forma (T,), en la escala indicada
+            (es decir, log(x) si escala='log')
+        n_bins : int, opcional
+            Numero de bins por punto (default: 2048)
+        escala : str, opcional
+            'log' o 'lineal' (default: 'log')
+        """
+        self.limite_inf = np.atleast_1d(np.asarray(limite_inf, dtype=float))
+        self.limite_sup = np.atleast_1d(np.asarray(limite_sup, dtype=float))
+        self.n_bins = n_bins
+        self.escala = escala
+        self.conteos = np.zeros((self.limite_inf.size, n_bins), dtype=np.int64)
+        self.fuera_de_rango = 0
+
+    def actualizar(self, bloque):
+        """
+        Agrega un bloque de muestras.
+
+        Parametros:
+        -----------
+        bloque : array_like
+            Muestras, forma (B, T)
+        """
+        x = np.asarray(bloque, dtype=float)
+        if self.escala == 'log':
+            x = np.log(np.maximum(x, np.finfo(float).tiny))
+
+        ancho = (self.limite_sup - self.limite_inf) / self.n_bins
+        indices = np.floor((x - self.limite_inf) / ancho).astype(np.int64)
+        self.fuera_de_rango += int(np.count_nonzero((indices < 0) | (indices >= self.n_bins)))
+        indices = np.clip(indices, 0, self.n_bins - 1)
+
+        # Un solo bincount para todos los puntos de tiempo
+        n_puntos = self.conteos.shape[0]
+        planos = indices + np.arange(n_puntos) * self.n_bins
+        self.conteos += np.bincount(planos.ravel(), minlength=n_puntos * self.n_bins).reshape(n_puntos, self.n_bins)
+
+    def combinar(self, otro):
+        """
+        Incorpora otro histograma con el mismo rango y numero de bins.
+
+        Parametros:
+        -----------
+        otro : HistogramaCuantiles
+            Histograma a sumar
+        """
+        self.conteos += otro.conteos
+        self.fuera_de_rango += otro.fuera_de_rango
+
+    def cuantiles(self, niveles):
+        """
+        Calcula cuantiles interpolando linealmente dentro del bin.
+
+        Parametros:
+        -----------
+        niveles : array_like
+            Niveles en [0, 1], forma (Q,)
+
+        Retorna:
+        --------
+        array : Cuantiles, forma (Q, T), en la escala original de las muestras
+        """
+        niveles = np.atleast_1d(np.asarray(niveles, dtype=float))
+        acumulado = np.cumsum(self.conteos, axis=1)
+        total = acumulado[:, -1:]
+        ancho = (self.limite_sup - self.limite_inf) / self.n_bins
+        filas = np.arange(self.conteos.shape[0])
+
+        resultado = np.empty((niveles.size, self.conteos.shape[0]))
+        for j, q in enumerate(niveles):
+            objetivo = q * total[:, 0]
+            k = np.argmax(acumulado >= objetivo[:, None], axis=1)
+            previo = np.where(k > 0, acumulado[filas, np.maximum(k - 1, 0)], 0)
+            en_bin = np.maximum(self.conteos[filas, k], 1)
+            fraccion = np.clip((objetivo - previo) / en_bin, 0.0, 1.0)
+            resultado[j] = self.limite_inf + (k + fraccion) * ancho
+
+        return np.exp(resultado) if self.escala == 'log' else resultado
+
+
+class CuantilP2:
+    """
+    Estimador P^2 (Jain y Chlamtac, 1985) de varios cuantiles en una pasada.
+
+    Mantiene 5 marcadores (minimo, p/2, p, (1+p)/2, maximo) por cuantil y por
+    punto de tiempo, y los ajusta con interpolacion parabolica a medida que
+    llegan las observaciones. La memoria es O(Q*T) y no hace falta conocer el
+    rango de los datos, pero es la ruta lenta: cada paso P^2 depende de los
+    marcadores que dejo la observacion anterior, asi que las filas de un
+    bloque se procesan una a una en Python (solo se vectoriza sobre los Q*T
+    flujos). Ademas dos estimadores no se pueden combinar. Para bloques
+    grandes o muestreo repartido en procesos use HistogramaCuantiles.
+
+    Atributos:
+    ----------
+    niveles : array
+        Niveles de los cuantiles, forma (Q,)
+    n : int
+        Observaciones procesadas
+    """
+
+    def __init__(self, niveles, forma):
+        """
+        Inicializa el estimador.
+
+        Parametros:
+        -----------
+        niveles : array_like
+            Niveles en (0, 1), forma (Q,)
+        forma : int
+            Numero de puntos de tiempo T
+        """
+        self.niveles = np.atleast_1d(np.asarray(niveles, dtype=float))
+        self.forma = forma
+        self.n = 0
+
+        # Un flujo por (cuantil, punto): p de forma (Q*T, 1)
+        p = np.repeat(self.niveles, forma)[:, None]
+        self._incrementos = np.hstack([np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)])
+        self._deseadas = 1 + 4 * self._incrementos
+        self._alturas = np.zeros((p.shape[0], 5))
+        self._posiciones = np.tile(np.arange(1.0, 6.0), (p.shape[0], 1))
+        self._iniciales = []
+
+    def _agregar(self, x):
+        """Procesa una observacion x de forma (Q*T,)."""
+        q, pos = self._alturas, self._posiciones
+        filas = np.arange(q.shape[0])
+
+        # Celda k tal que q[k] <= x < q[k+1]; ajustar extremos
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        k = np.clip(np.sum(x[:, None] >= q[:, 1:4], axis=1), 0, 3)
+
+        pos += np.arange(5) > k[:, None]
+        self._deseadas += self._incrementos
+
+        # Ajustar los marcadores interiores
+        for i in (1, 2, 3):
+            d = self._deseadas[:, i] - pos[:, i]
+            mover = ((d >= 1) & (pos[:, i + 1] - pos[:, i] > 1)) | ((d <= -1) & (pos[:, i - 1] - pos[:, i] < -1))
+            if not mover.any():
+                continue
+            s = np.sign(d)
+
+            n_izq, n_i, n_der = pos[:, i - 1], pos[:, i], pos[:, i + 1]
+            q_izq, q_i, q_der = q[:, i - 1], q[:, i], q[:, i + 1]
+
+            # Los flujos que no se mueven (s = 0) pueden dividir por cero: se descartan
+            with np.errstate(invalid='ignore', divide='ignore'):
+                # Prediccion parabolica (P^2)
+                parabolica = q_i + s / (n_der - n_izq) * (
+                    (n_i - n_izq + s) * (q_der - q_i) / (n_der - n_i)
+                    + (n_der - n_i - s) * (q_i - q_izq) / (n_i - n_izq))
+
+                # Si sale del intervalo, prediccion lineal
+                vecino = (i + s).astype(int)
+                lineal = q_i + s * (q[filas, vecino] - q_i) / (pos[filas, vecino] - n_i)
+            valida = (q_izq < parabolica) & (parabolica < q_der)
+            nuevo = np.where(valida, parabolica, lineal)
+
+            q[:, i] = np.where(mover, nuevo, q_i)
+            pos[:, i] = np.where(mover, n_i + s, n_i)
+
+    def actualizar(self, bloque):
+        """
+        Agrega un bloque de observaciones (una iteracion de Python por fila).
+
+        Parametros:
+        -----------
+        bloque : array_like
+            Observaciones, forma (B, T)
+        """
+        # Cada fila se repite para los Q cuantiles: (B, Q*T) de una vez
+        bloque = np.tile(np.atleast_2d(np.asarray(bloque, dtype=float)), (1, self.niveles.size))
+        for x in bloque:
+            self.n += 1
+
+            if self.n <= 5:
+                self._iniciales.append(x)
+                if self.n == 5:
+                    self._alturas = np.sort(np.array(self._iniciales).T, axis=1)
+                continue
+
+            self._agregar(x)
+
+    def cuantiles(self):
+        """
+        Retorna las estimaciones actuales.
+
+        Retorna:
+        --------
+        array : Cuantiles, forma (Q, T)
+        """
+        if self.n == 0:
+            raise ValueError("CuantilP2 no ha recibido observaciones")
+        if self.n < 5:
+            datos = np.array(self._iniciales).reshape(self.n, self.niveles.size, self.forma)[:, 0, :]
+            return np.quantile(datos, self.niveles, axis=0)
+        return self._alturas[:, 2].reshape(self.niveles.size, self.forma)
+
+
+if __name__ == '__main__':
+    print("=== Estadisticas en Linea ===\n")
+
+    rng = np.random.default_rng(1)
+    momentos = AcumuladorMomentos(3)
+    histograma = HistogramaCuantiles(np.full(3, -6.0), np.full(3, 6.0), escala='lineal')
+
+    muestras = []
+    for _ in range(20):
+        bloque = rng.standard_normal((5000, 3)) * [1.0, 2.0, 0.5]
+        momentos.actualizar(bloque)
+        histograma.actualizar(bloque)
+        muestras.append(bloque)
+    muestras = np.concatenate(muestras)
+
+    print(f"Media (en linea):  {momentos.media}")
+    print(f"Media (directa):   {muestras.mean(axis=0)}")
+    print(f"Var. (en linea):   {momentos.varianza()}")
+    print(f"Var. (directa):    {muestras.var(axis=0, ddof=1)}")
+    print(f"Cuantil 0.95 (hist.):   {histograma.cuantiles([0.95])[0]}")
+    print(f"Cuantil 0.95 (directo): {np.quantile(muestras, 0.95, axis=0)}")
+
+    p2 = CuantilP2([0.05, 0.95], 3)
+    p2.actualizar(muestras[:20000])
+    print(f"Cuantiles P^2 (0.05, 0.95):\n{p2.cuantiles()}")
+    print(f"Directos:\n{np.quantile(muestras[:20000], [0.05, 0.95], axis=0)}")
@@ -272,6 +272,7 @@ def graficar_campo_isoclinas_interactivo(P0_init=100, beta0_init=2.0, alpha_init
 if __name__ == '__main__':
     from ModeloTumorEuler import ModeloTumorEuler
     from ModeloTumorRK4 import ModeloTumorRK4
+    from Cache_Resultados import cache_por_defecto
 
     print("="*70)
     print("VISUALIZACION DEL CAMPO DE ISOCLINAS - MODELO DE TUMOR")
@@ -309,11 +310,12 @@ if __name__ == '__main__':
         P0, beta0, alpha = 100, 2.0, 0.5
         h = 0.1
 
-        # Crear modelos usando polimorfismo
+        # Crear modelos usando polimorfismo (numericos desde el cache en disco)
+        cache = cache_por_defecto()
         modelo_principal = ModeloTumorAnalitico(P0, beta0, alpha)
         modelos_adicionales = [
-            ModeloTumorEuler(P0, beta0, alpha, h=h, t_max=10.0),
-            ModeloTumorRK4(P0, beta0, alpha, h=h, t_max=10.0)
+            cache.modelo(ModeloTumorEuler, P0, beta0, alpha, h=h, t_max=10.0),
+            cache.modelo(ModeloTumorRK4, P0, beta0, alpha, h=h, t_max=10.0)
         ]
 
         print("Modelos:")
@@ -7,6 +7,8 @@ Parte A - Modelo de Crecimiento de Tumor
 Este modulo contiene funciones para comparar:
 1. Multiples soluciones con diferentes condiciones iniciales
 2. Diferentes metodos numericos (Analitico, Euler, RK4) usando polimorfismo
+3. Metodos numericos sobre cualquier familia del registro (Registro_Modelos),
+   contra su solucion cerrada cuando existe
 
 Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
 Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
@@ -17,6 +19,7 @@ import matplotlib.pyplot as plt
 from Ecuacion_De_Poblacion import ModeloTumorAnalitico
 from ModeloTumorEuler import ModeloTumorEuler
 from ModeloTumorRK4 import ModeloTumorRK4
+from Registro_Modelos import ModeloCrecimiento, obtener_familia
 
 
 def graficar_comparacion_soluciones(P0_values, beta0, alpha, t_max=10, figsize=(12, 8), guardar=None):
@@ -157,7 +160,87 @@ def graficar_comparacion_metodos(modelos, t_max=10, figsize=(12, 8), guardar=Non
     return fig, ax
 
 
+def graficar_comparacion_familia(familia, P0, pasos=(0.5, 0.1), metodos=(ModeloTumorEuler, ModeloTumorRK4),
+                                 t_max=10, figsize=(14, 6), guardar=None, **parametros):
+    """
+    Compara metodos numericos sobre una familia del registro de modelos.
+
+    La referencia es ModeloCrecimiento: usa la solucion cerrada si la familia
+    la declara y, si no, RK4 con un paso 10 veces menor que el menor de
+    pasos. A la izquierda se grafican las soluciones y a la derecha el
+    error absoluto contra la referencia.
+
+    Parametros:
+    -----------
+    familia : str
+        Clave de la familia ('tumor', 'gompertz', 'logistica', ...)
+    P0 : float
+        Poblacion inicial
+    pasos : tuple, opcional
+        Tamanos de paso a comparar (default: (0.5, 0.1))
+    metodos : tuple, opcional
+        Clases con paso estatico (default: (ModeloTumorEuler, ModeloTumorRK4))
+    t_max : float, opcional
+        Tiempo maximo de simulacion (default: 10)
+    figsize : tuple, opcional
+        Tamano de la figura (ancho, alto) en pulgadas (default: (14, 6))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+    **parametros :
+        Parametros de la familia
+
+    Retorna:
+    --------
+    tuple : (fig, (ax_solucion, ax_error))
+        Objetos Figure y Axes de matplotlib
+    """
+    fig, (ax_sol, ax_err) = plt.subplots(1, 2, figsize=figsize)
+
+    t = np.linspace(0, t_max, 500)
+
+    # Referencia: ruta cerrada si existe, numerica fina si no
+    referencia = ModeloCrecimiento(familia, P0, h=min(pasos) / 10, t_max=t_max, **parametros)
+    P_ref = referencia.resolver(t)
+    ax_sol.plot(t, P_ref, 'k-', linewidth=3, alpha=0.8, label=referencia.nombre)
+
+    estilos = ['--', '-.', ':']
+    for metodo in metodos:
+        for j, h in enumerate(pasos):
+            modelo = ModeloCrecimiento(familia, P0, metodo_numerico=metodo, h=h, t_max=t_max, **parametros)
+            P = modelo.resolver(t)
+            linea, = ax_sol.plot(t, P, linestyle=estilos[j % len(estilos)], linewidth=2,
+                                 label=modelo.nombre)
+            ax_err.semilogy(t[1:], np.abs(P - P_ref)[1:], linestyle=estilos[j % len(estilos)],
+                            linewidth=2, color=linea.get_color(), label=modelo.nombre)
+
+    ax_sol.set_xlabel('Tiempo t', fontsize=14)
+    ax_sol.set_ylabel('Poblacion P(t)', fontsize=14)
+    ax_sol.set_title(f'{familia.capitalize()}: {obtener_familia(familia)["ecuacion"]}',
+                     fontsize=14, fontweight='bold')
+    ax_sol.grid(True, alpha=0.3)
+    ax_sol.legend(fontsize=10, loc='lower right')
+    ax_sol.set_xlim(0, t_max)
+
+    ax_err.set_xlabel('Tiempo t', fontsize=14)
+    ax_err.set_ylabel('|P - P_referencia|', fontsize=14)
+    ax_err.set_title(f'Error contra {referencia.nombre}', fontsize=14, fontweight='bold')
+    ax_err.grid(True, which='both', alpha=0.3)
+    ax_err.legend(fontsize=10)
+    ax_err.set_xlim(0, t_max)
+
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, (ax_sol, ax_err)
+
+
 if __name__ == '__main__':
+    from Cache_Resultados import cache_por_defecto
+
     print("="*70)
     print("COMPARACION DE SOLUCIONES - MODELO DE TUMOR")
     print("="*70)
@@ -199,10 +282,12 @@ if __name__ == '__main__':
     print(f"Tamaño de paso: h_Euler={h_euler}, h_RK4={h_rk4}\n")
 
     # Crear lista de modelos (¡todos heredan de ModeloTumorBase!)
+    # Las trayectorias numericas se leen del cache en disco si ya existen
+    cache = cache_por_defecto()
     modelos = [
         ModeloTumorAnalitico(P0, beta0, alpha),
-        ModeloTumorEuler(P0, beta0, alpha, h=h_euler, t_max=10.0),
-        ModeloTumorRK4(P0, beta0, alpha, h=h_rk4, t_max=10.0)
+        cache.modelo(ModeloTumorEuler, P0, beta0, alpha, h=h_euler, t_max=10.0),
+        cache.modelo(ModeloTumorRK4, P0, beta0, alpha, h=h_rk4, t_max=10.0)
     ]
 
     print("Modelos a comparar:")
@@ -217,7 +302,23 @@ if __name__ == '__main__':
     )
 
     # =========================================================================
-    # 3. Mostrar ambos graficos
+    # 3. Benchmark logistico de la Tarea 2.7 (solucion cerrada del registro)
+    # =========================================================================
+    print("\n3. Benchmark Logistico dP/dt = kP(M-P)")
+    print("-"*70)
+
+    print("Generando grafico de la familia logistica...")
+    fig3, ax3 = graficar_comparacion_familia(
+        'logistica',
+        P0=100,
+        k=0.0005,
+        M=1000.0,
+        t_max=10,
+        guardar='comparacion_logistica.png'
+    )
+
+    # =========================================================================
+    # 4. Mostrar los graficos
     # =========================================================================
     print("\n" + "="*70)
     print("Mostrando graficos...")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diagrama de Trabajo-Precision (Tarea 2.6: precision vs costo)
+
+Para cada metodo registrado se barre su parametro de precision (el paso h
+de los metodos de paso fijo o rtol de los adaptativos de SciPy) y se mide:
+- error relativo maximo contra ModeloTumorAnalitico en t = k * t_max / 10,
+  k = 0..10 (nodos de todas las mallas: h = t_max / n con n multiplo de 10,
+  de modo que no se mezcla el error de interpolacion)
+- costo: evaluaciones de f y tiempo de pared (minimo de varias repeticiones)
+
+El resultado es el diagrama error vs costo, una tabla, y
+solver_mas_barato(), que responde que metodo y parametro alcanzan una
+precision dada con el menor costo.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorExponencial import ModeloTumorExponencial
+from ModeloTumorScipy import ModeloTumorScipy
+
+
+# nombre -> dict con 'clase', 'parametro' ('h' o 'rtol'), 'valores' y 'kwargs'.
+# Para 'h' los valores son numeros de pasos n (h = t_max / n).
+METODOS = {}
+
+
+def registrar_metodo(nombre, clase, parametro, valores, **kwargs):
+    """
+    Agrega un metodo al barrido de trabajo-precision.
+
+    Parametros:
+    -----------
+    nombre : str
+        Nombre del metodo en tablas y leyendas
+    clase : type
+        Subclase de ModeloTumorBase con constructor (P0, beta0, alpha, ...)
+    parametro : str
+        'h' (se barre el numero de pasos n, h = t_max / n) o el nombre de
+        una tolerancia del constructor, p. ej. 'rtol'
+    valores : array_like
+        Numeros de pasos (para 'h') o tolerancias a barrer
+    **kwargs :
+        Argumentos fijos del constructor (p. ej. metodo='DOP853')
+    """
+    if parametro == 'h' and any(int(n) != n or n % 10 for n in valores):
+        raise ValueError("para 'h' los valores deben ser numeros de pasos multiplos de 10")
+    METODOS[nombre] = {'clase': clase, 'parametro': parametro,
+                       'valores': list(valores), 'kwargs': kwargs}
+
+
+_pasos_base = 10 * 2**np.arange(8)
+registrar_metodo('Euler', ModeloTumorEuler, 'h', 10 * 2**np.arange(3, 13))
+registrar_metodo('RK4', ModeloTumorRK4, 'h', _pasos_base)
+registrar_metodo('ABM4-PEC', ModeloTumorABM4, 'h', _pasos_base[1:], modo='PEC')
+registrar_metodo('Exponencial (Gauss 2)', ModeloTumorExponencial, 'h', _pasos_base, nodos_gauss=2)
+for _metodo in ('RK45', 'DOP853', 'LSODA'):
+    registrar_metodo(f'SciPy {_metodo}', ModeloTumorScipy, 'rtol', np.logspace(-3, -12, 10),
+                     metodo=_metodo, atol=1e-14)
+
+
+def barrido_trabajo_precision(P0, beta0, alpha, t_max=10.0, metodos=None, repeticiones=5):
+    """
+    Mide error y costo de cada metodo en todo su barrido.
+
+    Parametros:
+    -----------
+    P0, beta0, alpha : float
+        Parametros del modelo
+    t_max : float, opcional
+        Tiempo maximo de integracion (default: 10.0)
+    metodos : list of str, opcional
+        Nombres de METODOS a incluir (default: todos)
+    repeticiones : int, opcional
+        Construcciones por punto; se reporta el menor tiempo (default: 5)
+
+    Retorna:
+    --------
+    list of dict : Una fila por (metodo, valor) con claves 'metodo',
+                   'parametro', 'valor', 'error', 'pasos', 'evaluaciones_f'
+                   y 'tiempo_s'
+    """
+    metodos = list(METODOS) if metodos is None else metodos
+    # Nodos comunes a todas las mallas h = t_max / n (n multiplo de 10)
+    t_eval = t_max / 10 * np.arange(11)
+    P_exacta = ModeloTumorAnalitico(P0, beta0, alpha).resolver(t_eval)
+
+    resultados = []
+    for nombre in metodos:
+        entrada = METODOS[nombre]
+        for valor in entrada['valores']:
+            if entrada['parametro'] == 'h':
+                argumentos = {'h': t_max / valor, 't_max': t_max}
+            else:
+                argumentos = {entrada['parametro']: valor, 't_max': t_max}
+            argumentos.update(entrada['kwargs'])
+
+            # Tiempo de pared: el minimo de varias construcciones (como timeit)
+            tiempos = []
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                modelo = entrada['clase'](P0, beta0, alpha, **argumentos)
+                tiempos.append(time.perf_counter() - inicio)
+
+            stats = modelo.estadisticas_trabajo()
+            resultados.append({
+                'metodo': nombre,
+                'parametro': entrada['parametro'],
+                'valor': t_max / valor if entrada['parametro'] == 'h' else valor,
+                'error': np.max(np.abs(modelo.resolver(t_eval) / P_exacta - 1)),
+                'pasos': stats['pasos'],
+                'evaluaciones_f': stats['evaluaciones_f'],
+                'tiempo_s': min(tiempos),
+            })
+
+    return resultados
+
+
+def tabla_trabajo_precision(resultados):
+    """
+    Formatea los resultados del barrido como tabla de texto.
+
+    Parametros:
+    -----------
+    resultados : list of dict
+        Salida de barrido_trabajo_precision
+
+    Retorna:
+    --------
+    str : Tabla con una fila por punto del barrido
+    """
+    lineas = [f"{'Metodo':<22} {'Parametro':>14} {'Error rel.':>11} {'Pasos':>7} "
+              f"{'Eval. f':>8} {'Tiempo (ms)':>12}",
+              '-' * 79]
+    for fila in resultados:
+        parametro = f"{fila['parametro']}={fila['valor']:.3g}"
+        lineas.append(f"{fila['metodo']:<22} {parametro:>14} {fila['error']:11.2e} {fila['pasos']:7d} "
+                      f"{fila['evaluaciones_f']:8d} {fila['tiempo_s'] * 1000:12.3f}")
+    return '\n'.join(lineas)
+
+
+def solver_mas_barato(resultados, tol, costo='evaluaciones_f'):
+    """
+    Punto del barrido de menor costo con error <= tol.
+
+    Parametros:
+    -----------
+    resultados : list of dict
+        Salida de barrido_trabajo_precision
+    tol : float
+        Error relativo maximo aceptado
+    costo : str, opcional
+        'evaluaciones_f' o 'tiempo_s' (default: 'evaluaciones_f')
+
+    Retorna:
+    --------
+    dict or None : Fila ganadora (None si ningun punto alcanza tol)
+    """
+    validos = [fila for fila in resultados if fila['error'] <= tol]
+    return min(validos, key=lambda fila: fila[costo]) if validos else None
+
+
+def graficar_trabajo_precision(resultados, figsize=(15, 6), guardar=None):
+    """
+    Diagrama de trabajo-precision: error vs evaluaciones de f y vs tiempo.
+
+    Parametros:
+    -----------
+    resultados : list of dict
+        Salida de barrido_trabajo_precision
+    figsize : tuple, opcional
+        Tamano de la figura (ancho, alto) en pulgadas (default: (15, 6))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+
+    Retorna:
+    --------
+    tuple : (fig, (ax_evaluaciones, ax_tiempo))
+    """
+    fig, (ax_eval, ax_tiempo) = plt.subplots(1, 2, figsize=figsize)
+
+    marcadores = ['o', 's', '^', 'D', 'v', 'P', 'X', '*']
+    nombres = list(dict.fromkeys(fila['metodo'] for fila in resultados))
+    for i, nombre in enumerate(nombres):
+        filas = [fila for fila in resultados if fila['metodo'] == nombre]
+        # Errores en el redondeo se dibujan en 1e-16 para la escala log
+        error = np.maximum([fila['error'] for fila in filas], 1e-16)
+        estilo = {'marker': marcadores[i % len(marcadores)], 'linewidth': 2, 'markersize': 7,
+                  'label': nombre}
+        ax_eval.loglog([fila['evaluaciones_f'] for fila in filas], error, **estilo)
+        ax_tiempo.loglog([fila['tiempo_s'] for fila in filas], error, **estilo)
+
+    ax_eval.set_xlabel('Evaluaciones de f', fontsize=14)
+    ax_tiempo.set_xlabel('Tiempo de pared (s)', fontsize=14)
+    for ax, titulo in [(ax_eval, 'Error vs Evaluaciones de f'), (ax_tiempo, 'Error vs Tiempo')]:
+        ax.set_ylabel('Error relativo maximo', fontsize=14)
+        ax.set_title(titulo, fontsize=16, fontweight='bold')
+        ax.grid(True, which='both', alpha=0.3)
+    ax_eval.legend(fontsize=10)
+
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, (ax_eval, ax_tiempo)
+
+
+if __name__ == '__main__':
+    print("=== Diagrama de Trabajo-Precision ===\n")
+
+    resultados = barrido_trabajo_precision(P0=100, beta0=2.0, alpha=0.5, t_max=10.0)
+    print(tabla_trabajo_precision(resultados))
+
+    print("\nMetodo mas barato para cada precision:")
+    for tol in [1e-3, 1e-6, 1e-9]:
+        por_evaluaciones = solver_mas_barato(resultados, tol)
+        por_tiempo = solver_mas_barato(resultados, tol, costo='tiempo_s')
+        print(f"  tol={tol:.0e}: por evaluaciones {por_evaluaciones['metodo']} "
+              f"({por_evaluaciones['parametro']}={por_evaluaciones['valor']:.3g}, "
+              f"{por_evaluaciones['evaluaciones_f']} eval.), "
+              f"por tiempo {por_tiempo['metodo']} ({por_tiempo['tiempo_s'] * 1000:.3f} ms)")
+
+    graficar_trabajo_precision(resultados, guardar='trabajo_precision.png')
+    plt.show()
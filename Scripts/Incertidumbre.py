@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Propagacion de Incertidumbre con Quasi-Monte Carlo
+
+Propaga la incertidumbre de (P0, beta0, alpha) a P(t) muestreando los
+parametros con secuencias de Sobol (con scrambling) o hipercubo latino, y
+evaluando la formula cerrada de ModeloTumorAnalitico por bloques con
+broadcasting: un bloque de B muestras y T tiempos es una sola evaluacion
+de forma (B, T), sin construir un modelo por muestra.
+
+Media y varianza por punto de tiempo se acumulan con Welford/Chan y los
+cuantiles con P^2 o con un histograma de rango exacto, de modo que la
+memoria no depende del numero de muestras.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import itertools
+import numpy as np
+from scipy.stats import norm, qmc
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Estadisticas_En_Linea import AcumuladorMomentos, HistogramaCuantiles, CuantilP2
+
+
+PARAMETROS = ('P0', 'beta0', 'alpha')
+
+
+def _transformar(u, especificacion):
+    """
+    Lleva muestras uniformes u en (0, 1) a la distribucion especificada.
+
+    Especificaciones validas:
+        valor                     -> parametro fijo
+        ('uniforme', a, b)        -> U(a, b)
+        ('normal', media, desv)   -> N(media, desv^2)
+        ('lognormal', mu, s)      -> exp(N(mu, s^2))
+    """
+    if np.isscalar(especificacion):
+        return np.full_like(u, float(especificacion))
+
+    tipo, a, b = especificacion
+    if tipo == 'uniforme':
+        return a + (b - a) * u
+    if tipo == 'normal':
+        return a + b * norm.ppf(u)
+    if tipo == 'lognormal':
+        return np.exp(a + b * norm.ppf(u))
+    raise ValueError(f"Distribucion desconocida: '{tipo}'")
+
+
+def _rango(especificacion, desviaciones=8.0):
+    """Intervalo que contiene (practicamente) todo el soporte muestreado."""
+    if np.isscalar(especificacion):
+        return float(especificacion), float(especificacion)
+
+    tipo, a, b = especificacion
+    if tipo == 'uniforme':
+        return a, b
+    if tipo == 'normal':
+        return a - desviaciones * b, a + desviaciones * b
+    return np.exp(a - desviaciones * b), np.exp(a + desviaciones * b)
+
+
+def rango_solucion(distribuciones, t):
+    """
+    Cota exacta de P(t) sobre la caja de parametros.
+
+    log P = log P0 + beta0 * g(alpha, t), con g monotona en alpha, asi que los
+    extremos de P sobre una caja de parametros estan en sus 8 esquinas.
+
+    Parametros:
+    -----------
+    distribuciones : dict
+        Especificacion por parametro (ver propagar_incertidumbre)
+    t : array_like
+        Tiempos, forma (T,)
+
+    Retorna:
+    --------
+    tuple : (P_min, P_max), arrays de forma (T,)
+    """
+    rangos = [_rango(distribuciones[nombre]) for nombre in PARAMETROS]
+    esquinas = np.array(list(itertools.product(*rangos)))
+    modelo = ModeloTumorAnalitico(esquinas[:, 0:1], esquinas[:, 1:2], esquinas[:, 2:3])
+    P = modelo.resolver(np.asarray(t)[None, :])
+    return P.min(axis=0), P.max(axis=0)
+
+
+def generar_muestras(distribuciones, n, muestreo='sobol', semilla=None):
+    """
+    Genera un iterador de bloques de muestras de (P0, beta0, alpha).
+
+    Parametros:
+    -----------
+    distribuciones : dict
+        Especificacion por parametro (ver propagar_incertidumbre)
+    n : int
+        Tamano de cada bloque (potencia de 2 para Sobol)
+    muestreo : str, opcional
+        'sobol', 'lhs' o 'aleatorio' (default: 'sobol')
+    semilla : int, opcional
+        Semilla del generador
+
+    Retorna:
+    --------
+    generator : Bloques de forma (n, 3)
+    """
+    if muestreo == 'sobol':
+        # Bloques consecutivos de la misma secuencia: conservan el balance
+        motor = qmc.Sobol(d=3, scramble=True, seed=semilla)
+        siguiente = lambda: motor.random(n)
+    elif muestreo == 'lhs':
+        # Cada bloque es un hipercubo latino independiente
+        motor = qmc.LatinHypercube(d=3, seed=semilla)
+        siguiente = lambda: motor.random(n)
+    elif muestreo == 'aleatorio':
+        rng = np.random.default_rng(semilla)
+        siguiente = lambda: rng.random((n, 3))
+    else:
+        raise ValueError("muestreo debe ser 'sobol', 'lhs' o 'aleatorio'")
+
+    eps = np.finfo(float).eps
+    while True:
+        u = np.clip(siguiente(), eps, 1 - eps)
+        yield np.column_stack([_transformar(u[:, j], distribuciones[nombre])
+                               for j, nombre in enumerate(PARAMETROS)])
+
+
+def propagar_incertidumbre(distribuciones, t, n_muestras=2**16, muestreo='sobol',
+                           tam_bloque=2**12, niveles=(0.05, 0.5, 0.95),
+                           metodo_cuantiles='histograma', n_bins=4096, semilla=None):
+    """
+    Propaga la incertidumbre de los parametros a P(t) en una pasada.
+
+    Parametros:
+    -----------
+    distribuciones : dict
+        Especificacion para 'P0', 'beta0' y 'alpha': un valor fijo o una
+        tupla ('uniforme', a, b), ('normal', media, desv) o
+        ('lognormal', mu, s). Ejemplo:
+        {'P0': 100, 'beta0': ('uniforme', 1.5, 2.5), 'alpha': ('normal', 0.5, 0.05)}
+    t : array_like
+        Tiempos de salida, forma (T,)
+    n_muestras : int, opcional
+        Numero total de muestras; se redondea a multiplo de tam_bloque
+        (default: 2**16)
+    muestreo : str, opcional
+        'sobol', 'lhs' o 'aleatorio' (default: 'sobol')
+    tam_bloque : int, opcional
+        Muestras evaluadas por broadcast a la vez (default: 2**12)
+    niveles : sequence, opcional
+        Niveles de cuantiles (default: (0.05, 0.5, 0.95))
+    metodo_cuantiles : str, opcional
+        'histograma' (bins logaritmicos sobre el rango exacto de P(t), rapido)
+        o 'p2' (estimador P^2, procesa muestra a muestra) (default: 'histograma')
+    n_bins : int, opcional
+        Bins del histograma por punto de tiempo (default: 4096)
+    semilla : int, opcional
+        Semilla del muestreo
+
+    Retorna:
+    --------
+    dict : Con claves 't', 'media', 'varianza', 'niveles', 'cuantiles'
+           (forma (Q, T)) y 'n_muestras'
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    n_bloques = max(1, int(np.ceil(n_muestras / tam_bloque)))
+
+    momentos = AcumuladorMomentos(t.size)
+    if metodo_cuantiles == 'histograma':
+        P_min, P_max = rango_solucion(distribuciones, t)
+        margen = 1e-9 + 1e-6 * (np.log(P_max) - np.log(P_min))
+        estimador = HistogramaCuantiles(np.log(P_min) - margen, np.log(P_max) + margen,
+                                        n_bins=n_bins, escala='log')
+    elif metodo_cuantiles == 'p2':
+        estimador = CuantilP2(niveles, t.size)
+    else:
+        raise ValueError("metodo_cuantiles debe ser 'histograma' o 'p2'")
+
+    bloques = generar_muestras(distribuciones, tam_bloque, muestreo, semilla)
+    for _ in range(n_bloques):
+        theta = next(bloques)
+
+        # Una evaluacion broadcast (B, 1) x (T,) -> (B, T)
+        modelo = ModeloTumorAnalitico(theta[:, 0:1], theta[:, 1:2], theta[:, 2:3])
+        P = modelo.resolver(t)
+
+        momentos.actualizar(P)
+        estimador.actualizar(P)
+
+    cuantiles = (estimador.cuantiles(niveles) if metodo_cuantiles == 'histograma'
+                 else estimador.cuantiles())
+
+    return {
+        't': t,
+        'media': momentos.media,
+        'varianza': momentos.varianza(),
+        'niveles': np.asarray(niveles),
+        'cuantiles': cuantiles,
+        'n_muestras': momentos.n,
+    }
+
+
+if __name__ == '__main__':
+    import time
+
+    print("=== Propagacion de Incertidumbre (Quasi-Monte Carlo) ===\n")
+
+    distribuciones = {
+        'P0': 100.0,
+        'beta0': ('uniforme', 1.5, 2.5),
+        'alpha': ('normal', 0.5, 0.05),
+    }
+    t = np.linspace(0, 10, 101)
+
+    for muestreo in ['aleatorio', 'lhs', 'sobol']:
+        inicio = time.perf_counter()
+        res = propagar_incertidumbre(distribuciones, t, n_muestras=2**20, muestreo=muestreo, semilla=7)
+        duracion = time.perf_counter() - inicio
+        print(f"{muestreo:>10}: {res['n_muestras']} muestras en {duracion:.2f} s | "
+              f"E[P(10)] = {res['media'][-1]:.4f} | "
+              f"IC 90% P(10) = [{res['cuantiles'][0, -1]:.1f}, {res['cuantiles'][2, -1]:.1f}]")
+
+    # Convergencia de la media: Sobol vs aleatorio contra una referencia grande
+    referencia = propagar_incertidumbre(distribuciones, t[-1:], n_muestras=2**22, semilla=0)['media'][0]
+    print(f"\nError de E[P(10)] vs referencia ({referencia:.4f}):")
+    print(f"{'N':>8} {'Aleatorio':>12} {'Sobol':>12}")
+    for n in [2**10, 2**12, 2**14]:
+        errores = [abs(propagar_incertidumbre(distribuciones, t[-1:], n_muestras=n, tam_bloque=n,
+                                              muestreo=m, semilla=3)['media'][0] - referencia)
+                   for m in ['aleatorio', 'sobol']]
+        print(f"{n:8d} {errores[0]:12.4e} {errores[1]:12.4e}")
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inferencia Bayesiana de (P0, beta0, alpha) con MCMC por Ensamble
+
+Modelo estadistico (ruido multiplicativo):
+    log P_obs(t_j) = log P(t_j; P0, beta0, alpha) + N(0, sigma^2)
+con prior uniforme sobre una caja de parametros.
+
+Muestreador: "stretch move" de Goodman-Weare (el de emcee). Cada cadena
+es un ensamble de W caminantes; en cada medio paso la mitad de los
+caminantes propone
+    X' = X_j + z (X_k - X_j),   z ~ g(z) proporcional a 1/sqrt(z) en [1/a, a]
+usando la otra mitad, y se acepta con probabilidad min(1, z^(d-1) p(X')/p(X_k)).
+La verosimilitud de todos los caminantes es una sola evaluacion por
+broadcasting de ModeloTumorAnalitico.resolver_log, de forma (W, M).
+
+Las cadenas independientes corren en procesos separados (cada una con su
+flujo aleatorio de SeedSequence.spawn) y guardan puntos de control .npz
+para poder reanudar. Diagnosticos: R-hat (dividido) y tamano efectivo de
+muestra con el tiempo de autocorrelacion integrado.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Ajuste_Parametros import ajustar_lote
+from Cache_Resultados import guardar_atomico
+
+
+PARAMETROS = ('P0', 'beta0', 'alpha')
+
+
+def log_posterior(theta, t, log_P_obs, pesos, sigma, limites):
+    """
+    Log-posterior (salvo constante) para un lote de parametros.
+
+    Parametros:
+    -----------
+    theta : array_like
+        Parametros, forma (W, 3) con columnas (P0, beta0, alpha)
+    t : array_like
+        Tiempos de medicion, forma (M,)
+    log_P_obs : array_like
+        log de las mediciones, forma (M,) (valores de relleno donde pesos=False)
+    pesos : array_like
+        Mascara booleana de mediciones validas, forma (M,)
+    sigma : float
+        Desviacion del ruido en escala logaritmica
+    limites : array_like
+        Caja del prior uniforme, forma (3, 2)
+
+    Retorna:
+    --------
+    array : log p(theta | datos), forma (W,) (-inf fuera del prior)
+    """
+    theta = np.atleast_2d(theta)
+    dentro = np.all((theta >= limites[:, 0]) & (theta <= limites[:, 1]), axis=1)
+
+    log_p = np.full(theta.shape[0], -np.inf)
+    if dentro.any():
+        th = theta[dentro]
+        modelo = ModeloTumorAnalitico(th[:, 0:1], th[:, 1:2], th[:, 2:3])
+        residuos = np.where(pesos, log_P_obs - modelo.resolver_log(t), 0.0)
+        log_p[dentro] = -0.5 * np.sum(residuos**2, axis=1) / sigma**2
+    return log_p
+
+
+def _clave_configuracion(inicial, t, log_P_obs, pesos, sigma, caja, a, semilla):
+    """
+    Hash SHA-256 de todo lo que determina una cadena salvo n_pasos.
+
+    Un punto de control solo se reanuda si su clave coincide; n_pasos queda
+    fuera para poder extender (o recortar) una corrida guardada.
+    """
+    descripcion = json.dumps({
+        'sigma': float(sigma).hex(),
+        'a': float(a).hex(),
+        'semilla': [str(semilla.entropy), list(semilla.spawn_key)],
+        'formas': [list(x.shape) for x in (inicial, t, log_P_obs)],
+    })
+    resumen = hashlib.sha256(descripcion.encode())
+    for datos in (inicial, t, log_P_obs, pesos, caja):
+        resumen.update(np.ascontiguousarray(datos).tobytes())
+    return resumen.hexdigest()
+
+
+def _ejecutar_cadena(argumentos):
+    """
+    Ejecuta (o reanuda) una cadena de ensamble con stretch move.
+
+    Es una funcion de modulo para poder ejecutarse en un proceso hijo.
+
+    Retorna:
+    --------
+    tuple : (cadena, log_prob, aceptados) con formas (n_pasos, W, 3),
+            (n_pasos, W) y (W,)
+    """
+    (inicial, t, log_P_obs, pesos, sigma, limites, n_pasos, a,
+     semilla, ruta_control, cada) = argumentos
+
+    W, d = inicial.shape
+    cadena = np.empty((n_pasos, W, d))
+    log_prob = np.empty((n_pasos, W))
+    # Aceptaciones acumuladas por paso: permiten recortar una corrida mas larga
+    acumulados = np.zeros((n_pasos, W))
+    aceptados = np.zeros(W)
+    rng = np.random.default_rng(semilla)
+    paso_inicial = 0
+    X = inicial.copy()
+
+    # Reanudar desde el punto de control si existe y es de la misma configuracion
+    if ruta_control is not None:
+        configuracion = _clave_configuracion(inicial, t, log_P_obs, pesos, sigma, limites, a, semilla)
+    if ruta_control is not None and os.path.exists(ruta_control):
+        with np.load(ruta_control, allow_pickle=False) as datos:
+            if 'configuracion' not in datos.files or str(datos['configuracion']) != configuracion:
+                raise ValueError(f"El punto de control {ruta_control} es de otra configuracion "
+                                 "(datos, sigma, limites, caminantes o semilla); use otro "
+                                 "directorio_control o borre el archivo")
+            # Una corrida guardada mas larga se recorta a n_pasos sin continuar
+            paso_inicial = min(int(datos['paso']), n_pasos)
+            cadena[:paso_inicial] = datos['cadena'][:paso_inicial]
+            log_prob[:paso_inicial] = datos['log_prob'][:paso_inicial]
+            acumulados[:paso_inicial] = datos['aceptados'][:paso_inicial]
+            rng.bit_generator.state = json.loads(str(datos['estado_rng']))
+        if paso_inicial > 0:
+            X = cadena[paso_inicial - 1].copy()
+            aceptados = acumulados[paso_inicial - 1].copy()
+
+    lp = log_posterior(X, t, log_P_obs, pesos, sigma, limites)
+    mitades = [np.arange(0, W, 2), np.arange(1, W, 2)]
+
+    for paso in range(paso_inicial, n_pasos):
+        for s in range(2):
+            activos, complemento = mitades[s], mitades[1 - s]
+            n = len(activos)
+
+            # z con densidad proporcional a 1/sqrt(z) en [1/a, a]
+            z = ((a - 1) * rng.random(n) + 1)**2 / a
+            socios = X[complemento[rng.integers(len(complemento), size=n)]]
+            propuesta = socios + z[:, None] * (X[activos] - socios)
+
+            lp_prop = log_posterior(propuesta, t, log_P_obs, pesos, sigma, limites)
+            with np.errstate(invalid='ignore'):
+                log_acepta = (d - 1) * np.log(z) + lp_prop - lp[activos]
+            acepta = np.log(rng.random(n)) < log_acepta
+
+            X[activos[acepta]] = propuesta[acepta]
+            lp[activos[acepta]] = lp_prop[acepta]
+            aceptados[activos] += acepta
+
+        cadena[paso] = X
+        log_prob[paso] = lp
+        acumulados[paso] = aceptados
+
+        if ruta_control is not None and ((paso + 1) % cada == 0 or paso + 1 == n_pasos):
+            guardar_atomico(ruta_control, cadena=cadena[:paso + 1], log_prob=log_prob[:paso + 1],
+                            aceptados=acumulados[:paso + 1], paso=paso + 1,
+                            estado_rng=json.dumps(rng.bit_generator.state),
+                            configuracion=configuracion)
+
+    return cadena, log_prob, aceptados
+
+
+def _autocorrelacion(x):
+    """Autocorrelacion normalizada por FFT a lo largo del eje 0."""
+    n = x.shape[0]
+    x = x - x.mean(axis=0)
+    m = 2**int(np.ceil(np.log2(2 * n)))
+    F = np.fft.rfft(x, n=m, axis=0)
+    acf = np.fft.irfft(F * np.conj(F), n=m, axis=0)[:n]
+    return acf / acf[0]
+
+
+def tiempo_autocorrelacion(cadenas, c=5.0):
+    """
+    Tiempo de autocorrelacion integrado por parametro.
+
+    Se promedia la autocorrelacion de todos los caminantes y se suma con la
+    ventana automatica de Sokal (M >= c * tau).
+
+    Parametros:
+    -----------
+    cadenas : array_like
+        Muestras, forma (n_pasos, n_caminantes, d)
+    c : float, opcional
+        Constante de la ventana (default: 5.0)
+
+    Retorna:
+    --------
+    array : tau, forma (d,)
+    """
+    cadenas = np.asarray(cadenas)
+    tau = np.empty(cadenas.shape[-1])
+    for j in range(cadenas.shape[-1]):
+        rho = np.nanmean(_autocorrelacion(cadenas[:, :, j]), axis=1)
+        taus = 2.0 * np.cumsum(rho) - 1.0
+        ventana = np.arange(len(taus)) < c * taus
+        M = np.argmin(ventana) if not ventana.all() else len(taus) - 1
+        tau[j] = taus[M]
+    return tau
+
+
+def rhat(cadenas):
+    """
+    R-hat dividido de Gelman-Rubin por parametro.
+
+    Cada caminante de cada cadena cuenta como una secuencia y se divide en
+    dos mitades; valores cercanos a 1 (< 1.01) indican convergencia.
+
+    Parametros:
+    -----------
+    cadenas : array_like
+        Muestras, forma (n_pasos, n_secuencias, d)
+
+    Retorna:
+    --------
+    array : R-hat, forma (d,)
+    """
+    cadenas = np.asarray(cadenas)
+    n = cadenas.shape[0] // 2
+    secuencias = np.concatenate([cadenas[:n], cadenas[n:2 * n]], axis=1)
+
+    medias = secuencias.mean(axis=0)
+    B = n * medias.var(axis=0, ddof=1)
+    W = secuencias.var(axis=0, ddof=1).mean(axis=0)
+    var_post = (n - 1) / n * W + B / n
+    return np.sqrt(var_post / W)
+
+
+def muestrear_posterior(t, P_obs, n_cadenas=4, n_caminantes=32, n_pasos=2000, quemado=None,
+                        sigma=None, limites=None, a=2.0, n_procesos=1, semilla=None,
+                        directorio_control=None, cada=200):
+    """
+    Muestrea la posterior de (P0, beta0, alpha) dada una serie de mediciones.
+
+    Parametros:
+    -----------
+    t : array_like
+        Tiempos de medicion, forma (M,)
+    P_obs : array_like
+        Mediciones, forma (M,) (NaN para faltantes)
+    n_cadenas : int, opcional
+        Cadenas (ensambles) independientes (default: 4)
+    n_caminantes : int, opcional
+        Caminantes por ensamble, par (default: 32)
+    n_pasos : int, opcional
+        Pasos por cadena (default: 2000)
+    quemado : int, opcional
+        Pasos descartados al inicio (default: n_pasos // 4)
+    sigma : float, opcional
+        Desviacion del ruido en log(P) (default: la del ajuste de
+        maxima verosimilitud)
+    limites : dict, opcional
+        Prior uniforme por parametro, {'P0': (min, max), ...}
+        (default: cajas amplias alrededor del ajuste)
+    a : float, opcional
+        Parametro de escala del stretch move (default: 2.0)
+    n_procesos : int, opcional
+        Procesos; cada cadena corre en uno (default: 1)
+    semilla : int, opcional
+        Semilla raiz (default: None)
+    directorio_control : str, opcional
+        Directorio de puntos de control; si ya contiene uno de una corrida
+        con la misma configuracion (datos, sigma, limites, caminantes y
+        semilla, que debe ser fija) se reanuda, o se recorta si tenia mas
+        de n_pasos; si la configuracion difiere se lanza ValueError
+        (default: None)
+    cada : int, opcional
+        Pasos entre puntos de control (default: 200)
+
+    Retorna:
+    --------
+    dict : Con claves 'muestras' (S, 3) tras el quemado, 'cadenas'
+           (n_cadenas, n_pasos, W, 3), 'log_prob', 'aceptacion', 'rhat',
+           'tau', 'ess', 'sigma', 'map' e 'intervalos' (por parametro,
+           (q2.5, mediana, q97.5))
+    """
+    t = np.asarray(t, dtype=float)
+    P_obs = np.asarray(P_obs, dtype=float)
+    quemado = n_pasos // 4 if quemado is None else quemado
+    if n_caminantes % 2:
+        raise ValueError("n_caminantes debe ser par")
+
+    pesos = np.isfinite(P_obs) & (P_obs > 0)
+    log_P_obs = np.where(pesos, np.log(np.where(pesos, P_obs, 1.0)), 0.0)
+
+    # Punto de partida: ajuste de maxima verosimilitud en escala log
+    ajuste = ajustar_lote(t, P_obs[None, :], escala='log')
+    theta_mv = np.array([ajuste[nombre][0] for nombre in PARAMETROS])
+    if sigma is None:
+        sigma = np.sqrt(2 * ajuste['costo'][0] / max(1, pesos.sum() - 3))
+
+    if limites is None:
+        limites = {'P0': (0.0, 10 * theta_mv[0]),
+                   'beta0': (-10 * abs(theta_mv[1]), 10 * abs(theta_mv[1])),
+                   'alpha': (0.0, 10 * theta_mv[2])}
+    caja = np.array([limites[nombre] for nombre in PARAMETROS], dtype=float)
+
+    # Caminantes en una bola pequena alrededor del ajuste, uno por cadena
+    semillas = np.random.SeedSequence(semilla).spawn(n_cadenas + 1)
+    rng = np.random.default_rng(semillas[0])
+    iniciales = theta_mv * (1 + 1e-3 * rng.standard_normal((n_cadenas, n_caminantes, 3)))
+
+    if directorio_control is not None:
+        os.makedirs(directorio_control, exist_ok=True)
+    tareas = [(iniciales[c], t, log_P_obs, pesos, sigma, caja, n_pasos, a, semillas[c + 1],
+               None if directorio_control is None
+               else os.path.join(directorio_control, f"cadena_{c}.npz"), cada)
+              for c in range(n_cadenas)]
+
+    if n_procesos > 1:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            resultados = list(ejecutor.map(_ejecutar_cadena, tareas))
+    else:
+        resultados = [_ejecutar_cadena(tarea) for tarea in tareas]
+
+    cadenas = np.stack([r[0] for r in resultados])
+    log_prob = np.stack([r[1] for r in resultados])
+    aceptacion = np.stack([r[2] for r in resultados]) / n_pasos
+
+    # Diagnosticos sobre las muestras tras el quemado (caminantes de todas las cadenas)
+    posteriores = np.concatenate(list(cadenas[:, quemado:]), axis=1)
+    tau = tiempo_autocorrelacion(posteriores)
+    muestras = posteriores.reshape(-1, 3)
+    cuantiles = np.percentile(muestras, [2.5, 50, 97.5], axis=0)
+
+    indice_map = np.unravel_index(np.argmax(log_prob), log_prob.shape)
+
+    return {
+        'muestras': muestras,
+        'cadenas': cadenas,
+        'log_prob': log_prob,
+        'aceptacion': aceptacion.mean(),
+        'rhat': rhat(posteriores),
+        'tau': tau,
+        'ess': muestras.shape[0] / tau,
+        'sigma': sigma,
+        'map': cadenas[indice_map],
+        'intervalos': {nombre: tuple(cuantiles[:, j]) for j, nombre in enumerate(PARAMETROS)},
+    }
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    print("=== Inferencia Bayesiana con MCMC por Ensamble ===\n")
+
+    # Serie sintetica con ruido multiplicativo del 5%
+    rng = np.random.default_rng(1)
+    t = np.linspace(0, 8, 15)
+    verdad = (100.0, 2.0, 0.5)
+    P_obs = ModeloTumorAnalitico(*verdad).resolver(t) * np.exp(0.05 * rng.standard_normal(t.size))
+
+    inicio = time.perf_counter()
+    res = muestrear_posterior(t, P_obs, n_cadenas=4, n_caminantes=32, n_pasos=3000,
+                              n_procesos=min(4, os.cpu_count() or 1), semilla=7)
+    duracion = time.perf_counter() - inicio
+
+    print(f"Tiempo: {duracion:.2f} s | aceptacion media: {res['aceptacion']:.3f} | "
+          f"sigma: {res['sigma']:.4f}\n")
+    print(f"{'Param':>6} {'Real':>8} {'q2.5':>9} {'Mediana':>9} {'q97.5':>9} {'R-hat':>7} {'tau':>7} {'ESS':>8}")
+    print("-" * 70)
+    for j, nombre in enumerate(PARAMETROS):
+        q_inf, mediana, q_sup = res['intervalos'][nombre]
+        print(f"{nombre:>6} {verdad[j]:8.3f} {q_inf:9.3f} {mediana:9.3f} {q_sup:9.3f} "
+              f"{res['rhat'][j]:7.4f} {res['tau'][j]:7.1f} {res['ess'][j]:8.0f}")
+
+    # Punto de control: una corrida interrumpida se reanuda sin cambiar el resultado
+    with tempfile.TemporaryDirectory() as directorio:
+        completa = muestrear_posterior(t, P_obs, n_cadenas=1, n_pasos=400, semilla=3)
+        muestrear_posterior(t, P_obs, n_cadenas=1, n_pasos=200, semilla=3,
+                            directorio_control=directorio, cada=100)
+        reanudada = muestrear_posterior(t, P_obs, n_cadenas=1, n_pasos=400, semilla=3,
+                                        directorio_control=directorio, cada=100)
+        igual = np.array_equal(completa['cadenas'], reanudada['cadenas'])
+        print(f"\nReanudar desde punto de control reproduce la corrida completa: {igual}")
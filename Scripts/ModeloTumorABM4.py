@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor - Metodo Predictor-Corrector de Adams-Bashforth-Moulton
+
+Implementacion del metodo multipaso de orden 4 (ABM4) para resolver
+numericamente la EDO del modelo de tumor: dP/dt = beta_0 * e^(-alpha*t) * P
+
+Predictor (Adams-Bashforth de 4 pasos):
+P*_{n+1} = P_n + h/24 * (55 f_n - 59 f_{n-1} + 37 f_{n-2} - 9 f_{n-3})
+
+Corrector (Adams-Moulton de 3 pasos):
+P_{n+1} = P_n + h/24 * (9 f*_{n+1} + 19 f_n - 5 f_{n-1} + f_{n-2})
+
+Los tres primeros pasos se arrancan con RK4. Despues, el metodo reutiliza
+el historial de valores de f, asi que en modo PEC cuesta una sola
+evaluacion de f por paso (RK4 necesita cuatro). Ver Tarea 2.6 y
+Burden Cap. 5, Secc. 5.6.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase
+from Salida_Densa import interpolar_lineal
+
+
+class ModeloTumorABM4(ModeloTumorBase):
+    """
+    Resolucion numerica del modelo de tumor con Adams-Bashforth-Moulton de orden 4.
+
+    Modos de operacion:
+    -------------------
+    PEC  : Predecir, Evaluar f(t_{n+1}, P*), Corregir. El valor f* evaluado en
+           el predictor pasa al historial: 1 evaluacion de f por paso.
+    PECE : Igual, pero re-evalua f en el valor corregido: 2 evaluaciones por
+           paso, con una region de estabilidad algo mayor.
+
+    El error local se estima con la diferencia predictor-corrector (Milne):
+    e_{n+1} ~ 19/270 * |P_{n+1} - P*_{n+1}|
+
+    Error local de truncamiento: O(h^5)
+    Error global: O(h^4)
+
+    Atributos adicionales:
+    ---------------------
+    h : float
+        Tamano de paso (step size)
+    t_max : float
+        Tiempo maximo de integracion
+    modo : str
+        'PEC' o 'PECE'
+    error_local_max : float
+        Maxima estimacion de Milne del error local durante la integracion
+    """
+
+    orden = 4
+    nombre_metodo = 'ABM4'
+
+    def __init__(self, P0, beta0, alpha, h=0.01, t_max=10.0, modo='PEC'):
+        """
+        Inicializa el modelo con el metodo ABM4.
+
+        Parametros:
+        -----------
+        P0 : float
+            Poblacion inicial
+        beta0 : float
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float
+            Tasa de decrecimiento exponencial (alpha)
+        h : float, opcional
+            Tamano de paso (default: 0.01)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        modo : str, opcional
+            'PEC' (1 evaluacion de f por paso) o 'PECE' (2) (default: 'PEC')
+        """
+        if modo not in ('PEC', 'PECE'):
+            raise ValueError("modo debe ser 'PEC' o 'PECE'")
+
+        super().__init__(P0, beta0, alpha, nombre=f"ABM4-{modo} (h={h})")
+        self.h = h
+        self.t_max = t_max
+        self.modo = modo
+        self.error_local_max = 0.0
+
+        # Precalcular la solucion numerica
+        inicio = time.perf_counter()
+        self.t_vals, self.P_vals = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    def _integrar(self):
+        """
+        Integra la EDO con ABM4 desde t=0 hasta t=t_max.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones
+        """
+        h = self.h
+
+        # Crear malla temporal
+        t_vals = np.arange(0, self.t_max + h, h)
+        P_vals = np.zeros_like(t_vals)
+        f_vals = np.zeros_like(t_vals)
+        n = len(t_vals)
+        evaluaciones = 0
+
+        # Condicion inicial
+        P_vals[0] = self.P0
+
+        # Arranque con RK4: los primeros 3 pasos (o menos si la malla es corta)
+        n_arranque = min(3, n - 1)
+        for i in range(n_arranque):
+            t_n, P_n = t_vals[i], P_vals[i]
+
+            f_vals[i] = self.f(t_n, P_n)
+            k1 = h * f_vals[i]
+            k2 = h * self.f(t_n + h/2, P_n + k1/2)
+            k3 = h * self.f(t_n + h/2, P_n + k2/2)
+            k4 = h * self.f(t_n + h, P_n + k3)
+            evaluaciones += 4
+
+            P_vals[i + 1] = P_n + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+        f_vals[n_arranque] = self.f(t_vals[n_arranque], P_vals[n_arranque])
+        evaluaciones += 1
+
+        # Pasos multipaso: reutilizar el historial f_n, f_{n-1}, f_{n-2}, f_{n-3}
+        error_max = 0.0
+        for i in range(3, n - 1):
+            t_sig = t_vals[i + 1]
+
+            # Predictor (Adams-Bashforth 4)
+            P_pred = P_vals[i] + h / 24 * (55*f_vals[i] - 59*f_vals[i-1]
+                                           + 37*f_vals[i-2] - 9*f_vals[i-3])
+
+            # Evaluar en el valor predicho
+            f_pred = self.f(t_sig, P_pred)
+
+            # Corrector (Adams-Moulton 3)
+            P_vals[i + 1] = P_vals[i] + h / 24 * (9*f_pred + 19*f_vals[i]
+                                                  - 5*f_vals[i-1] + f_vals[i-2])
+
+            if self.modo == 'PECE':
+                f_vals[i + 1] = self.f(t_sig, P_vals[i + 1])
+                evaluaciones += 2
+            else:
+                f_vals[i + 1] = f_pred
+                evaluaciones += 1
+
+            error_max = max(error_max, abs(P_vals[i + 1] - P_pred))
+
+        self.error_local_max = 19 / 270 * error_max
+        self.pasos = n - 1
+        self.evaluaciones_f = evaluaciones
+
+        return t_vals, P_vals
+
+    def resolver(self, t):
+        """
+        Retorna la aproximacion numerica de P(t) usando ABM4.
+
+        Interpola linealmente entre los valores precalculados.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t) aproximado
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(t)
+
+        # Interpolar valores
+        P = interpolar_lineal(t, self.t_vals, self.P_vals)
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def obtener_trayectoria(self):
+        """
+        Retorna la trayectoria completa calculada por ABM4.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones
+        """
+        return self.t_vals, self.P_vals
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, beta0={self.beta0}, alpha={self.alpha}\n"
+                f"  h={self.h}, t_max={self.t_max}, modo={self.modo}\n"
+                f"  Puntos calculados: {len(self.t_vals)}\n"
+                f"  Evaluaciones de f: {self.evaluaciones_f}\n"
+                f"  Limite asintotico teorico: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorRK4 import ModeloTumorRK4
+
+    print("=== Adams-Bashforth-Moulton (ABM4) para Modelo de Tumor ===\n")
+
+    modelo = ModeloTumorABM4(P0=100, beta0=2.0, alpha=0.5, h=0.05)
+    print(modelo)
+    print()
+
+    modelo_analitico = ModeloTumorAnalitico(P0=100, beta0=2.0, alpha=0.5)
+    t_nodos = np.linspace(0, 10, 11)
+    P_exacto = modelo_analitico.resolver(t_nodos)
+
+    # Comparar costo vs precision con RK4
+    print(f"{'Metodo':<22} {'Error rel. max':>15} {'Evals f':>9} {'Evals/paso':>11} {'Tiempo (ms)':>12}")
+    print("-" * 73)
+    for h in [0.1, 0.05, 0.025]:
+        for mod in [ModeloTumorRK4(100, 2.0, 0.5, h=h),
+                    ModeloTumorABM4(100, 2.0, 0.5, h=h, modo='PEC'),
+                    ModeloTumorABM4(100, 2.0, 0.5, h=h, modo='PECE')]:
+            stats = mod.estadisticas_trabajo()
+            error = np.max(np.abs(mod.resolver(t_nodos) - P_exacto) / P_exacto)
+            print(f"{stats['metodo']:<22} {error:15.3e} {stats['evaluaciones_f']:9d} "
+                  f"{stats['evaluaciones_por_paso']:11.2f} {stats['tiempo_s']*1000:12.3f}")
+        print()
+
+    # Orden de convergencia observado
+    errores = []
+    h_vals = [0.1, 0.05, 0.025]
+    for h in h_vals:
+        mod = ModeloTumorABM4(100, 2.0, 0.5, h=h)
+        errores.append(np.max(np.abs(mod.resolver(t_nodos) - P_exacto)))
+    ordenes = np.log2(np.array(errores[:-1]) / np.array(errores[1:]))
+    print(f"Orden observado ABM4-PEC: {ordenes}")
@@ -14,6 +14,35 @@ Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
 
 from abc import ABC, abstractmethod
 import numpy as np
+from Salida_Densa import tiempos_cruce
+from Tolerancia import elegir_paso
+
+
+def metodo_de_un_paso(metodo_numerico):
+    """
+    Valida una clase pasada como metodo_numerico y retorna su paso y su costo.
+
+    Los modelos compuestos (por tramos, compartimentos, reaccion-difusion,
+    familias) integran con el paso estatico paso(f, t, y, h) de la clase y
+    cuentan evaluaciones_por_paso evaluaciones de f por paso. Los metodos
+    multipaso como ModeloTumorABM4 no tienen paso() y se rechazan.
+
+    Parametros:
+    -----------
+    metodo_numerico : type
+        Clase del metodo, p. ej. ModeloTumorEuler o ModeloTumorRK4
+
+    Retorna:
+    --------
+    tuple : (paso, evaluaciones_por_paso)
+    """
+    paso = getattr(metodo_numerico, 'paso', None)
+    evaluaciones = getattr(metodo_numerico, 'evaluaciones_por_paso', None)
+    if not callable(paso) or evaluaciones is None:
+        nombre = getattr(metodo_numerico, '__name__', repr(metodo_numerico))
+        raise ValueError(f"{nombre} no es un metodo de un paso: metodo_numerico debe definir "
+                         "paso(f, t, y, h) y evaluaciones_por_paso (p. ej. ModeloTumorRK4)")
+    return paso, evaluaciones
 
 
 class ModeloTumorBase(ABC):
@@ -39,8 +68,31 @@ class ModeloTumorBase(ABC):
         Tasa de decrecimiento exponencial (alpha)
     nombre : str
         Nombre descriptivo del metodo
+    pasos : int
+        Pasos de integracion realizados (0 para metodos sin malla)
+    evaluaciones_f : int
+        Evaluaciones del lado derecho f(t, P) usadas en la integracion
+    tiempo_integracion : float
+        Tiempo de pared (s) consumido por la integracion
+    salida_densa : str
+        Interpolante entre nodos usado por tiempo_umbral() en los metodos
+        numericos: 'hermite' (cubico con f en los nodos) o 'lineal'
+    orden : int or None
+        Orden global del metodo de paso fijo (None si no aplica); lo usa
+        con_tolerancia() para elegir h
+    evaluaciones_por_paso : int or None
+        Evaluaciones de f por paso de los metodos de un paso con paso()
+        estatico (None si la clase no se puede usar como metodo_numerico)
+    nombre_metodo : str or None
+        Nombre corto del metodo ('Euler', 'RK4', ...) que los modelos
+        compuestos muestran en su nombre
     """
 
+    salida_densa = 'hermite'
+    orden = None
+    evaluaciones_por_paso = None
+    nombre_metodo = None
+
     def __init__(self, P0, beta0, alpha, nombre="Modelo Base"):
         """
         Inicializa el modelo base con parametros comunes.
@@ -61,6 +113,11 @@ class ModeloTumorBase(ABC):
         self.alpha = alpha
         self.nombre = nombre
 
+        # Estadisticas de trabajo (las actualizan los metodos numericos)
+        self.pasos = 0
+        self.evaluaciones_f = 0
+        self.tiempo_integracion = 0.0
+
     def f(self, t, P):
         """
         Ecuacion diferencial del modelo: dP/dt = f(t, P)
@@ -83,6 +140,49 @@ class ModeloTumorBase(ABC):
         """
         return self.beta0 * np.exp(-self.alpha * t) * P
 
+    def f_aumentada(self, t, Y):
+        """
+        Lado derecho del sistema aumentado con las ecuaciones de sensibilidad.
+
+        Derivando dP/dt = r(t) P respecto a cada parametro (S_x = dP/dx):
+        dS_P0/dt    = r(t) S_P0
+        dS_beta0/dt = r(t) S_beta0 + e^(-alpha*t) P
+        dS_alpha/dt = r(t) S_alpha - beta_0 * t * e^(-alpha*t) P
+
+        Los metodos numericos lo integran en el mismo ciclo que P para
+        obtener las sensibilidades en una sola resolucion.
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        Y : array_like
+            Estado [P, S_P0, S_beta0, S_alpha] en el ultimo eje
+
+        Retorna:
+        --------
+        array : dY/dt con la misma forma que Y
+        """
+        E = np.exp(-self.alpha * t)
+        r = self.beta0 * E
+        P = Y[..., 0]
+        return np.stack([r * P,
+                         r * Y[..., 1],
+                         r * Y[..., 2] + E * P,
+                         r * Y[..., 3] - self.beta0 * t * E * P], axis=-1)
+
+    def estado_inicial_aumentado(self):
+        """
+        Condicion inicial del sistema aumentado: [P0, 1, 0, 0].
+
+        Retorna:
+        --------
+        array : Estado inicial [P, S_P0, S_beta0, S_alpha]
+        """
+        P0, beta0, alpha = np.broadcast_arrays(*(np.asarray(x, dtype=float)
+                                                 for x in (self.P0, self.beta0, self.alpha)))
+        return np.stack([P0, np.ones_like(P0), np.zeros_like(P0), np.zeros_like(P0)], axis=-1)
+
     @abstractmethod
     def resolver(self, t):
         """
@@ -104,6 +204,49 @@ class ModeloTumorBase(ABC):
         """
         pass
 
+    @classmethod
+    def con_tolerancia(cls, P0, beta0, alpha, tol, t_max=10.0, **kwargs):
+        """
+        Crea el modelo con el mayor h que cumple un error relativo objetivo.
+
+        El paso se elige con Tolerancia.elegir_paso (par piloto h, h/2 y
+        cota de interpolacion) y despues se resuelve una sola vez.
+
+        Parametros:
+        -----------
+        P0, beta0, alpha : float
+            Parametros del modelo
+        tol : float
+            Error relativo maximo deseado en [0, t_max]
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        **kwargs :
+            Argumentos adicionales del constructor (p. ej. modo='PECE')
+
+        Retorna:
+        --------
+        ModeloTumorBase : Instancia de la clase con el h elegido
+        """
+        h, _ = elegir_paso(cls, P0, beta0, alpha, tol, t_max, **kwargs)
+        return cls(P0, beta0, alpha, h=h, t_max=t_max, **kwargs)
+
+    def estadisticas_trabajo(self):
+        """
+        Retorna el costo de la integracion para comparar metodos.
+
+        Retorna:
+        --------
+        dict : Con claves 'metodo', 'pasos', 'evaluaciones_f',
+               'evaluaciones_por_paso' y 'tiempo_s'
+        """
+        return {
+            'metodo': self.nombre,
+            'pasos': self.pasos,
+            'evaluaciones_f': self.evaluaciones_f,
+            'evaluaciones_por_paso': self.evaluaciones_f / self.pasos if self.pasos else 0.0,
+            'tiempo_s': self.tiempo_integracion,
+        }
+
     def limite_asintotico(self):
         """
         Calcula el limite asintotico de la poblacion cuando t tiende a infinito.
@@ -118,6 +261,59 @@ class ModeloTumorBase(ABC):
         """
         return self.P0 * np.exp(self.beta0 / self.alpha)
 
+    def limite_asintotico_log(self):
+        """
+        Calcula el logaritmo del limite asintotico sin desbordamiento.
+
+        log(P_inf) = log(P_0) + beta_0/alpha
+
+        Util cuando beta_0/alpha es grande y P_0 * exp(beta_0/alpha) excede
+        el rango de float64.
+
+        Retorna:
+        --------
+        float : log(P_inf)
+        """
+        return np.log(self.P0) + self.beta0 / self.alpha
+
+    def resolver_log(self, t):
+        """
+        Retorna log(P(t)).
+
+        Implementacion por defecto: log(resolver(t)). Las subclases que
+        integran en espacio logaritmico la sobrescriben para no desbordar.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : log(P(t))
+        """
+        return np.log(self.resolver(t))
+
+    def resolver_escalado(self, t):
+        """
+        Retorna P(t) en forma escalada segura: P(t) = mantisa * exp(log_escala).
+
+        La escala es el maximo de log(P) sobre los tiempos pedidos, de modo
+        que la mantisa esta en (0, 1] y nunca desborda.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        tuple : (mantisa, log_escala)
+        """
+        log_P = self.resolver_log(t)
+        log_escala = np.max(log_P)
+        return np.exp(log_P - log_escala), log_escala
+
     def factor_crecimiento(self):
         """
         Calcula el factor de crecimiento total del modelo.
@@ -145,6 +341,45 @@ class ModeloTumorBase(ABC):
         """
         return self.beta0 * np.exp(-self.alpha * t)
 
+    def tiempo_umbral(self, umbrales):
+        """
+        Calcula el primer tiempo en que P(t) alcanza cada umbral.
+
+        Implementacion para los metodos numericos: busca el paso que contiene
+        el cruce en la trayectoria precalculada y resuelve la raiz dentro del
+        paso sobre la salida densa (ver Salida_Densa.tiempos_cruce).
+        Las subclases con formula cerrada la sobrescriben.
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce (np.inf si no se alcanzan en [0, t_max])
+        """
+        t_vals, P_vals = self.obtener_trayectoria()
+        dP_vals = self.f(t_vals, P_vals) if self.salida_densa == 'hermite' else None
+        return tiempos_cruce(t_vals, P_vals, umbrales, dP_vals)
+
+    def tiempo_fraccion_limite(self, fracciones):
+        """
+        Calcula el tiempo en que P(t) alcanza una fraccion del limite asintotico.
+
+        Por ejemplo, fracciones=0.95 responde cuando P(t) = 0.95 * P_inf.
+
+        Parametros:
+        -----------
+        fracciones : float or array_like
+            Fraccion(es) de limite_asintotico()
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce
+        """
+        return self.tiempo_umbral(np.asarray(fracciones) * self.limite_asintotico())
+
     def generar_isoclinas(self, t, num_isoclinas=8):
         """
         Genera curvas isoclinas para el campo de direcciones.
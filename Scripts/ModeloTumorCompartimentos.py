@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor con N Compartimentos Lineales (Matriz Dispersa)
+
+Generaliza el sistema de dos subpoblaciones de la Parte C a N estados
+celulares con una matriz de transicion dispersa J:
+
+dX/dt = r(t) * J X,    r(t) = beta_0 * e^(-alpha*t),    X(0) = X0
+
+Como r(t) es escalar, J y r(t) J conmutan en todo t y la solucion es exacta:
+
+X(t) = exp(s(t) J) X0,    s(t) = integral_0^t r = beta_0/alpha * (1 - e^(-alpha*t))
+
+El producto exp(s J) X0 se calcula con scipy.sparse.linalg.expm_multiply
+(Krylov/Taylor truncado con escalado), sin formar nunca exp(s J), de modo
+que el costo es un numero moderado de productos J @ X: N = 10^5
+compartimentos se resuelven en fracciones de segundo.
+
+Si J depende del tiempo (J es un callable J(t)) ya no hay formula cerrada y
+se integra con el paso estatico de un metodo numerico (RK4 por defecto),
+igual que ModeloTumorPorTramos.
+
+Con N = 1, J = [[1]] se recupera el modelo escalar dP/dt = beta_0 e^(-alpha t) P.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import ArpackNoConvergence, eigs, expm_multiply
+from ModeloTumorBase import ModeloTumorBase, metodo_de_un_paso
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+class ModeloTumorCompartimentos(ModeloTumorBase):
+    """
+    Modelo lineal de N compartimentos dX/dt = r(t) J X con J dispersa.
+
+    resolver(t) retorna la poblacion total P(t) = sum_i X_i(t), de modo que
+    el modelo se puede comparar y graficar como cualquier otro; el estado
+    completo se obtiene con resolver_estados(t).
+
+    Atributos adicionales:
+    ---------------------
+    X0 : array
+        Estado inicial, forma (N,)
+    J : scipy.sparse.csr_matrix or callable
+        Matriz de transicion constante o funcion J(t) que la retorna
+    N : int
+        Numero de compartimentos
+    t_max : float
+        Tiempo maximo (dominio de obtener_trayectoria y tiempo_umbral)
+    metodo_numerico : type or None
+        Clase con paso estatico usada para J(t); None usa expm_multiply
+    h : float
+        Paso del metodo numerico
+    """
+
+    salida_densa = 'lineal'
+
+    def __init__(self, X0, J, beta0=1.0, alpha=0.0, t_max=10.0, metodo_numerico=None, h=0.01):
+        """
+        Inicializa el modelo de compartimentos.
+
+        Parametros:
+        -----------
+        X0 : array_like
+            Poblacion inicial de cada compartimento, forma (N,)
+        J : array_like, matriz dispersa o callable
+            Matriz de transicion (N, N), o funcion J(t) que la retorna
+        beta0 : float, opcional
+            Escala inicial de la tasa r(t) (default: 1.0)
+        alpha : float, opcional
+            Decaimiento de la tasa r(t); 0 da dX/dt = beta0 J X (default: 0.0)
+        t_max : float, opcional
+            Tiempo maximo de simulacion (default: 10.0)
+        metodo_numerico : type, opcional
+            Clase con metodo estatico paso(f, t, y, h) y atributo
+            evaluaciones_por_paso (ver metodo_de_un_paso). Con J constante y
+            None se usa la exponencial exacta; con J(t) el default es
+            ModeloTumorRK4 (default: None)
+        h : float, opcional
+            Paso del metodo numerico (default: 0.01)
+        """
+        self.X0 = np.asarray(X0, dtype=float)
+        self.N = self.X0.shape[0]
+
+        if callable(J):
+            self.J = J
+            if metodo_numerico is None:
+                metodo_numerico = ModeloTumorRK4
+        else:
+            self.J = sparse.csr_matrix(J, dtype=float)
+            if self.J.shape != (self.N, self.N):
+                raise ValueError(f"J debe tener forma ({self.N}, {self.N}), no {self.J.shape}")
+            # Traza de J: expm_multiply la usa para desplazar el espectro
+            self._traza = self.J.diagonal().sum()
+        if metodo_numerico is None:
+            metodo = 'Krylov'
+        else:
+            metodo_de_un_paso(metodo_numerico)
+            metodo = getattr(metodo_numerico, 'nombre_metodo', None) or metodo_numerico.__name__
+
+        super().__init__(self.X0.sum(), beta0, alpha,
+                         nombre=f"Compartimentos (N={self.N}, {metodo})")
+        self.t_max = t_max
+        self.metodo_numerico = metodo_numerico
+        self.h = h
+
+    def tiempo_efectivo(self, t):
+        """
+        Calcula s(t) = integral_0^t r(tau) dtau = beta_0/alpha * (1 - e^(-alpha*t)).
+
+        Con alpha = 0 se reduce a beta_0 * t.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s)
+
+        Retorna:
+        --------
+        float or array_like : s(t)
+        """
+        if self.alpha == 0:
+            return self.beta0 * np.asarray(t, dtype=float)
+        return self.beta0 / self.alpha * -np.expm1(-self.alpha * np.asarray(t, dtype=float))
+
+    def matriz(self, t):
+        """
+        Retorna la matriz de transicion en el tiempo t.
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+
+        Retorna:
+        --------
+        scipy.sparse matrix : J(t)
+        """
+        return self.J(t) if callable(self.J) else self.J
+
+    def f(self, t, X):
+        """
+        Lado derecho del sistema: dX/dt = r(t) * J(t) X
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        X : array_like
+            Estado, forma (N,)
+
+        Retorna:
+        --------
+        array : dX/dt
+        """
+        return self.tasa_crecimiento(t) * (self.matriz(t) @ X)
+
+    def _propagar_krylov(self, t_ordenados):
+        """
+        Propaga X0 por los tiempos ordenados con exp(Delta_s J).
+
+        Cada tramo reutiliza el estado anterior, de modo que el costo crece
+        con s(t_max) y no con el numero de tiempos pedidos al cuadrado.
+        """
+        s = self.tiempo_efectivo(t_ordenados)
+        X = self.X0
+        s_actual = 0.0
+        estados = np.empty((len(t_ordenados), self.N))
+        for k, s_k in enumerate(s):
+            ds = s_k - s_actual
+            if ds != 0:
+                X = expm_multiply(ds * self.J, X, traceA=ds * self._traza)
+                s_actual = s_k
+                self.pasos += 1
+            estados[k] = X
+        return estados
+
+    def _propagar_numerico(self, t_ordenados):
+        """
+        Integra con el paso estatico de metodo_numerico y paso h.
+
+        Se avanza en la malla n*h y cada tiempo pedido se alcanza con un
+        paso parcial desde el nodo anterior, sin guardar la trayectoria
+        completa (que para N grande no cabe en memoria).
+        """
+        paso, evaluaciones_por_paso = metodo_de_un_paso(self.metodo_numerico)
+        X = self.X0
+        n = 0
+        estados = np.empty((len(t_ordenados), self.N))
+        for k, t_k in enumerate(t_ordenados):
+            # Pasos completos hasta el ultimo nodo de la malla <= t_k
+            n_k = int(np.floor(t_k / self.h + 1e-9))
+            while n < n_k:
+                X = paso(self.f, n * self.h, X, self.h)
+                n += 1
+                self.pasos += 1
+            # Paso parcial hasta t_k (no avanza la malla)
+            resto = t_k - n * self.h
+            if resto > 1e-12 * self.h:
+                estados[k] = paso(self.f, n * self.h, X, resto)
+                self.pasos += 1
+            else:
+                estados[k] = X
+        self.evaluaciones_f = evaluaciones_por_paso * self.pasos
+        return estados
+
+    def resolver_estados(self, t):
+        """
+        Retorna el estado completo X(t).
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) >= 0 donde evaluar la solucion
+
+        Retorna:
+        --------
+        array : X(t), forma (N,) para t escalar o (len(t), N)
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        if np.any(t < 0):
+            raise ValueError("los tiempos deben ser >= 0")
+
+        # Propagar una sola vez por los tiempos ordenados y sin repetir
+        t_unicos, inversa = np.unique(t, return_inverse=True)
+        self.pasos = 0
+        self.evaluaciones_f = 0
+        inicio = time.perf_counter()
+        if self.metodo_numerico is None:
+            estados = self._propagar_krylov(t_unicos)
+        else:
+            estados = self._propagar_numerico(t_unicos)
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+        X = estados[inversa.ravel()]
+        return X[0] if t_escalar else X
+
+    def resolver(self, t):
+        """
+        Retorna la poblacion total P(t) = sum_i X_i(t).
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t)
+        """
+        return self.resolver_estados(t).sum(axis=-1)
+
+    def obtener_trayectoria(self, n_puntos=201):
+        """
+        Retorna la poblacion total en una malla uniforme de [0, t_max].
+
+        Parametros:
+        -----------
+        n_puntos : int, opcional
+            Numero de puntos (default: 201)
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+        """
+        t_vals = np.linspace(0, self.t_max, n_puntos)
+        return t_vals, self.resolver(t_vals)
+
+    def abscisa_espectral(self):
+        """
+        Mayor parte real de los autovalores de sign(beta0) J.
+
+        Decide el comportamiento de exp(s J) X0 cuando s(t) -> +/- inf. Con
+        N <= 2000 se usan todos los autovalores; si no, ARPACK busca el de
+        mayor parte real (con espectros agrupados puede no converger, y
+        entonces se lanza ValueError).
+
+        Retorna:
+        --------
+        float : max Re(lambda) de sign(beta0) J
+        """
+        if callable(self.J):
+            raise ValueError("la abscisa espectral requiere J constante")
+        A = np.sign(self.beta0) * self.J
+        if self.N <= 2000:
+            return np.max(np.linalg.eigvals(A.toarray()).real)
+        try:
+            return eigs(A, k=1, which='LR', return_eigenvectors=False)[0].real
+        except ArpackNoConvergence:
+            raise ValueError(f"ARPACK no convergio a la abscisa espectral de J (N={self.N})") from None
+
+    def limite_asintotico(self):
+        """
+        Calcula la poblacion total limite cuando t tiende a infinito.
+
+        Con alpha > 0, s(t) -> beta_0/alpha y X_inf = exp(beta_0/alpha J) X0.
+        Con alpha <= 0 la tasa no decae y |s(t)| -> inf, asi que decide el
+        espectro de sign(beta0) J (ver abscisa_espectral): con un autovalor
+        de parte real > 0 el crecimiento no se acota (np.inf) y con todos
+        de parte real < 0 la poblacion se extingue (0.0). Con abscisa nula
+        el limite depende de la proyeccion de X0 y se rechaza.
+
+        Retorna:
+        --------
+        float : sum_i X_inf_i
+        """
+        if callable(self.J):
+            raise ValueError("el limite asintotico requiere J constante")
+        if self.beta0 == 0 or self.J.nnz == 0:
+            return self.X0.sum()
+        if self.alpha <= 0:
+            abscisa = self.abscisa_espectral()
+            escala = np.max(np.abs(self.J.data)) if self.J.nnz else 0.0
+            if abscisa > 1e-12 * escala:
+                return np.inf
+            if abscisa < -1e-12 * escala:
+                return 0.0
+            raise ValueError("J tiene abscisa espectral nula: el limite con alpha <= 0 "
+                             "depende de X0 y no se calcula")
+        s_inf = self.beta0 / self.alpha
+        return expm_multiply(s_inf * self.J, self.X0, traceA=s_inf * self._traza).sum()
+
+    def tiempo_fraccion_limite(self, fracciones):
+        """
+        Calcula el tiempo en que P(t) alcanza una fraccion del limite asintotico.
+
+        Si el limite es np.inf (crecimiento no acotado) o 0.0 (extincion),
+        ninguna fraccion se alcanza en tiempo finito.
+
+        Parametros:
+        -----------
+        fracciones : float or array_like
+            Fraccion(es) de limite_asintotico()
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce (np.inf si no se alcanzan en [0, t_max])
+        """
+        limite = self.limite_asintotico()
+        if np.isinf(limite) or (limite == 0 and self.P0 > 0):
+            tiempos = np.full(np.shape(fracciones), np.inf)
+            return tiempos[()] if tiempos.ndim == 0 else tiempos
+        return self.tiempo_umbral(np.asarray(fracciones) * limite)
+
+    def limite_asintotico_log(self):
+        """
+        Retorna log del limite asintotico de la poblacion total.
+
+        Retorna:
+        --------
+        float : log(P_inf)
+        """
+        return np.log(self.limite_asintotico())
+
+    def factor_crecimiento(self):
+        """
+        Calcula el factor de crecimiento total P_inf / P(0).
+
+        Retorna:
+        --------
+        float : Factor de crecimiento
+        """
+        return self.limite_asintotico() / self.P0
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        texto = f"{self.nombre}\n  beta0={self.beta0}, alpha={self.alpha}, P0 total={self.P0:.4f}"
+        if not callable(self.J):
+            texto += f"\n  Elementos no nulos de J: {self.J.nnz}"
+        return texto
+
+
+if __name__ == '__main__':
+    from scipy.linalg import expm
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+    print("=== Modelo de N Compartimentos con Exponencial de Krylov ===\n")
+
+    # 1. Un solo compartimento: debe coincidir con la solucion analitica
+    t = np.linspace(0, 10, 11)
+    uno = ModeloTumorCompartimentos([100.0], [[1.0]], beta0=2.0, alpha=0.5)
+    analitico = ModeloTumorAnalitico(100.0, 2.0, 0.5)
+    error = np.max(np.abs(uno.resolver(t) / analitico.resolver(t) - 1))
+    print(f"N = 1 vs analitico: error relativo maximo = {error:.2e}")
+    print(f"Limite asintotico: {uno.limite_asintotico():.4f} vs {analitico.limite_asintotico():.4f}\n")
+
+    # Cadena de estados celulares: proliferacion p_i, diferenciacion d_i hacia
+    # el estado i+1, desdiferenciacion b hacia i-1 y muerte m_i
+    def cadena(N, semilla=0):
+        rng = np.random.default_rng(semilla)
+        p = rng.uniform(0.2, 0.6, N)
+        d = rng.uniform(0.1, 0.5, N)
+        m = rng.uniform(0.05, 0.2, N)
+        b = np.full(N, 0.02)
+        return sparse.diags([d[:-1], p - d - m - b, b[1:]], [-1, 0, 1], format='csr')
+
+    # 2. N = 200: Krylov vs expm denso vs RK4 paso a paso
+    N = 200
+    J = cadena(N)
+    X0 = np.zeros(N)
+    X0[:10] = 10.0
+    krylov = ModeloTumorCompartimentos(X0, J, beta0=2.0, alpha=0.5)
+    rk4 = ModeloTumorCompartimentos(X0, J, beta0=2.0, alpha=0.5, metodo_numerico=ModeloTumorRK4)
+    X_denso = expm(krylov.tiempo_efectivo(10.0) * J.toarray()) @ X0
+    X_krylov = krylov.resolver_estados(10.0)
+    X_rk4 = rk4.resolver_estados(10.0)
+    print(f"N = {N}: error Krylov vs expm denso = {np.max(np.abs(X_krylov - X_denso)) / np.max(X_denso):.2e}, "
+          f"RK4 (h=0.01) = {np.max(np.abs(X_rk4 - X_denso)) / np.max(X_denso):.2e}\n")
+
+    # 3. N = 10^5 compartimentos, 50 tiempos de salida
+    N = 100_000
+    J = cadena(N)
+    X0 = np.zeros(N)
+    X0[:100] = 1.0
+    modelo = ModeloTumorCompartimentos(X0, J, beta0=2.0, alpha=0.5)
+    print(modelo)
+    t = np.linspace(0, 10, 50)
+    P = modelo.resolver(t)
+    print(f"N = {N:,}: {len(t)} tiempos en {modelo.tiempo_integracion:.2f} s")
+    print(f"P(0) = {P[0]:.2f}, P(10) = {P[-1]:.2f}, P_inf = {modelo.limite_asintotico():.2f}")
+    print(f"Tiempo hasta 2*P0: {modelo.tiempo_umbral(2 * modelo.P0):.4f}\n")
+
+    # 4. J(t) variable: un tratamiento a partir de t = 4 duplica la muerte en
+    # la primera mitad de la cadena -> se integra con RK4
+    J_tratado = J + sparse.diags(np.where(np.arange(N) < N // 2, -0.3, 0.0), format='csr')
+    variable = ModeloTumorCompartimentos(X0, lambda t: J_tratado if t >= 4 else J,
+                                         beta0=2.0, alpha=0.5, h=0.01)
+    P_tratado = variable.resolver(10.0)
+    print(f"J(t) con tratamiento (RK4): P(10) = {P_tratado:.2f}, {variable.pasos} pasos "
+          f"en {variable.tiempo_integracion:.2f} s")
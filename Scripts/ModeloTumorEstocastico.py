@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor Estocastico (EDE) - Monte Carlo con Euler-Maruyama / Milstein
+
+Variante estocastica del modelo con ruido multiplicativo en la tasa:
+dP = beta_0 * e^(-alpha*t) * P dt + sigma * P dW
+
+Esquemas (vectorizados sobre todas las trayectorias de un bloque):
+Euler-Maruyama: P_{n+1} = P_n + r(t_n) P_n h + sigma P_n dW
+Milstein:       P_{n+1} = P_n + r(t_n) P_n h + sigma P_n dW + sigma^2/2 P_n (dW^2 - h)
+
+con dW ~ N(0, h). En la interpretacion de Ito la media E[P(t)] coincide
+con la solucion deterministica, que es lo que retorna resolver().
+
+Las trayectorias se simulan por bloques en varios procesos, cada uno con su
+propio flujo de numeros aleatorios (SeedSequence.spawn), y las bandas de
+confianza se acumulan en linea (Estadisticas_En_Linea) sin guardar las
+trayectorias.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Estadisticas_En_Linea import AcumuladorMomentos, HistogramaCuantiles
+
+
+def _simular_lote(argumentos):
+    """
+    Simula n trayectorias por bloques y retorna sus acumuladores.
+
+    Es una funcion de modulo para poder ejecutarse en un proceso hijo.
+
+    Retorna:
+    --------
+    tuple : (AcumuladorMomentos, HistogramaCuantiles)
+    """
+    (P0, beta0, alpha, sigma, h, n_pasos, esquema, indices_salida,
+     n_trayectorias, tam_bloque, semilla, log_inf, log_sup, n_bins) = argumentos
+
+    rng = np.random.default_rng(semilla)
+    momentos = AcumuladorMomentos(len(indices_salida))
+    histograma = HistogramaCuantiles(log_inf, log_sup, n_bins=n_bins, escala='log')
+
+    # Tasa r(t_n) precalculada para toda la malla
+    r = beta0 * np.exp(-alpha * h * np.arange(n_pasos))
+    raiz_h = np.sqrt(h)
+
+    # Posicion de cada paso en el array de salida (-1 si no se guarda)
+    columna = np.full(n_pasos + 1, -1)
+    columna[indices_salida] = np.arange(len(indices_salida))
+
+    restantes = n_trayectorias
+    while restantes > 0:
+        B = min(tam_bloque, restantes)
+        restantes -= B
+
+        P = np.full(B, float(P0))
+        salida = np.empty((B, len(indices_salida)))
+        if columna[0] >= 0:
+            salida[:, columna[0]] = P
+
+        for n in range(n_pasos):
+            dW = raiz_h * rng.standard_normal(B)
+            incremento = r[n] * h + sigma * dW
+            if esquema == 'milstein':
+                incremento += 0.5 * sigma**2 * (dW * dW - h)
+            P += P * incremento
+
+            if columna[n + 1] >= 0:
+                salida[:, columna[n + 1]] = P
+
+        momentos.actualizar(salida)
+        histograma.actualizar(salida)
+
+    return momentos, histograma
+
+
+class ModeloTumorEstocastico(ModeloTumorBase):
+    """
+    Modelo de tumor con ruido multiplicativo resuelto por Monte Carlo.
+
+    EDE: dP = r(t) P dt + sigma P dW,  r(t) = beta_0 * e^(-alpha*t)
+
+    Orden fuerte: 0.5 (Euler-Maruyama), 1.0 (Milstein)
+    Orden debil: 1.0 (ambos)
+
+    Atributos adicionales:
+    ---------------------
+    sigma : float
+        Intensidad del ruido multiplicativo
+    h : float
+        Tamano de paso
+    t_max : float
+        Tiempo maximo de simulacion
+    esquema : str
+        'euler-maruyama' o 'milstein'
+    media : ModeloTumorAnalitico
+        Solucion deterministica, igual a E[P(t)]
+    """
+
+    def __init__(self, P0, beta0, alpha, sigma=0.1, h=0.01, t_max=10.0, esquema='milstein'):
+        """
+        Inicializa el modelo estocastico.
+
+        Parametros:
+        -----------
+        P0 : float
+            Poblacion inicial
+        beta0 : float
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float
+            Tasa de decrecimiento exponencial (alpha)
+        sigma : float, opcional
+            Intensidad del ruido (default: 0.1)
+        h : float, opcional
+            Tamano de paso (default: 0.01)
+        t_max : float, opcional
+            Tiempo maximo de simulacion (default: 10.0)
+        esquema : str, opcional
+            'euler-maruyama' o 'milstein' (default: 'milstein')
+        """
+        if esquema not in ('euler-maruyama', 'milstein'):
+            raise ValueError("esquema debe ser 'euler-maruyama' o 'milstein'")
+
+        super().__init__(P0, beta0, alpha, nombre=f"EDE {esquema} (sigma={sigma}, h={h})")
+        self.sigma = sigma
+        self.h = h
+        self.t_max = t_max
+        self.esquema = esquema
+        self.n_pasos = int(round(t_max / h))
+        # Solucion deterministica: es la media E[P(t)] en la interpretacion de Ito
+        self.media = ModeloTumorAnalitico(P0, beta0, alpha)
+
+    def resolver(self, t):
+        """
+        Retorna la media E[P(t)], que coincide con la solucion deterministica.
+
+        E[P(t)] = P_0 * exp(beta_0/alpha * (1 - e^(-alpha*t)))
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar
+
+        Retorna:
+        --------
+        float or array_like : E[P(t)]
+        """
+        return self.media.resolver(t)
+
+    def obtener_trayectoria(self):
+        """
+        Retorna la trayectoria media E[P(t)] en la malla del esquema.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array con E[P(t)]
+        """
+        t_vals = self.h * np.arange(self.n_pasos + 1)
+        return t_vals, self.resolver(t_vals)
+
+    def tiempo_umbral(self, umbrales):
+        """
+        Calcula el primer tiempo en que la media E[P(t)] alcanza cada umbral.
+
+        La media es la solucion deterministica, asi que se usa su inversa
+        cerrada. Cada trayectoria cruza el umbral en un tiempo aleatorio;
+        su distribucion se obtiene con simular_trayectorias().
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce de la media (np.inf si no se alcanzan)
+        """
+        return self.media.tiempo_umbral(umbrales)
+
+    def simular_trayectorias(self, n_trayectorias, semilla=None):
+        """
+        Simula y retorna trayectorias completas (para graficar pocas).
+
+        Parametros:
+        -----------
+        n_trayectorias : int
+            Numero de trayectorias
+        semilla : int, opcional
+            Semilla del generador
+
+        Retorna:
+        --------
+        tuple : (t_vals, P) con P de forma (n_trayectorias, n_pasos + 1)
+        """
+        rng = np.random.default_rng(semilla)
+        t_vals = self.h * np.arange(self.n_pasos + 1)
+        P = np.empty((n_trayectorias, self.n_pasos + 1))
+        P[:, 0] = self.P0
+
+        dW = np.sqrt(self.h) * rng.standard_normal((n_trayectorias, self.n_pasos))
+        r = self.tasa_crecimiento(t_vals[:-1])
+        for n in range(self.n_pasos):
+            incremento = r[n] * self.h + self.sigma * dW[:, n]
+            if self.esquema == 'milstein':
+                incremento += 0.5 * self.sigma**2 * (dW[:, n]**2 - self.h)
+            P[:, n + 1] = P[:, n] * (1 + incremento)
+
+        return t_vals, P
+
+    def simular(self, n_trayectorias, t_salida=None, niveles=(0.05, 0.5, 0.95),
+                n_procesos=1, semilla=None, tam_bloque=10000, n_bins=2048):
+        """
+        Simulacion Monte Carlo con estadisticas en linea.
+
+        La memoria usada es O(tam_bloque * len(t_salida)) por proceso,
+        independiente de n_trayectorias.
+
+        Parametros:
+        -----------
+        n_trayectorias : int
+            Numero total de trayectorias
+        t_salida : array_like, opcional
+            Tiempos donde acumular estadisticas; se redondean a la malla
+            (default: 101 puntos en [0, t_max])
+        niveles : sequence, opcional
+            Niveles de los cuantiles (default: (0.05, 0.5, 0.95))
+        n_procesos : int, opcional
+            Procesos de trabajo; cada uno recibe un flujo aleatorio
+            independiente (default: 1)
+        semilla : int, opcional
+            Semilla raiz; con la misma semilla y n_procesos el resultado es
+            reproducible (default: None)
+        tam_bloque : int, opcional
+            Trayectorias simuladas a la vez por proceso (default: 10000)
+        n_bins : int, opcional
+            Bins del histograma de cuantiles por punto de tiempo (default: 2048)
+
+        Retorna:
+        --------
+        dict : Con claves 't', 'media', 'varianza', 'niveles', 'cuantiles'
+               (forma (Q, T)), 'n_trayectorias', 'fuera_de_rango', 'tiempo_s'
+        """
+        if t_salida is None:
+            t_salida = np.linspace(0, self.n_pasos * self.h, 101)
+        indices = np.unique(np.clip(np.round(np.asarray(t_salida) / self.h).astype(int), 0, self.n_pasos))
+        t_out = indices * self.h
+
+        # Rango del histograma en log(P): solucion de log(P) +/- 8 desviaciones
+        # (log P tiene drift r(t) - sigma^2/2 y desviacion sigma*sqrt(t))
+        centro = self.resolver_log(t_out) - 0.5 * self.sigma**2 * t_out
+        radio = 8 * self.sigma * np.sqrt(t_out) + 1e-6 * max(1.0, abs(np.log(self.P0)))
+        log_inf, log_sup = centro - radio, centro + radio
+
+        # Repartir trayectorias y flujos aleatorios independientes entre procesos
+        n_procesos = max(1, min(n_procesos, n_trayectorias))
+        semillas = np.random.SeedSequence(semilla).spawn(n_procesos)
+        reparto = np.full(n_procesos, n_trayectorias // n_procesos)
+        reparto[:n_trayectorias % n_procesos] += 1
+
+        tareas = [(self.P0, self.beta0, self.alpha, self.sigma, self.h, self.n_pasos,
+                   self.esquema, indices, int(n), tam_bloque, s, log_inf, log_sup, n_bins)
+                  for n, s in zip(reparto, semillas)]
+
+        inicio = time.perf_counter()
+        if n_procesos == 1:
+            resultados = [_simular_lote(tareas[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+                resultados = list(ejecutor.map(_simular_lote, tareas))
+
+        momentos, histograma = resultados[0]
+        for m, hist in resultados[1:]:
+            momentos.combinar(m)
+            histograma.combinar(hist)
+        duracion = time.perf_counter() - inicio
+
+        self.pasos = self.n_pasos * n_trayectorias
+        self.evaluaciones_f = self.pasos
+        self.tiempo_integracion = duracion
+
+        return {
+            't': t_out,
+            'media': momentos.media,
+            'varianza': momentos.varianza(),
+            'niveles': np.asarray(niveles),
+            'cuantiles': histograma.cuantiles(niveles),
+            'n_trayectorias': momentos.n,
+            'fuera_de_rango': histograma.fuera_de_rango,
+            'tiempo_s': duracion,
+        }
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, beta0={self.beta0}, alpha={self.alpha}, sigma={self.sigma}\n"
+                f"  h={self.h}, t_max={self.t_max}\n"
+                f"  Limite asintotico de la media: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    import os
+
+    print("=== Modelo de Tumor Estocastico (Monte Carlo) ===\n")
+
+    modelo = ModeloTumorEstocastico(P0=100, beta0=2.0, alpha=0.5, sigma=0.1, h=0.01)
+    print(modelo)
+    print()
+
+    n_procesos = min(4, os.cpu_count() or 1)
+    resultado = modelo.simular(200000, t_salida=[0, 1, 2, 5, 10],
+                               n_procesos=n_procesos, semilla=2025)
+
+    print(f"Trayectorias: {resultado['n_trayectorias']} en {resultado['tiempo_s']:.2f} s "
+          f"({n_procesos} procesos)\n")
+    print(f"{'t':>5} {'E[P] exacta':>12} {'Media MC':>12} {'q05':>10} {'q50':>10} {'q95':>10}")
+    print("-" * 64)
+    for i, t in enumerate(resultado['t']):
+        q05, q50, q95 = resultado['cuantiles'][:, i]
+        print(f"{t:5.1f} {modelo.resolver(t):12.3f} {resultado['media'][i]:12.3f} "
+              f"{q05:10.3f} {q50:10.3f} {q95:10.3f}")
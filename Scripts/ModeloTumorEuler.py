@@ -13,8 +13,10 @@ Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo
 Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
 """
 
+import time
 import numpy as np
 from ModeloTumorBase import ModeloTumorBase
+from Salida_Densa import interpolar_lineal
 
 
 class ModeloTumorEuler(ModeloTumorBase):
@@ -36,9 +38,20 @@ class ModeloTumorEuler(ModeloTumorBase):
         Tamano de paso (step size)
     t_max : float
         Tiempo maximo de integracion
+    escala_log : bool
+        Si es True se integra log(P) en lugar de P (ver _integrar_log)
+    sensibilidades : bool
+        Si es True se integran tambien dP/dP0, dP/dbeta0 y dP/dalpha
     """
 
-    def __init__(self, P0, beta0, alpha, h=0.01, t_max=10.0):
+    # La extension continua natural de Euler es lineal entre nodos
+    salida_densa = 'lineal'
+    orden = 1
+    evaluaciones_por_paso = 1
+    nombre_metodo = 'Euler'
+
+    def __init__(self, P0, beta0, alpha, h=0.01, t_max=10.0, escala_log=False,
+                 sensibilidades=False):
         """
         Inicializa el modelo con el metodo de Euler.
 
@@ -54,13 +67,52 @@ class ModeloTumorEuler(ModeloTumorBase):
             Tamano de paso (default: 0.01)
         t_max : float, opcional
             Tiempo maximo de integracion (default: 10.0)
+        escala_log : bool, opcional
+            Integrar log(P) para evitar desbordamiento con beta0/alpha grande
+            (default: False)
+        sensibilidades : bool, opcional
+            Integrar las ecuaciones de sensibilidad junto con P (default: False)
         """
-        super().__init__(P0, beta0, alpha, nombre=f"Euler (h={h})")
+        if escala_log and sensibilidades:
+            raise ValueError("escala_log y sensibilidades no se pueden combinar")
+
+        nombre = f"Euler (h={h})" + (" [log]" if escala_log else "")
+        super().__init__(P0, beta0, alpha, nombre=nombre)
         self.h = h
         self.t_max = t_max
+        self.escala_log = escala_log
+        self.sensibilidades = sensibilidades
 
         # Precalcular la solucion numerica
+        inicio = time.perf_counter()
         self.t_vals, self.P_vals = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    @staticmethod
+    def paso(f, t_n, y_n, h):
+        """
+        Da un paso de Euler para y' = f(t, y).
+
+        Es independiente del modelo: y puede ser un escalar o un array
+        (sistema aumentado, lote de trayectorias, malla espacial, etc.).
+
+        Parametros:
+        -----------
+        f : callable
+            Lado derecho f(t, y)
+        t_n : float or array_like
+            Tiempo actual
+        y_n : float or array_like
+            Estado actual
+        h : float or array_like
+            Tamano de paso
+
+        Retorna:
+        --------
+        float or array_like : y_{n+1}
+        """
+        # Paso de Euler: y_{n+1} = y_n + h * f(t_n, y_n)
+        return y_n + h * f(t_n, y_n)
 
     def _integrar(self):
         """
@@ -72,20 +124,61 @@ class ModeloTumorEuler(ModeloTumorBase):
             t_vals : array de tiempos
             P_vals : array de poblaciones
         """
+        if self.escala_log:
+            return self._integrar_log()
+
         # Crear malla temporal
         t_vals = np.arange(0, self.t_max + self.h, self.h)
-        P_vals = np.zeros_like(t_vals)
+
+        # Estado: P, o [P, S_P0, S_beta0, S_alpha] con sensibilidades
+        if self.sensibilidades:
+            f, y0 = self.f_aumentada, self.estado_inicial_aumentado()
+        else:
+            f, y0 = self.f, self.P0
+        Y = np.zeros((len(t_vals),) + np.shape(y0))
 
         # Condicion inicial
-        P_vals[0] = self.P0
+        Y[0] = y0
 
         # Iterar metodo de Euler
         for i in range(len(t_vals) - 1):
-            t_n = t_vals[i]
-            P_n = P_vals[i]
+            Y[i + 1] = self.paso(f, t_vals[i], Y[i], self.h)
 
-            # Paso de Euler: P_{n+1} = P_n + h * f(t_n, P_n)
-            P_vals[i + 1] = P_n + self.h * self.f(t_n, P_n)
+        if self.sensibilidades:
+            P_vals, self.S_vals = Y[..., 0], Y[..., 1:]
+        else:
+            P_vals = Y
+
+        self.pasos = len(t_vals) - 1
+        self.evaluaciones_f = self.evaluaciones_por_paso * self.pasos
+
+        return t_vals, P_vals
+
+    def _integrar_log(self):
+        """
+        Integra d(log P)/dt = r(t) con el metodo de Euler.
+
+        El paso de Euler sobre log(P) es log P_{n+1} = log P_n + h * r(t_n),
+        que es una suma acumulada: toda la trayectoria se calcula en una sola
+        pasada vectorizada y log(P) nunca desborda aunque P lo haga.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones (puede contener inf; ver logP_vals)
+        """
+        # Crear malla temporal
+        t_vals = np.arange(0, self.t_max + self.h, self.h)
+
+        incrementos = np.diff(t_vals) * self.tasa_crecimiento(t_vals[:-1])
+        self.logP_vals = np.log(self.P0) + np.concatenate([[0.0], np.cumsum(incrementos)])
+
+        with np.errstate(over='ignore'):
+            P_vals = np.exp(self.logP_vals)
+
+        self.pasos = len(t_vals) - 1
+        self.evaluaciones_f = self.pasos
 
         return t_vals, P_vals
 
@@ -104,16 +197,80 @@ class ModeloTumorEuler(ModeloTumorBase):
         --------
         float or array_like : P(t) aproximado
         """
+        if self.escala_log:
+            with np.errstate(over='ignore'):
+                return np.exp(self.resolver_log(t))
+
         # Si t es escalar, convertir a array
         t_escalar = np.isscalar(t)
         t = np.atleast_1d(t)
 
         # Interpolar valores
-        P = np.interp(t, self.t_vals, self.P_vals)
+        P = interpolar_lineal(t, self.t_vals, self.P_vals)
 
         # Retornar escalar si la entrada era escalar
         return P[0] if t_escalar else P
 
+    def resolver_log(self, t):
+        """
+        Retorna log(P(t)). En modo escala_log se interpola log(P) directamente.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : log(P(t)) aproximado
+        """
+        if not self.escala_log:
+            return super().resolver_log(t)
+
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(t)
+
+        log_P = interpolar_lineal(t, self.t_vals, self.logP_vals)
+
+        # Retornar escalar si la entrada era escalar
+        return log_P[0] if t_escalar else log_P
+
+    def resolver_sensibilidades(self, t):
+        """
+        Retorna dP/dP0, dP/dbeta0 y dP/dalpha en t (requiere sensibilidades=True).
+
+        Interpola linealmente las sensibilidades integradas; el orden de las
+        columnas coincide con ModeloTumorAnalitico.jacobiano().
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar
+
+        Retorna:
+        --------
+        array : Sensibilidades, forma t.shape + forma de los parametros + (3,)
+        """
+        if not self.sensibilidades:
+            raise ValueError("El modelo se creo sin sensibilidades=True")
+
+        return interpolar_lineal(t, self.t_vals, self.S_vals)
+
+    def obtener_sensibilidades(self):
+        """
+        Retorna las sensibilidades en los nodos calculadas por Euler.
+
+        Retorna:
+        --------
+        tuple : (t_vals, S_vals)
+            t_vals : array de tiempos
+            S_vals : array (n, ..., 3) con dP/dP0, dP/dbeta0, dP/dalpha
+        """
+        if not self.sensibilidades:
+            raise ValueError("El modelo se creo sin sensibilidades=True")
+        return self.t_vals, self.S_vals
+
     def obtener_trayectoria(self):
         """
         Retorna la trayectoria completa calculada por Euler.
@@ -139,11 +296,15 @@ if __name__ == '__main__':
     # Ejemplo de uso del metodo de Euler
     print("=== Metodo de Euler para Modelo de Tumor ===\n")
 
+    # Las trayectorias se leen del cache en disco si ya se calcularon
+    from Cache_Resultados import cache_por_defecto
+    cache = cache_por_defecto()
+
     # Crear instancia con diferentes tamaños de paso
     h_values = [0.1, 0.05, 0.01]
 
     for h in h_values:
-        modelo = ModeloTumorEuler(P0=100, beta0=2.0, alpha=0.5, h=h, t_max=10.0)
+        modelo = cache.modelo(ModeloTumorEuler, P0=100, beta0=2.0, alpha=0.5, h=h, t_max=10.0)
         print(modelo)
 
         # Evaluar en puntos especificos
@@ -158,7 +319,7 @@ if __name__ == '__main__':
     # Comparar con solucion analitica
     from Ecuacion_De_Poblacion import ModeloTumorAnalitico
 
-    modelo_euler = ModeloTumorEuler(P0=100, beta0=2.0, alpha=0.5, h=0.01)
+    modelo_euler = cache.modelo(ModeloTumorEuler, P0=100, beta0=2.0, alpha=0.5, h=0.01)
     modelo_analitico = ModeloTumorAnalitico(P0=100, beta0=2.0, alpha=0.5)
 
     t_comp = np.array([1, 2, 5, 10])
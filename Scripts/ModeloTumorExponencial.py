@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor - Integrador Exponencial (Propagador Exacto)
+
+Como la EDO dP/dt = r(t) * P es lineal en P, cada paso puede darse con el
+propagador exacto:
+P_{n+1} = P_n * exp( integral_{t_n}^{t_n + h} r(s) ds )
+
+Para una EDO escalar lineal el primer termino de la expansion de Magnus ya
+es exacto, asi que el unico error proviene de la cuadratura de r(t). Con
+la tasa del modelo, r(t) = beta_0 * e^(-alpha*t), la integral es cerrada;
+para tasas generalizadas se usa cuadratura de Gauss-Legendre (orden 2*nodos).
+
+A diferencia de Euler, el factor exp(...) es siempre positivo: el metodo es
+estable para cualquier h, incluso con beta_0*h grande.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase
+
+
+class ModeloTumorExponencial(ModeloTumorBase):
+    """
+    Resolucion numerica del modelo de tumor con un integrador exponencial.
+
+    Integrador exponencial (propagador exacto):
+    -------------------------------------------
+    P_{n+1} = P_n * exp(I_n),   I_n = integral_{t_n}^{t_{n+1}} r(s) ds
+
+    donde r(t) = beta_0 * e^(-alpha*t) es la tasa de crecimiento.
+
+    Como P_n = P_0 * exp(I_0 + ... + I_{n-1}), toda la trayectoria se obtiene
+    en una sola pasada vectorizada (suma acumulada), sin ciclo de pasos.
+
+    Error: nulo con la integral cerrada (solo redondeo); O(h^(2*nodos)) con
+    cuadratura de Gauss-Legendre.
+
+    Atributos adicionales:
+    ---------------------
+    h : float
+        Tamano de paso (step size)
+    t_max : float
+        Tiempo maximo de integracion
+    nodos_gauss : int or None
+        Nodos de Gauss-Legendre por paso; None usa la integral cerrada de r(t)
+    """
+
+    def __init__(self, P0, beta0, alpha, h=0.5, t_max=10.0, nodos_gauss=None):
+        """
+        Inicializa el modelo con el integrador exponencial.
+
+        Parametros:
+        -----------
+        P0 : float
+            Poblacion inicial
+        beta0 : float
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float
+            Tasa de decrecimiento exponencial (alpha)
+        h : float, opcional
+            Tamano de paso (default: 0.5)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        nodos_gauss : int, opcional
+            Nodos de cuadratura por paso. Las subclases que redefinen
+            tasa_crecimiento() deben indicarlo (default: None, integral cerrada)
+        """
+        super().__init__(P0, beta0, alpha, nombre=f"Exponencial (h={h})")
+        self.h = h
+        self.t_max = t_max
+        self.nodos_gauss = nodos_gauss
+
+        if nodos_gauss is not None:
+            self._x_gauss, self._w_gauss = np.polynomial.legendre.leggauss(nodos_gauss)
+
+        # Precalcular la solucion numerica
+        inicio = time.perf_counter()
+        self.t_vals, self.P_vals = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    def _integral_tasa(self, a, b):
+        """
+        Calcula integral_a^b r(s) ds para arrays de extremos a y b.
+
+        Parametros:
+        -----------
+        a, b : float or array_like
+            Extremos de integracion
+
+        Retorna:
+        --------
+        float or array_like : Integral de la tasa de crecimiento
+        """
+        if self.nodos_gauss is None:
+            return (self.beta0 / self.alpha) * (np.exp(-self.alpha * a) - np.exp(-self.alpha * b))
+
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+        centro = 0.5 * (a + b)[..., None]
+        radio = 0.5 * (b - a)[..., None]
+        r = self.tasa_crecimiento(centro + radio * self._x_gauss)
+        return np.sum(self._w_gauss * r * radio, axis=-1)
+
+    def _integrar(self):
+        """
+        Integra la EDO con el propagador exacto desde t=0 hasta t=t_max.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones
+        """
+        # Crear malla temporal
+        t_vals = np.arange(0, self.t_max + self.h, self.h)
+
+        # Exponente acumulado: log(P_n / P_0) = I_0 + ... + I_{n-1}
+        incrementos = self._integral_tasa(t_vals[:-1], t_vals[1:])
+        exponente = np.concatenate([[0.0], np.cumsum(incrementos)])
+
+        # Se guarda log(P) para que resolver_log() no desborde
+        self.logP_vals = np.log(self.P0) + exponente
+        with np.errstate(over='ignore'):
+            P_vals = np.exp(self.logP_vals)
+
+        # Una evaluacion de r(t) por nodo de cuadratura (una por paso si es cerrada)
+        self.pasos = len(t_vals) - 1
+        self.evaluaciones_f = self.pasos * (self.nodos_gauss or 1)
+
+        return t_vals, P_vals
+
+    def resolver(self, t):
+        """
+        Retorna la aproximacion numerica de P(t) con el integrador exponencial.
+
+        Entre nodos no interpola linealmente: propaga exactamente desde el
+        nodo anterior, P(t) = P_n * exp(integral_{t_n}^{t} r(s) ds), de modo que
+        la precision no se degrada con pasos grandes.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t) aproximado
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+
+        # Nodo de partida de cada tiempo
+        k = np.clip(np.searchsorted(self.t_vals, t, side='right') - 1, 0, len(self.t_vals) - 1)
+        P = self.P_vals[k] * np.exp(self._integral_tasa(self.t_vals[k], t))
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def resolver_log(self, t):
+        """
+        Retorna log(P(t)) propagando exactamente desde el nodo anterior.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : log(P(t)) aproximado
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+
+        k = np.clip(np.searchsorted(self.t_vals, t, side='right') - 1, 0, len(self.t_vals) - 1)
+        log_P = self.logP_vals[k] + self._integral_tasa(self.t_vals[k], t)
+
+        # Retornar escalar si la entrada era escalar
+        return log_P[0] if t_escalar else log_P
+
+    def obtener_trayectoria(self):
+        """
+        Retorna la trayectoria completa calculada por el integrador exponencial.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones
+        """
+        return self.t_vals, self.P_vals
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        cuadratura = 'cerrada' if self.nodos_gauss is None else f'Gauss-Legendre ({self.nodos_gauss} nodos)'
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, beta0={self.beta0}, alpha={self.alpha}\n"
+                f"  h={self.h}, t_max={self.t_max}, integral de r(t): {cuadratura}\n"
+                f"  Puntos calculados: {len(self.t_vals)}\n"
+                f"  Limite asintotico teorico: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorEuler import ModeloTumorEuler
+    from ModeloTumorRK4 import ModeloTumorRK4
+
+    print("=== Integrador Exponencial para Modelo de Tumor ===\n")
+
+    modelo = ModeloTumorExponencial(P0=100, beta0=2.0, alpha=0.5, h=1.0, t_max=10.0)
+    print(modelo)
+    print()
+
+    modelo_analitico = ModeloTumorAnalitico(P0=100, beta0=2.0, alpha=0.5)
+    t_comp = np.array([0.5, 1, 2.7, 5, 10])
+    P_exacto = modelo_analitico.resolver(t_comp)
+
+    # Pasos grandes: cerrada vs Gauss-Legendre vs RK4 con paso 100 veces menor
+    print(f"{'Metodo':<34} {'Error rel. max':>15} {'Tiempo (ms)':>12}")
+    print("-" * 63)
+    for construir in [
+        lambda: ModeloTumorExponencial(100, 2.0, 0.5, h=1.0),
+        lambda: ModeloTumorExponencial(100, 2.0, 0.5, h=1.0, nodos_gauss=3),
+        lambda: ModeloTumorRK4(100, 2.0, 0.5, h=0.01),
+    ]:
+        inicio = time.perf_counter()
+        mod = construir()
+        duracion = (time.perf_counter() - inicio) * 1000
+        error = np.max(np.abs(mod.resolver(t_comp) - P_exacto) / P_exacto)
+        etiqueta = mod.nombre + ('' if getattr(mod, 'nodos_gauss', None) is None else ' Gauss-3')
+        print(f"{etiqueta:<34} {error:15.3e} {duracion:12.3f}")
+
+    # Estabilidad con beta0*h grande
+    print("\nEstabilidad con beta0*h grande (beta0=-50, alpha=0.5, h=0.1):")
+    exacto = ModeloTumorAnalitico(100, -50.0, 0.5).resolver(10.0)
+    print(f"  Exacto:      P(10) = {exacto:.4e}")
+    print(f"  Exponencial: P(10) = {ModeloTumorExponencial(100, -50.0, 0.5, h=0.1).resolver(10.0):.4e}")
+    print(f"  Euler:       P(10) = {ModeloTumorEuler(100, -50.0, 0.5, h=0.1).resolver(10.0):.4e}")
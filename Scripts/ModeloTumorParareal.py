@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor - Integracion Paralela en el Tiempo (Parareal)
+
+Divide [0, t_max] en N segmentos [T_n, T_{n+1}] y combina dos propagadores:
+
+G : Euler con paso grande h_grueso (barato, secuencial)
+F : RK4 con paso fino h_fino (caro, un segmento por tarea en paralelo)
+
+Iteracion de Parareal sobre los valores en los bordes U_n:
+U^0_{n+1}     = G(U^0_n)
+U^{k+1}_{n+1} = G(U^{k+1}_n) + F(U^k_n) - G(U^k_n)
+
+Todos los F(U^k_n) de una iteracion son independientes y se calculan en
+un ProcessPoolExecutor. Tras k iteraciones los primeros k segmentos ya
+coinciden con la integracion RK4 secuencial, asi que el metodo converge a
+la precision del propagador fino en a lo sumo N iteraciones; en la practica
+bastan unas pocas.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Salida_Densa import interpolar_lineal
+
+
+def _propagar_fino(argumentos):
+    """
+    Propagador fino F: integra un segmento con RK4 y retorna sus nodos.
+
+    Es una funcion de modulo para poder ejecutarse en un proceso hijo.
+
+    Retorna:
+    --------
+    array : P en los m+1 nodos del segmento, empezando en U
+    """
+    beta0, alpha, t_inicio, U, h, m = argumentos
+    f = ModeloTumorAnalitico(U, beta0, alpha).f
+
+    P = np.empty(m + 1)
+    P[0] = U
+    for i in range(m):
+        P[i + 1] = ModeloTumorRK4.paso(f, t_inicio + i * h, P[i], h)
+    return P
+
+
+class ModeloTumorParareal(ModeloTumorBase):
+    """
+    Resolucion del modelo de tumor con Parareal (Euler grueso + RK4 fino).
+
+    El resultado converge a la solucion de ModeloTumorRK4 con h = h_fino
+    (Error global: O(h_fino^4)), pero el trabajo del propagador fino se
+    reparte entre procesos.
+
+    Atributos adicionales:
+    ---------------------
+    h_fino : float
+        Paso del propagador fino (ajustado para que divida cada segmento)
+    h_grueso : float
+        Paso del propagador grueso (ajustado igual)
+    t_max : float
+        Tiempo maximo de integracion
+    n_segmentos : int
+        Numero de segmentos temporales N
+    T_bordes : array
+        Bordes de los segmentos T_0, ..., T_N
+    U : array
+        Valores de P en los bordes tras la ultima iteracion
+    iteraciones : int
+        Iteraciones de Parareal realizadas
+    historial : list of dict
+        Por iteracion: 'iteracion', 'cambio' (maximo cambio relativo en los
+        bordes), 'tiempo_s' (acumulado) y 'aceleracion' (estimada con las
+        evaluaciones de f frente a RK4 secuencial)
+    """
+
+    def __init__(self, P0, beta0, alpha, h_fino=0.001, h_grueso=0.1, t_max=10.0,
+                 n_segmentos=None, n_procesos=None, tol=1e-12, max_iter=None):
+        """
+        Inicializa el modelo y ejecuta Parareal.
+
+        Parametros:
+        -----------
+        P0 : float
+            Poblacion inicial
+        beta0 : float
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float
+            Tasa de decrecimiento exponencial (alpha)
+        h_fino : float, opcional
+            Paso de RK4 en el propagador fino (default: 0.001)
+        h_grueso : float, opcional
+            Paso de Euler en el propagador grueso (default: 0.1)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        n_segmentos : int, opcional
+            Segmentos temporales (default: numero de CPUs)
+        n_procesos : int, opcional
+            Procesos para el propagador fino; 1 ejecuta en serie
+            (default: n_segmentos, limitado al numero de CPUs)
+        tol : float, opcional
+            Cambio relativo maximo en los bordes para detenerse (default: 1e-12)
+        max_iter : int, opcional
+            Maximo de iteraciones (default: n_segmentos, con el que Parareal
+            es exacto)
+        """
+        cpus = os.cpu_count() or 1
+        n_segmentos = n_segmentos or cpus
+
+        super().__init__(P0, beta0, alpha,
+                         nombre=f"Parareal RK4/Euler (h={h_fino}, N={n_segmentos})")
+        self.t_max = t_max
+        self.n_segmentos = n_segmentos
+        self.n_procesos = max(1, min(n_procesos or cpus, n_segmentos))
+        self.tol = tol
+        self.max_iter = n_segmentos if max_iter is None else max_iter
+
+        # Pasos por segmento: h se ajusta para que cada segmento tenga un numero entero
+        delta = t_max / n_segmentos
+        self.m_fino = max(1, int(round(delta / h_fino)))
+        self.m_grueso = max(1, int(round(delta / h_grueso)))
+        self.h_fino = delta / self.m_fino
+        self.h_grueso = delta / self.m_grueso
+        self.h = self.h_fino
+        self.T_bordes = delta * np.arange(n_segmentos + 1)
+
+        # Precalcular la solucion
+        inicio = time.perf_counter()
+        self.t_vals, self.P_vals = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    def _propagar_grueso(self, n, U):
+        """
+        Propagador grueso G: Euler sobre el segmento n partiendo de U.
+
+        Parametros:
+        -----------
+        n : int
+            Indice del segmento
+        U : float
+            Valor inicial en T_n
+
+        Retorna:
+        --------
+        float : Aproximacion de P(T_{n+1})
+        """
+        P = U
+        for i in range(self.m_grueso):
+            P = ModeloTumorEuler.paso(self.f, self.T_bordes[n] + i * self.h_grueso, P, self.h_grueso)
+        return P
+
+    def _integrar(self):
+        """
+        Ejecuta las iteraciones de Parareal.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos de la malla fina
+            P_vals : array de poblaciones
+        """
+        N = self.n_segmentos
+        evals_fino_segmento = 4 * self.m_fino
+        evals_serie = N * evals_fino_segmento
+        evaluaciones = 0
+        inicio = time.perf_counter()
+
+        # Prediccion inicial: barrido grueso secuencial
+        U = np.empty(N + 1)
+        U[0] = self.P0
+        G_ant = np.empty(N)
+        for n in range(N):
+            G_ant[n] = self._propagar_grueso(n, U[n])
+            U[n + 1] = G_ant[n]
+        evaluaciones += N * self.m_grueso
+
+        ejecutor = ProcessPoolExecutor(max_workers=self.n_procesos) if self.n_procesos > 1 else None
+        segmentos = [None] * N
+        self.historial = []
+        costo_paralelo = N * self.m_grueso
+
+        try:
+            for k in range(self.max_iter):
+                # Los segmentos n < k ya son exactos: solo se propagan los demas
+                tareas = [(self.beta0, self.alpha, self.T_bordes[n], U[n], self.h_fino, self.m_fino)
+                          for n in range(k, N)]
+                if ejecutor is None:
+                    resultados = [_propagar_fino(tarea) for tarea in tareas]
+                else:
+                    resultados = list(ejecutor.map(_propagar_fino, tareas))
+                for n, P_segmento in zip(range(k, N), resultados):
+                    segmentos[n] = P_segmento
+                F = np.array([segmentos[n][-1] for n in range(N)])
+                evaluaciones += len(tareas) * evals_fino_segmento
+
+                # Correccion secuencial: U_{n+1} = G(U_n nuevo) + F(U_n) - G(U_n)
+                U_nuevo = U.copy()
+                for n in range(k, N):
+                    G_nuevo = self._propagar_grueso(n, U_nuevo[n])
+                    U_nuevo[n + 1] = G_nuevo + F[n] - G_ant[n]
+                    G_ant[n] = G_nuevo
+                evaluaciones += (N - k) * self.m_grueso
+
+                cambio = np.max(np.abs(U_nuevo - U) / np.abs(U_nuevo))
+                U = U_nuevo
+
+                # Costo en el camino critico: tandas de segmentos finos por proceso + barrido grueso
+                tandas = -(-len(tareas) // self.n_procesos)
+                costo_paralelo += tandas * evals_fino_segmento + (N - k) * self.m_grueso
+                self.historial.append({
+                    'iteracion': k + 1,
+                    'cambio': cambio,
+                    'tiempo_s': time.perf_counter() - inicio,
+                    'aceleracion': evals_serie / costo_paralelo,
+                })
+
+                if cambio <= self.tol:
+                    break
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
+
+        self.U = U
+        self.iteraciones = len(self.historial)
+        self.pasos = N * self.m_fino
+        self.evaluaciones_f = evaluaciones
+
+        # Trayectoria fina: los segmentos de la ultima pasada, sin repetir los bordes
+        t_vals = self.h_fino * np.arange(self.pasos + 1)
+        P_vals = np.concatenate([segmentos[0]] + [s[1:] for s in segmentos[1:]])
+
+        return t_vals, P_vals
+
+    def resolver(self, t):
+        """
+        Retorna la aproximacion de P(t) obtenida con Parareal.
+
+        Interpola linealmente entre los valores de la malla fina.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t) aproximado
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(t)
+
+        # Interpolar valores
+        P = interpolar_lineal(t, self.t_vals, self.P_vals)
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def obtener_trayectoria(self):
+        """
+        Retorna la trayectoria completa en la malla fina.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de poblaciones
+        """
+        return self.t_vals, self.P_vals
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, beta0={self.beta0}, alpha={self.alpha}\n"
+                f"  h_fino={self.h_fino:g}, h_grueso={self.h_grueso:g}, t_max={self.t_max}\n"
+                f"  Segmentos: {self.n_segmentos}, procesos: {self.n_procesos}, "
+                f"iteraciones: {self.iteraciones}\n"
+                f"  Limite asintotico teorico: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    print("=== Parareal (Euler grueso + RK4 fino) para Modelo de Tumor ===\n")
+
+    h_fino = 2e-5
+    n_procesos = min(8, os.cpu_count() or 1)
+
+    # Referencia: RK4 secuencial con el mismo paso fino
+    serie = ModeloTumorRK4(P0=100, beta0=2.0, alpha=0.5, h=h_fino)
+    print(f"RK4 secuencial: {serie.pasos} pasos en {serie.tiempo_integracion:.2f} s\n")
+
+    modelo = ModeloTumorParareal(P0=100, beta0=2.0, alpha=0.5, h_fino=h_fino, h_grueso=0.1,
+                                 n_segmentos=2 * n_procesos, n_procesos=n_procesos)
+    print(modelo)
+    print()
+
+    t_nodos = np.linspace(0, 10, 11)
+    P_serie = serie.resolver(t_nodos)
+    print(f"{'Iter':>4} {'Cambio bordes':>14} {'Tiempo (s)':>11} {'Acel. teorica':>14} {'Acel. medida':>13}")
+    print("-" * 60)
+    for registro in modelo.historial:
+        print(f"{registro['iteracion']:4d} {registro['cambio']:14.3e} {registro['tiempo_s']:11.2f} "
+              f"{registro['aceleracion']:14.2f} {serie.tiempo_integracion / registro['tiempo_s']:13.2f}")
+
+    diferencia = np.max(np.abs(modelo.resolver(t_nodos) - P_serie) / P_serie)
+    print(f"\nDiferencia relativa maxima con RK4 secuencial: {diferencia:.3e}")
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo Espacial de Tumor - Reaccion-Difusion por el Metodo de Lineas
+
+Densidad tumoral u(x, t) en 1-D o 2-D con crecimiento del modelo base:
+
+u_t = D * Laplaciano(u) + r(t) * u,    r(t) = beta_0 * e^(-alpha*t)
+
+con flujo nulo en el borde (Neumann). Discretizando el espacio en celdas
+de lado dx (metodo de lineas) queda un sistema de EDOs u' = D L u + r(t) u
+de tamano n (1-D) o ny*nx (2-D) que se avanza con el paso estatico de los
+metodos existentes (RK4 por defecto); L es el estencil de 3 (1-D) o 5
+(2-D) puntos aplicado con rebanadas de numpy sobre toda la malla.
+
+Solo se reutiliza el paso fijo paso(f, t, y, h) de los metodos de un paso
+(Euler, RK4); los integradores adaptativos o multipaso (ModeloTumorScipy,
+ABM4) no se admiten como metodo_numerico, porque la malla temporal fija
+es la que permite guardar los campos y aplicar e^(h D lambda) en IMEX.
+
+Esquemas temporales:
+    'explicito' : u_{n+1} = paso(D L u + r u). Estable solo si
+                  h <= c * dx^2 / (2 * d * D) (c = 2 para Euler, 2.785 para
+                  RK4, d = dimension); ver paso_maximo_estable()
+    'imex'      : la difusion se trata de forma implicita y la reaccion con
+                  el paso explicito. L es diagonal en la base de la DCT-II
+                  (lambda_k = -4/dx^2 sin^2(pi k / 2n) por eje), asi que la
+                  difusion de un paso es exacta: u_hat *= e^(h D lambda_k).
+                  No hay limite de estabilidad por dx y, como r(t) u conmuta
+                  con L, la separacion no introduce error: el unico error
+                  temporal es el del paso explicito de la reaccion.
+
+La masa total M(t) = sum(u) * dx^d cumple dM/dt = r(t) M (la difusion con
+flujo nulo la conserva), de modo que resolver(t) retorna M(t) y el modelo
+se compara directamente con la solucion analitica del modelo escalar.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from scipy.fft import dctn, idctn
+from ModeloTumorBase import ModeloTumorBase, metodo_de_un_paso
+from ModeloTumorRK4 import ModeloTumorRK4
+from Salida_Densa import interpolar_lineal
+
+
+# Semieje real de la region de estabilidad absoluta segun el orden del metodo
+INTERVALO_ESTABILIDAD = {1: 2.0, 4: 2.785}
+
+
+def laplaciano(u, dx):
+    """
+    Laplaciano discreto con flujo nulo en el borde (1-D o 2-D).
+
+    Estencil centrado de 3 o 5 puntos; la celda fantasma de cada borde
+    repite el valor de la celda vecina, de modo que sum(L u) = 0.
+
+    Parametros:
+    -----------
+    u : array_like
+        Densidad en las celdas, forma (n,) o (ny, nx)
+    dx : float
+        Lado de la celda
+
+    Retorna:
+    --------
+    array : L u con la misma forma que u
+    """
+    u_ext = np.pad(u, 1, mode='edge')
+    centro = (slice(1, -1),) * u.ndim
+    resultado = -2 * u.ndim * u
+    for eje in range(u.ndim):
+        adelante = list(centro)
+        atras = list(centro)
+        adelante[eje] = slice(2, None)
+        atras[eje] = slice(None, -2)
+        resultado = resultado + u_ext[tuple(adelante)] + u_ext[tuple(atras)]
+    return resultado / dx**2
+
+
+def autovalores_laplaciano(forma, dx):
+    """
+    Autovalores del laplaciano con flujo nulo en la base de la DCT-II.
+
+    lambda_{k1,...,kd} = sum_eje -4/dx^2 * sin^2(pi k_eje / (2 n_eje))
+
+    Parametros:
+    -----------
+    forma : tuple
+        Forma de la malla, (n,) o (ny, nx)
+    dx : float
+        Lado de la celda
+
+    Retorna:
+    --------
+    array : Autovalores con la forma de la malla
+    """
+    lam = np.zeros(forma)
+    for eje, n in enumerate(forma):
+        forma_eje = [1] * len(forma)
+        forma_eje[eje] = n
+        lam = lam - 4 / dx**2 * np.sin(np.pi * np.arange(n) / (2 * n)).reshape(forma_eje)**2
+    return lam
+
+
+class ModeloTumorReaccionDifusion(ModeloTumorBase):
+    """
+    Densidad tumoral espacial u_t = D Laplaciano(u) + r(t) u (Neumann).
+
+    resolver(t) retorna la masa total M(t) (comparable con los modelos
+    escalares); resolver_campo(t) retorna la densidad u(x, t).
+
+    Atributos adicionales:
+    ---------------------
+    u0 : array
+        Densidad inicial, forma (n,) o (ny, nx)
+    D : float
+        Coeficiente de difusion
+    dx : float
+        Lado de la celda
+    h : float
+        Tamano de paso temporal
+    t_max : float
+        Tiempo maximo de integracion
+    esquema : str
+        'explicito' o 'imex'
+    metodo_numerico : type
+        Clase cuyo paso estatico se usa (ModeloTumorRK4 por defecto)
+    t_vals, P_vals : array
+        Tiempos de la malla y masa total en cada uno
+    t_campos, campos : array
+        Tiempos guardados y densidad en cada uno, forma (n_campos,) + u0.shape
+    """
+
+    salida_densa = 'lineal'
+
+    def __init__(self, u0, D, beta0, alpha, dx=1.0, h=0.01, t_max=10.0, esquema='explicito',
+                 metodo_numerico=ModeloTumorRK4, n_campos=11):
+        """
+        Inicializa el modelo y precalcula la solucion.
+
+        Parametros:
+        -----------
+        u0 : array_like
+            Densidad inicial en las celdas, forma (n,) o (ny, nx)
+        D : float
+            Coeficiente de difusion (>= 0)
+        beta0 : float
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float
+            Tasa de decrecimiento exponencial (alpha)
+        dx : float, opcional
+            Lado de la celda (default: 1.0)
+        h : float, opcional
+            Tamano de paso (default: 0.01)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        esquema : str, opcional
+            'explicito' o 'imex' (default: 'explicito')
+        metodo_numerico : type, opcional
+            Clase con metodo estatico paso(f, t, y, h) y evaluaciones_por_paso
+            (default: ModeloTumorRK4)
+        n_campos : int, opcional
+            Densidades guardadas, equiespaciadas en [0, t_max], al menos 2
+            (default: 11)
+        """
+        self.u0 = np.asarray(u0, dtype=float)
+        if self.u0.ndim not in (1, 2):
+            raise ValueError("u0 debe ser un arreglo 1-D o 2-D")
+        if esquema not in ('explicito', 'imex'):
+            raise ValueError("esquema debe ser 'explicito' o 'imex'")
+        if not h > 0:
+            raise ValueError("h debe ser positivo")
+        if not t_max >= h:
+            raise ValueError("t_max debe ser al menos h (un paso completo)")
+        if n_campos < 2:
+            raise ValueError("n_campos debe ser al menos 2 (se guardan t=0 y t=t_max)")
+        metodo_de_un_paso(metodo_numerico)
+
+        self.D = D
+        self.dx = dx
+        self.h = h
+        self.t_max = t_max
+        self.esquema = esquema
+        self.metodo_numerico = metodo_numerico
+        self.n_campos = n_campos
+
+        malla = 'x'.join(str(n) for n in self.u0.shape)
+        super().__init__(self.u0.sum() * dx**self.u0.ndim, beta0, alpha,
+                         nombre=f"Reaccion-difusion {malla} ({esquema}, h={h})")
+
+        if esquema == 'explicito' and h > self.paso_maximo_estable():
+            raise ValueError(f"h={h} excede el paso estable {self.paso_maximo_estable():.3e} "
+                             f"del esquema explicito; usar esquema='imex'")
+
+        # Precalcular la solucion numerica
+        inicio = time.perf_counter()
+        self.t_vals, self.P_vals = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    def paso_maximo_estable(self):
+        """
+        Mayor h estable del esquema explicito para la difusion.
+
+        El autovalor mas negativo de D L es -4 d D / dx^2, y el paso debe
+        dejarlo dentro del intervalo real de estabilidad del metodo.
+
+        Retorna:
+        --------
+        float : h maximo (np.inf si D = 0)
+        """
+        orden = getattr(self.metodo_numerico, 'orden', 1)
+        rigidez = 4 * self.u0.ndim * self.D / self.dx**2
+        return INTERVALO_ESTABILIDAD.get(orden, 2.0) / rigidez if rigidez > 0 else np.inf
+
+    def f(self, t, u):
+        """
+        Lado derecho del metodo de lineas: D L u + r(t) u
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        u : array_like
+            Densidad en las celdas
+
+        Retorna:
+        --------
+        array : du/dt
+        """
+        return self.D * laplaciano(u, self.dx) + self.tasa_crecimiento(t) * u
+
+    def reaccion(self, t, u):
+        """
+        Parte explicita del esquema IMEX: r(t) u
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        u : array_like
+            Densidad (o sus coeficientes DCT)
+
+        Retorna:
+        --------
+        array : r(t) u
+        """
+        return self.tasa_crecimiento(t) * u
+
+    def _integrar(self):
+        """
+        Integra la malla desde t=0 hasta t=t_max.
+
+        En modo IMEX el estado se mantiene en la base de la DCT: la difusion
+        es un producto por e^(h D lambda), la reaccion (lineal y escalar) se
+        aplica igual a los coeficientes, y solo se vuelve al espacio fisico
+        para guardar los campos. La masa es el coeficiente constante.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            t_vals : array de tiempos
+            P_vals : array de masas totales
+        """
+        # Crear malla temporal
+        t_vals = np.arange(0, self.t_max + self.h, self.h)
+        n_pasos = len(t_vals) - 1
+        guardar = np.unique(np.round(np.linspace(0, n_pasos, self.n_campos)).astype(int))
+        area = self.dx**self.u0.ndim
+        paso, evaluaciones_por_paso = metodo_de_un_paso(self.metodo_numerico)
+
+        self.t_campos = t_vals[guardar]
+        self.campos = np.empty((len(guardar),) + self.u0.shape)
+        P_vals = np.empty(len(t_vals))
+
+        if self.esquema == 'explicito':
+            u = self.u0
+            P_vals[0] = u.sum() * area
+            for i in range(n_pasos):
+                u = paso(self.f, t_vals[i], u, self.h)
+                P_vals[i + 1] = u.sum() * area
+                if i + 1 in guardar:
+                    self.campos[np.searchsorted(guardar, i + 1)] = u
+        else:
+            # Difusion exacta de un paso en la base de la DCT
+            difusion = np.exp(self.h * self.D * autovalores_laplaciano(self.u0.shape, self.dx))
+            # Masa = coeficiente constante * sqrt(numero de celdas) * area (norma ortonormal)
+            escala_masa = np.sqrt(self.u0.size) * area
+            u_hat = dctn(self.u0, type=2, norm='ortho')
+            P_vals[0] = u_hat.flat[0] * escala_masa
+            for i in range(n_pasos):
+                u_hat = paso(self.reaccion, t_vals[i], difusion * u_hat, self.h)
+                P_vals[i + 1] = u_hat.flat[0] * escala_masa
+                if i + 1 in guardar:
+                    self.campos[np.searchsorted(guardar, i + 1)] = idctn(u_hat, type=2, norm='ortho')
+
+        self.campos[0] = self.u0
+        self.pasos = n_pasos
+        self.evaluaciones_f = evaluaciones_por_paso * n_pasos
+
+        return t_vals, P_vals
+
+    def resolver(self, t):
+        """
+        Retorna la masa total M(t) = integral de u(x, t) dx.
+
+        Interpola linealmente entre los valores precalculados.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : M(t) aproximada
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(t)
+
+        # Interpolar valores
+        P = interpolar_lineal(t, self.t_vals, self.P_vals)
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def resolver_campo(self, t):
+        """
+        Retorna la densidad u(x, t).
+
+        Interpola linealmente en el tiempo entre los campos guardados; en
+        los tiempos de t_campos el resultado es el de la integracion.
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo en [0, t_max]
+
+        Retorna:
+        --------
+        array : u(x, t), con la forma de u0
+        """
+        k = np.clip(np.searchsorted(self.t_campos, t) - 1, 0, len(self.t_campos) - 2)
+        t_a, t_b = self.t_campos[k], self.t_campos[k + 1]
+        peso = np.clip((t - t_a) / (t_b - t_a), 0.0, 1.0)
+        return (1 - peso) * self.campos[k] + peso * self.campos[k + 1]
+
+    def obtener_trayectoria(self):
+        """
+        Retorna la masa total en todos los nodos temporales.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+        """
+        return self.t_vals, self.P_vals
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  D={self.D}, dx={self.dx}, beta0={self.beta0}, alpha={self.alpha}\n"
+                f"  Masa inicial: {self.P0:.4f}, pasos: {self.pasos}\n"
+                f"  Paso explicito maximo estable: {self.paso_maximo_estable():.3e}")
+
+
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+    print("=== Modelo de Reaccion-Difusion (Metodo de Lineas) ===\n")
+
+    beta0, alpha, D = 2.0, 0.5, 1e-3
+
+    # 1. 1-D: modo coseno, cuya solucion semidiscreta es exacta:
+    # u = (1 + cos(pi x)) -> (1 + e^(D lambda_1 t) cos(pi x)) * P(t)/P0
+    n = 200
+    dx = 1.0 / n
+    x = (np.arange(n) + 0.5) * dx
+    u0 = 1 + np.cos(np.pi * x)
+    lambda_1 = -4 / dx**2 * np.sin(np.pi / (2 * n))**2
+    crecimiento = ModeloTumorAnalitico(1.0, beta0, alpha).resolver(10.0)
+    exacta = (1 + np.exp(D * lambda_1 * 10.0) * np.cos(np.pi * x)) * crecimiento
+    for esquema, h in [('explicito', 0.01), ('imex', 0.01), ('imex', 0.1)]:
+        modelo = ModeloTumorReaccionDifusion(u0, D, beta0, alpha, dx=dx, h=h, esquema=esquema)
+        error = np.max(np.abs(modelo.resolver_campo(10.0) / exacta - 1))
+        print(f"1-D {esquema:>9} h={h:<5}: error relativo en t=10 = {error:.2e}, "
+              f"{modelo.pasos} pasos en {modelo.tiempo_integracion:.3f} s")
+
+    # La masa total sigue al modelo escalar
+    analitico = ModeloTumorAnalitico(modelo.P0, beta0, alpha)
+    t = np.linspace(0, 10, 6)
+    print(f"Masa vs solucion analitica: error relativo maximo = "
+          f"{np.max(np.abs(modelo.resolver(t) / analitico.resolver(t) - 1)):.2e}\n")
+
+    # 2. 2-D 512x512: dos focos tumorales gaussianos
+    n = 512
+    dx = 1.0 / n
+    y, x = np.meshgrid((np.arange(n) + 0.5) * dx, (np.arange(n) + 0.5) * dx, indexing='ij')
+    u0 = (np.exp(-((x - 0.35)**2 + (y - 0.4)**2) / 0.002)
+          + 0.5 * np.exp(-((x - 0.7)**2 + (y - 0.65)**2) / 0.001))
+
+    modelo = ModeloTumorReaccionDifusion(u0, D, beta0, alpha, dx=dx, h=0.05, esquema='imex')
+    print(modelo)
+    print(f"2-D {n}x{n} IMEX h=0.05: {modelo.pasos} pasos en {modelo.tiempo_integracion:.2f} s "
+          f"(explicito necesitaria {int(np.ceil(10 / modelo.paso_maximo_estable()))} pasos)")
+    try:
+        ModeloTumorReaccionDifusion(u0, D, beta0, alpha, dx=dx, h=0.05, esquema='explicito')
+    except ValueError as e:
+        print(f"Explicito con h=0.05: {e}")
+
+    fig, ejes = plt.subplots(1, 3, figsize=(15, 5))
+    for ax, t_k in zip(ejes, [0.0, 2.0, 10.0]):
+        imagen = ax.imshow(modelo.resolver_campo(t_k), origin='lower', extent=(0, 1, 0, 1),
+                           cmap='magma')
+        ax.set_title(f't = {t_k}, masa = {modelo.resolver(t_k):.4f}', fontsize=12)
+        fig.colorbar(imagen, ax=ax, shrink=0.8)
+    fig.suptitle('Densidad tumoral u(x, y, t)', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor - Adaptador de scipy.integrate.solve_ivp
+
+Envuelve los integradores de SciPy (RK45, DOP853, LSODA, Radau, BDF, ...)
+detras de la misma interfaz que los metodos propios (resolver,
+obtener_trayectoria, tiempo_umbral, estadisticas_trabajo), para validar
+Euler/RK4/ABM4 contra implementaciones maduras y usar las mismas graficas.
+
+Detalles del adaptador:
+- f se pasa con vectorized=True: la EDO es lineal en P y f ya opera sobre
+  arrays, asi que cualquier columna de estados se evalua en una llamada.
+- P0, beta0 y alpha pueden ser arrays (lote): el estado de solve_ivp es el
+  lote aplanado y resolver/obtener_trayectoria lo devuelven con la forma
+  del lote, tras el eje del tiempo (como ModeloTumorEuler).
+- Los metodos implicitos (Radau, BDF, LSODA) reciben el jacobiano exacto
+  df/dP = beta_0 * e^(-alpha*t), de modo que no gastan evaluaciones de f
+  en diferencias finitas y nfev es comparable con los metodos propios.
+- resolver(t) usa dense_output (el interpolante propio de cada metodo),
+  no una interpolacion lineal entre pasos.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.sparse import diags
+from ModeloTumorBase import ModeloTumorBase
+from Salida_Densa import tiempos_cruce
+
+
+class ModeloTumorScipy(ModeloTumorBase):
+    """
+    Resolucion del modelo de tumor con scipy.integrate.solve_ivp.
+
+    Atributos adicionales:
+    ---------------------
+    metodo : str
+        Integrador de solve_ivp ('RK45', 'DOP853', 'LSODA', 'Radau', ...)
+    rtol, atol : float
+        Tolerancias relativa y absoluta del control de paso
+    t_max : float
+        Tiempo maximo de integracion
+    forma : tuple
+        Forma del lote (broadcast de P0, beta0 y alpha); () si son escalares
+    solucion : OdeResult
+        Resultado completo de solve_ivp (sol, t, y, nfev, njev, nlu, ...)
+    evaluaciones_jacobiano : int
+        Evaluaciones del jacobiano (njev)
+    factorizaciones_lu : int
+        Factorizaciones LU (nlu)
+    """
+
+    def __init__(self, P0, beta0, alpha, metodo='RK45', rtol=1e-6, atol=1e-9, t_max=10.0):
+        """
+        Inicializa el modelo e integra con solve_ivp.
+
+        Parametros:
+        -----------
+        P0 : float or array_like
+            Poblacion inicial
+        beta0 : float or array_like
+            Tasa de crecimiento inicial (beta_0)
+        alpha : float or array_like
+            Tasa de decrecimiento exponencial (alpha)
+        metodo : str, opcional
+            Integrador de solve_ivp (default: 'RK45')
+        rtol : float, opcional
+            Tolerancia relativa (default: 1e-6)
+        atol : float, opcional
+            Tolerancia absoluta (default: 1e-9)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        """
+        super().__init__(P0, beta0, alpha, nombre=f"SciPy {metodo} (rtol={rtol:g})")
+        self.metodo = metodo
+        self.rtol = rtol
+        self.atol = atol
+        self.t_max = t_max
+        self.forma = np.broadcast(P0, beta0, alpha).shape
+
+        # Precalcular la solucion numerica
+        inicio = time.perf_counter()
+        self.solucion = self._integrar()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    @classmethod
+    def con_tolerancia(cls, P0, beta0, alpha, tol, t_max=10.0, **kwargs):
+        """
+        Crea el modelo con rtol = tol (el control de paso de SciPy elige h).
+
+        Parametros:
+        -----------
+        P0, beta0, alpha : float
+            Parametros del modelo
+        tol : float
+            Error relativo deseado
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        **kwargs :
+            Argumentos adicionales del constructor (p. ej. metodo='DOP853')
+
+        Retorna:
+        --------
+        ModeloTumorScipy : Instancia resuelta
+        """
+        return cls(P0, beta0, alpha, rtol=tol, t_max=t_max, **kwargs)
+
+    def _f_lote(self, t, y):
+        """
+        Lado derecho sobre el estado aplanado de solve_ivp, forma (m, k).
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        y : array
+            Columnas de estados del lote aplanado
+
+        Retorna:
+        --------
+        array : dP/dt con la forma de y
+        """
+        r = np.broadcast_to(self.tasa_crecimiento(t), self.forma).reshape(-1, 1)
+        return r * y
+
+    def jacobiano_f(self, t, P):
+        """
+        Jacobiano del lado derecho respecto al estado, df/dP = beta_0 * e^(-alpha*t).
+
+        Es la derivada que usan los integradores implicitos, no la
+        sensibilidad dP/d(P0, beta0, alpha) de ModeloTumorAnalitico.jacobiano.
+        Como cada P del lote evoluciona por separado, es diagonal.
+
+        Parametros:
+        -----------
+        t : float
+            Tiempo
+        P : array_like
+            Estado (no se usa: la EDO es lineal)
+
+        Retorna:
+        --------
+        array or sparse matrix : [[df/dP]] (1x1) para un P0 escalar; matriz
+                                 dispersa diagonal (m x m) para un lote de m
+        """
+        r = np.broadcast_to(self.tasa_crecimiento(t), self.forma).ravel()
+        if r.size == 1:
+            return r.reshape(1, 1)
+        return diags(r, format='csc')
+
+    def _integrar(self):
+        """
+        Integra la EDO con solve_ivp desde t=0 hasta t=t_max.
+
+        Retorna:
+        --------
+        OdeResult : Resultado de solve_ivp con dense_output
+        """
+        # Solo los metodos implicitos aceptan jac (los explicitos lo rechazan con aviso)
+        opciones = {'jac': self.jacobiano_f} if self.metodo in ('Radau', 'BDF', 'LSODA') else {}
+        y0 = np.broadcast_to(self.P0, self.forma).astype(float).ravel()
+        solucion = solve_ivp(self._f_lote, (0.0, self.t_max), y0, method=self.metodo,
+                             rtol=self.rtol, atol=self.atol, vectorized=True, dense_output=True,
+                             **opciones)
+        if not solucion.success:
+            raise RuntimeError(f"solve_ivp ({self.metodo}) fallo: {solucion.message}")
+
+        self.pasos = len(solucion.t) - 1
+        self.evaluaciones_f = solucion.nfev
+        self.evaluaciones_jacobiano = solucion.njev
+        self.factorizaciones_lu = solucion.nlu
+
+        return solucion
+
+    def resolver(self, t):
+        """
+        Retorna P(t) con la salida densa del integrador.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) en [0, t_max]
+
+        Retorna:
+        --------
+        float or array_like : P(t) aproximado, forma t.shape + forma del lote
+        """
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+
+        P = self.solucion.sol(t.ravel()).T.reshape(t.shape + self.forma)
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def obtener_trayectoria(self):
+        """
+        Retorna los pasos aceptados por el integrador.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+            P_vals tiene forma (len(t_vals),) + forma del lote
+        """
+        t_vals = self.solucion.t
+        return t_vals, self.solucion.y.T.reshape(t_vals.shape + self.forma)
+
+    def tiempo_umbral(self, umbrales, subdivisiones=16):
+        """
+        Calcula el primer tiempo en que P(t) alcanza cada umbral.
+
+        Los pasos de los metodos adaptativos son largos (DOP853 cubre [0, 10]
+        en ~15 pasos), asi que el cruce se busca sobre la salida densa
+        evaluada en subdivisiones puntos por paso, no sobre los nodos.
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+        subdivisiones : int, opcional
+            Puntos de salida densa por paso aceptado (default: 16)
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce (np.inf si no se alcanzan en [0, t_max])
+        """
+        if self.forma != ():
+            raise ValueError("tiempo_umbral requiere P0, beta0 y alpha escalares (no un lote)")
+        t_nodos = self.solucion.t
+        s = np.linspace(0, 1, subdivisiones, endpoint=False)
+        t_vals = np.append((t_nodos[:-1, None] + s * np.diff(t_nodos)[:, None]).ravel(), t_nodos[-1])
+        P_vals = self.resolver(t_vals)
+        return tiempos_cruce(t_vals, P_vals, umbrales, self.f(t_vals, P_vals))
+
+    def estadisticas_trabajo(self):
+        """
+        Costo de la integracion, con jacobianos y factorizaciones LU.
+
+        Retorna:
+        --------
+        dict : Claves de ModeloTumorBase.estadisticas_trabajo mas
+               'evaluaciones_jacobiano' y 'factorizaciones_lu'
+        """
+        stats = super().estadisticas_trabajo()
+        stats['evaluaciones_jacobiano'] = self.evaluaciones_jacobiano
+        stats['factorizaciones_lu'] = self.factorizaciones_lu
+        return stats
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, beta0={self.beta0}, alpha={self.alpha}\n"
+                f"  rtol={self.rtol}, atol={self.atol}, t_max={self.t_max}\n"
+                f"  Pasos aceptados: {self.pasos}, evaluaciones de f: {self.evaluaciones_f}\n"
+                f"  Limite asintotico teorico: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorRK4 import ModeloTumorRK4
+    from ModeloTumorABM4 import ModeloTumorABM4
+
+    print("=== Integradores de SciPy vs Metodos Propios ===\n")
+
+    P0, beta0, alpha = 100, 2.0, 0.5
+    analitico = ModeloTumorAnalitico(P0, beta0, alpha)
+    # Nodos de la malla de RK4/ABM4 (h=0.05): sin error de interpolacion lineal
+    t = np.linspace(0, 10, 201)
+    P_exacta = analitico.resolver(t)
+
+    modelos = [ModeloTumorScipy(P0, beta0, alpha, metodo=m, rtol=1e-8, atol=1e-8)
+               for m in ['RK45', 'DOP853', 'LSODA', 'Radau', 'BDF']]
+    modelos += [ModeloTumorRK4(P0, beta0, alpha, h=0.05), ModeloTumorABM4(P0, beta0, alpha, h=0.05)]
+
+    print(f"{'Metodo':<30} {'Error rel.':>11} {'Pasos':>7} {'Eval. f':>8} {'Tiempo (ms)':>12}")
+    for modelo in modelos:
+        stats = modelo.estadisticas_trabajo()
+        error = np.max(np.abs(modelo.resolver(t) / P_exacta - 1))
+        print(f"{stats['metodo']:<30} {error:11.2e} {stats['pasos']:7d} {stats['evaluaciones_f']:8d} "
+              f"{stats['tiempo_s'] * 1000:12.2f}")
+
+    # Tiempo de umbral con la misma interfaz
+    dop = modelos[1]
+    print(f"\nTiempo hasta 0.95*P_inf: DOP853 {dop.tiempo_fraccion_limite(0.95):.8f}, "
+          f"analitico {analitico.tiempo_fraccion_limite(0.95):.8f}")
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de Tumor con Protocolo de Tratamiento por Tramos
+
+Un protocolo cambia beta_0 y alpha en los tiempos de dosis y puede aplicar
+eventos de muerte multiplicativos (P -> s_k * P). En el tramo k,
+[tau_k, tau_{k+1}), la tasa es
+
+r(t) = beta_k * e^(-alpha_k * t)        (t absoluto)
+
+y la solucion del tramo es cerrada:
+
+log P(t) = log P(tau_k) + beta_k/alpha_k * (e^(-alpha_k tau_k) - e^(-alpha_k t))
+
+Los valores en los bordes se obtienen con una suma acumulada de los
+incrementos de todos los tramos (mas log s_k), sin malla global: un
+protocolo de miles de dosis se resuelve en una sola pasada vectorizada.
+Opcionalmente cada tramo se integra con el paso de un metodo numerico
+(ModeloTumorEuler, ModeloTumorRK4) para comparar.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase, metodo_de_un_paso
+
+
+def _integral_tramo(beta, alpha, a, b):
+    """
+    Calcula integral_a^b beta * e^(-alpha*s) ds, con el limite alpha -> 0.
+
+    Se escribe como beta * e^(-alpha*a) * (1 - e^(-alpha*(b-a))) / alpha
+    usando expm1 para no perder precision con alpha*(b-a) pequeno.
+    """
+    beta, alpha, a, b = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (beta, alpha, a, b)))
+    delta = b - a
+    with np.errstate(invalid='ignore', divide='ignore'):
+        factor = np.where(alpha != 0, -np.expm1(-alpha * delta) / alpha, delta)
+    return beta * np.exp(-alpha * a) * factor
+
+
+class ModeloTumorPorTramos(ModeloTumorBase):
+    """
+    Modelo de tumor con parametros constantes por tramos y eventos de muerte.
+
+    Tramo k: t en [tau_k, tau_{k+1}), parametros (beta_k, alpha_k); al inicio
+    del tramo P se multiplica por la supervivencia s_k (1 = sin muerte).
+    P(t) es continua por la derecha en los tau_k.
+
+    Atributos adicionales:
+    ---------------------
+    tiempos : array
+        Inicio de cada tramo tau_0 = 0 < tau_1 < ... < tau_{K-1}
+    beta0s, alphas : array
+        Parametros de cada tramo
+    supervivencia : array
+        Fraccion superviviente aplicada al inicio de cada tramo
+    t_max : float
+        Tiempo maximo (dominio de tiempo_umbral y de la trayectoria)
+    metodo_numerico : type or None
+        Clase cuyo paso estatico se usa por tramo; None usa la forma cerrada
+    logP_inicio, logP_fin : array
+        log P al inicio de cada tramo (tras la muerte) y al final (antes de
+        la siguiente)
+    """
+
+    def __init__(self, P0, tiempos, beta0s, alphas, supervivencia=None, t_max=10.0,
+                 metodo_numerico=None, h=0.01):
+        """
+        Inicializa el modelo y propaga el protocolo.
+
+        Parametros:
+        -----------
+        P0 : float
+            Poblacion inicial
+        tiempos : array_like
+            Inicio de cada tramo, crecientes y con tiempos[0] = 0
+        beta0s : float or array_like
+            beta_0 de cada tramo (un escalar se repite)
+        alphas : float or array_like
+            alpha de cada tramo (un escalar se repite)
+        supervivencia : array_like, opcional
+            Fraccion superviviente al inicio de cada tramo (default: sin muerte)
+        t_max : float, opcional
+            Tiempo maximo de simulacion (default: 10.0)
+        metodo_numerico : type, opcional
+            Clase con metodo estatico paso(f, t, y, h) y evaluaciones_por_paso,
+            p. ej. ModeloTumorRK4; None usa la solucion cerrada de cada tramo (default: None)
+        h : float, opcional
+            Paso maximo del metodo numerico; se ajusta a cada tramo (default: 0.01)
+        """
+        self.tiempos = np.asarray(tiempos, dtype=float)
+        K = len(self.tiempos)
+        self.beta0s = np.broadcast_to(np.asarray(beta0s, dtype=float), (K,)).copy()
+        self.alphas = np.broadcast_to(np.asarray(alphas, dtype=float), (K,)).copy()
+        self.supervivencia = (np.ones(K) if supervivencia is None
+                              else np.broadcast_to(np.asarray(supervivencia, dtype=float), (K,)).copy())
+
+        if self.tiempos[0] != 0 or np.any(np.diff(self.tiempos) <= 0):
+            raise ValueError("tiempos debe empezar en 0 y ser estrictamente creciente")
+        if np.any(self.supervivencia <= 0):
+            raise ValueError("supervivencia debe ser positiva")
+        if metodo_numerico is None:
+            metodo = 'cerrado'
+        else:
+            metodo_de_un_paso(metodo_numerico)
+            metodo = getattr(metodo_numerico, 'nombre_metodo', None) or metodo_numerico.__name__
+
+        super().__init__(P0, self.beta0s[0], self.alphas[0],
+                         nombre=f"Por tramos ({K} tramos, {metodo})")
+        self.t_max = t_max
+        self.metodo_numerico = metodo_numerico
+        self.h = h
+
+        # Fin de cada tramo: el inicio del siguiente (el ultimo llega a t_max)
+        self.tiempos_fin = np.append(self.tiempos[1:], max(t_max, self.tiempos[-1]))
+
+        # Propagar el protocolo
+        inicio = time.perf_counter()
+        if metodo_numerico is None:
+            self._propagar_cerrado()
+        else:
+            self._propagar_numerico()
+        self.tiempo_integracion = time.perf_counter() - inicio
+
+    @classmethod
+    def desde_dosis(cls, P0, beta0, alpha, tiempos_dosis, supervivencia, t_max=10.0, **kwargs):
+        """
+        Crea un protocolo de dosis citotoxicas con beta_0 y alpha fijos.
+
+        Parametros:
+        -----------
+        P0, beta0, alpha : float
+            Parametros del modelo entre dosis
+        tiempos_dosis : array_like
+            Tiempos de las dosis (> 0, crecientes)
+        supervivencia : float or array_like
+            Fraccion superviviente a cada dosis
+        t_max : float, opcional
+            Tiempo maximo de simulacion (default: 10.0)
+
+        Retorna:
+        --------
+        ModeloTumorPorTramos : Modelo con un tramo por dosis
+        """
+        tiempos_dosis = np.asarray(tiempos_dosis, dtype=float)
+        s = np.broadcast_to(np.asarray(supervivencia, dtype=float), tiempos_dosis.shape)
+        return cls(P0, np.concatenate([[0.0], tiempos_dosis]), beta0, alpha,
+                   supervivencia=np.concatenate([[1.0], s]), t_max=t_max, **kwargs)
+
+    def _propagar_cerrado(self):
+        """
+        Propaga log P por los bordes con la solucion cerrada de cada tramo.
+
+        log P_ini_k = log P0 + sum_{j<k} I_j + sum_{j<=k} log s_j
+        """
+        self.incrementos = _integral_tramo(self.beta0s, self.alphas, self.tiempos, self.tiempos_fin)
+        log_s = np.log(self.supervivencia)
+        acumulado = np.cumsum(self.incrementos)
+
+        self.logP_inicio = np.log(self.P0) + np.cumsum(log_s) + np.concatenate([[0.0], acumulado[:-1]])
+        self.logP_fin = self.logP_inicio + self.incrementos
+
+        # Una evaluacion de la integral cerrada por tramo
+        self.pasos = len(self.tiempos)
+        self.evaluaciones_f = self.pasos
+
+    def _propagar_numerico(self):
+        """
+        Integra cada tramo con el paso del metodo numerico.
+
+        La trayectoria guarda el valor antes y despues de cada evento de
+        muerte (dos puntos con el mismo t en los bordes).
+        """
+        paso, evaluaciones_por_paso = metodo_de_un_paso(self.metodo_numerico)
+
+        t_tramos, P_tramos = [], []
+        logP_inicio = np.empty(len(self.tiempos))
+        logP_fin = np.empty(len(self.tiempos))
+        P = self.P0
+        pasos = 0
+        for k, (t_a, t_b) in enumerate(zip(self.tiempos, self.tiempos_fin)):
+            b, a = self.beta0s[k], self.alphas[k]
+            f = lambda t, y: b * np.exp(-a * t) * y
+
+            P = P * self.supervivencia[k]
+            m = max(1, int(np.ceil((t_b - t_a) / self.h)))
+            h = (t_b - t_a) / m
+            t_seg = t_a + h * np.arange(m + 1)
+            P_seg = np.empty(m + 1)
+            P_seg[0] = P
+            for i in range(m):
+                P_seg[i + 1] = paso(f, t_seg[i], P_seg[i], h)
+
+            logP_inicio[k], logP_fin[k] = np.log(P_seg[0]), np.log(P_seg[-1])
+            P = P_seg[-1]
+            pasos += m
+            t_tramos.append(t_seg)
+            P_tramos.append(P_seg)
+
+        self.logP_inicio, self.logP_fin = logP_inicio, logP_fin
+        self.incrementos = logP_fin - logP_inicio
+        self._limites_tramo = np.cumsum([0] + [len(t_seg) for t_seg in t_tramos])
+        self.t_vals = np.concatenate(t_tramos)
+        self.P_vals = np.concatenate(P_tramos)
+        self.pasos = pasos
+        self.evaluaciones_f = evaluaciones_por_paso * pasos
+
+    def _tramo(self, t):
+        """Indice del tramo que contiene cada tiempo t."""
+        return np.clip(np.searchsorted(self.tiempos, t, side='right') - 1, 0, len(self.tiempos) - 1)
+
+    def tasa_crecimiento(self, t):
+        """
+        Calcula la tasa por tramos r(t) = beta_k * e^(-alpha_k * t).
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s)
+
+        Retorna:
+        --------
+        float or array_like : Tasa de crecimiento r(t)
+        """
+        k = self._tramo(t)
+        return self.beta0s[k] * np.exp(-self.alphas[k] * t)
+
+    def f(self, t, P):
+        """
+        Ecuacion diferencial entre eventos: dP/dt = r(t) * P con r por tramos.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo
+        P : float or array_like
+            Poblacion
+
+        Retorna:
+        --------
+        float or array_like : dP/dt
+        """
+        return self.tasa_crecimiento(t) * P
+
+    def resolver_log(self, t):
+        """
+        Retorna log(P(t)) propagando desde el inicio del tramo de cada t.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : log(P(t))
+        """
+        if self.metodo_numerico is not None:
+            return super().resolver_log(t)
+
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+
+        k = self._tramo(t)
+        log_P = self.logP_inicio[k] + _integral_tramo(self.beta0s[k], self.alphas[k], self.tiempos[k], t)
+
+        # Retornar escalar si la entrada era escalar
+        return log_P[0] if t_escalar else log_P
+
+    def resolver(self, t):
+        """
+        Retorna P(t) bajo el protocolo.
+
+        En modo cerrado es exacta en cualquier t; en modo numerico interpola
+        linealmente la trayectoria del tramo.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t)
+        """
+        if self.metodo_numerico is None:
+            with np.errstate(over='ignore'):
+                return np.exp(self.resolver_log(t))
+
+        # Si t es escalar, convertir a array
+        t_escalar = np.isscalar(t)
+        t = np.atleast_1d(t)
+
+        # Interpolar dentro del tramo (continuidad por la derecha en los eventos)
+        k = self._tramo(t)
+        P = np.empty(t.shape)
+        for j in np.unique(k):
+            seg = slice(self._limites_tramo[j], self._limites_tramo[j + 1])
+            mascara = k == j
+            P[mascara] = np.interp(t[mascara], self.t_vals[seg], self.P_vals[seg])
+
+        # Retornar escalar si la entrada era escalar
+        return P[0] if t_escalar else P
+
+    def obtener_trayectoria(self, puntos_por_tramo=20):
+        """
+        Retorna la trayectoria del protocolo.
+
+        En modo numerico son los nodos integrados; en modo cerrado se evalua
+        la solucion exacta en puntos_por_tramo puntos de cada tramo.
+
+        Parametros:
+        -----------
+        puntos_por_tramo : int, opcional
+            Puntos por tramo en modo cerrado (default: 20)
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+        """
+        if self.metodo_numerico is not None:
+            return self.t_vals, self.P_vals
+
+        s = np.linspace(0, 1, puntos_por_tramo)
+        t_vals = (self.tiempos[:, None] + s * (self.tiempos_fin - self.tiempos)[:, None]).ravel()
+        k = np.repeat(np.arange(len(self.tiempos)), puntos_por_tramo)
+        log_P = self.logP_inicio[k] + _integral_tramo(self.beta0s[k], self.alphas[k], self.tiempos[k], t_vals)
+        with np.errstate(over='ignore'):
+            return t_vals, np.exp(log_P)
+
+    def tiempo_umbral(self, umbrales):
+        """
+        Calcula el primer tiempo en [0, t_max] en que P(t) alcanza cada umbral.
+
+        Un umbral mayor que P0 se alcanza al subir y uno menor al bajar (por
+        crecimiento negativo o por un evento de muerte). En cada tramo el
+        cruce interior es cerrado:
+        e^(-alpha_k t) = e^(-alpha_k tau_k) - alpha_k * (log c - log P_ini_k) / beta_k
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce (np.inf si no se alcanzan)
+        """
+        es_escalar = np.isscalar(umbrales)
+        log_c = np.log(np.atleast_1d(np.asarray(umbrales, dtype=float)))[:, None]
+        sentido = np.sign(log_c - np.log(self.P0))
+
+        tau, tau_fin = self.tiempos, self.tiempos_fin
+        b, a = self.beta0s, self.alphas
+        y = log_c - self.logP_inicio
+
+        # Ya alcanzado al inicio del tramo (incluye el salto del evento)
+        candidatos = np.where(sentido * y <= 0, tau, np.inf)
+
+        # Cruce dentro del tramo: I_k(t) = y con y del mismo signo que beta_k
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            argumento = np.exp(-a * tau) - a * y / b
+            t_int = np.where(a != 0, -np.log(argumento) / a, tau + y / b)
+        valido = (sentido * y > 0) & (y * b > 0) & (t_int >= tau) & (t_int <= tau_fin)
+        candidatos = np.minimum(candidatos, np.where(valido, t_int, np.inf))
+
+        t_cruce = candidatos.min(axis=1)
+        t_cruce = np.where(t_cruce <= self.t_max, t_cruce, np.inf)
+        return t_cruce[0] if es_escalar else t_cruce
+
+    def limite_asintotico_log(self):
+        """
+        log de lim P(t) si el ultimo tramo se prolonga indefinidamente.
+
+        Retorna:
+        --------
+        float : log(P_inf) (inf si el ultimo tramo tiene alpha <= 0 y beta > 0)
+        """
+        b, a, tau = self.beta0s[-1], self.alphas[-1], self.tiempos[-1]
+        if a <= 0:
+            return np.inf if b > 0 else -np.inf
+        return self.logP_inicio[-1] + b / a * np.exp(-a * tau)
+
+    def limite_asintotico(self):
+        """
+        Limite de P(t) cuando t -> inf tras el ultimo tramo.
+
+        Retorna:
+        --------
+        float : Poblacion limite P_inf
+        """
+        with np.errstate(over='ignore'):
+            return np.exp(self.limite_asintotico_log())
+
+    def factor_crecimiento(self):
+        """
+        Factor de crecimiento total del protocolo, P_inf / P0.
+
+        Retorna:
+        --------
+        float : Factor de crecimiento
+        """
+        with np.errstate(over='ignore'):
+            return np.exp(self.limite_asintotico_log() - np.log(self.P0))
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        return (f"{self.nombre}\n"
+                f"  P0={self.P0}, t_max={self.t_max}\n"
+                f"  beta0 en [{self.beta0s.min():.4g}, {self.beta0s.max():.4g}], "
+                f"alpha en [{self.alphas.min():.4g}, {self.alphas.max():.4g}]\n"
+                f"  Eventos de muerte: {int(np.sum(self.supervivencia != 1))}\n"
+                f"  Limite asintotico: {self.limite_asintotico():.4f}")
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorRK4 import ModeloTumorRK4
+
+    print("=== Modelo de Tumor con Protocolo de Tratamiento por Tramos ===\n")
+
+    # Sin tratamiento el modelo por tramos coincide con la solucion analitica
+    sin_tratamiento = ModeloTumorPorTramos(100, [0, 2, 5], 2.0, 0.5)
+    t = np.linspace(0, 10, 7)
+    error = np.max(np.abs(sin_tratamiento.resolver(t) / ModeloTumorAnalitico(100, 2.0, 0.5).resolver(t) - 1))
+    print(f"Tramos con parametros iguales vs analitico: error rel. {error:.2e}\n")
+
+    # Protocolo: beta reducido en [1, 4) y una dosis con 30% de muerte en t = 1
+    tiempos = [0, 1, 4]
+    protocolo = ModeloTumorPorTramos(100, tiempos, beta0s=[2.0, 1.0, 2.0], alphas=0.5,
+                                     supervivencia=[1.0, 0.7, 1.0])
+    print(protocolo)
+    print(f"  P(1-), P(1), P(4), P(10) = {np.exp(protocolo.logP_fin[0]):.2f}, "
+          f"{protocolo.resolver([1.0, 4.0, 10.0])}")
+    print(f"  Tiempo hasta P = 1000: {protocolo.tiempo_umbral(1000.0):.4f}")
+    rk4 = ModeloTumorPorTramos(100, tiempos, [2.0, 1.0, 2.0], 0.5, [1.0, 0.7, 1.0],
+                               metodo_numerico=ModeloTumorRK4, h=0.01)
+    print(f"  Mismo protocolo con RK4 por tramo: P(10) = {rk4.resolver(10.0):.4f}\n")
+
+    # Protocolo largo: 1000 dosis en [0, 10]
+    dosis = np.linspace(0.01, 9.99, 1000)
+    for metodo in [None, ModeloTumorRK4]:
+        modelo = ModeloTumorPorTramos.desde_dosis(100, 2.0, 0.5, dosis, supervivencia=0.999,
+                                                  metodo_numerico=metodo, h=0.001)
+        stats = modelo.estadisticas_trabajo()
+        print(f"{modelo.nombre:<36} P(10) = {modelo.resolver(10.0):10.4f} | "
+              f"{stats['tiempo_s'] * 1e6 / len(dosis):9.2f} us por tramo")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Soluciones de Referencia de Alta Precision (con Cache en Disco)
+
+La solucion analitica en float64 tiene un error relativo de redondeo del
+orden de (1 + beta_0/alpha) * eps ~ 1e-15: cuando el error de RK4 con h
+pequeno baja a ese nivel, la curva de convergencia medida contra
+ModeloTumorAnalitico se aplana en ruido.
+
+Aqui la formula cerrada P(t) = P0 exp(beta_0/alpha (1 - e^(-alpha t))) se
+evalua con mpmath a `dps` digitos decimales, partiendo de los valores
+binarios exactos de los parametros y de t. El resultado se guarda como un
+par doble-doble (alto, bajo), alto + bajo = P con ~32 digitos, de modo que
+error_relativo() puede medir errores por debajo de 1 ulp de float64.
+
+La evaluacion con mpmath es lenta (un punto a la vez), asi que cada
+referencia se guarda en el cache de Cache_Resultados, con una clave del
+contenido (parametros, malla de tiempos, precision y codigo de
+_evaluar_mpmath), y las repeticiones del estudio la leen del disco.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import mpmath
+import numpy as np
+
+from Cache_Resultados import CacheResultados
+
+
+def _evaluar_mpmath(P0, beta0, alpha, t, dps):
+    """Evalua la solucion cerrada con mpmath y la parte en (alto, bajo)."""
+    alto = np.empty(t.size)
+    bajo = np.empty(t.size)
+    with mpmath.workdps(dps):
+        P0_mp, beta0_mp, alpha_mp = (mpmath.mpf(float(x)) for x in (P0, beta0, alpha))
+        cociente = beta0_mp / alpha_mp
+        for i, t_i in enumerate(t.ravel()):
+            P = P0_mp * mpmath.exp(-cociente * mpmath.expm1(-alpha_mp * mpmath.mpf(float(t_i))))
+            alto[i] = float(P)
+            bajo[i] = float(P - mpmath.mpf(alto[i]))
+    return alto.reshape(t.shape), bajo.reshape(t.shape)
+
+
+def solucion_referencia(P0, beta0, alpha, t, dps=40, usar_cache=True, directorio_cache=None):
+    """
+    Solucion de referencia en doble-doble, calculada una vez y guardada en disco.
+
+    Parametros:
+    -----------
+    P0, beta0, alpha : float
+        Parametros del modelo
+    t : float or array_like
+        Tiempos donde evaluar
+    dps : int, opcional
+        Digitos decimales de trabajo de mpmath (default: 40)
+    usar_cache : bool, opcional
+        Leer/escribir el cache en disco (default: True)
+    directorio_cache : str, opcional
+        Directorio del cache (default: Cache_Resultados.DIRECTORIO_CACHE)
+
+    Retorna:
+    --------
+    tuple : (alto, bajo) con la forma de t; P(t) = alto + bajo, con alto el
+            valor de P correctamente redondeado a float64
+    """
+    t = np.ascontiguousarray(t, dtype=float)
+
+    if not usar_cache:
+        return _evaluar_mpmath(P0, beta0, alpha, t, dps)
+
+    cache = CacheResultados(directorio=directorio_cache)
+    P0, beta0, alpha = float(P0), float(beta0), float(alpha)
+    clave = cache.clave('referencia', _evaluar_mpmath, P0, beta0, alpha, t, dps)
+
+    def evaluar():
+        alto, bajo = _evaluar_mpmath(P0, beta0, alpha, t, dps)
+        return {'alto': alto, 'bajo': bajo}
+
+    referencia = cache.calcular(clave, evaluar)
+    return referencia['alto'], referencia['bajo']
+
+
+def error_relativo(P_aprox, referencia):
+    """
+    Error relativo (P_aprox - P) / P contra una referencia doble-doble.
+
+    Restar primero alto (exacto por Sterbenz cuando P_aprox esta cerca) y
+    despues bajo conserva errores mucho menores que 1 ulp de P.
+
+    Parametros:
+    -----------
+    P_aprox : array_like
+        Aproximacion en float64
+    referencia : tuple
+        (alto, bajo) de solucion_referencia
+
+    Retorna:
+    --------
+    array : Error relativo con signo
+    """
+    alto, bajo = referencia
+    return ((np.asarray(P_aprox) - alto) - bajo) / alto
+
+
+if __name__ == '__main__':
+    import time
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorExponencial import ModeloTumorExponencial
+
+    print("=== Referencia de Alta Precision con Cache ===\n")
+
+    P0, beta0, alpha = 100.0, 2.0, 0.5
+    t = np.linspace(0, 10, 2001)
+
+    inicio = time.perf_counter()
+    referencia = solucion_referencia(P0, beta0, alpha, t)
+    primera = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    referencia = solucion_referencia(P0, beta0, alpha, t)
+    segunda = time.perf_counter() - inicio
+    print(f"Referencia de {t.size} puntos: primera llamada {primera * 1000:.1f} ms, "
+          f"desde cache {segunda * 1000:.2f} ms")
+
+    # Error de redondeo de la solucion analitica en float64
+    error_float64 = np.abs(error_relativo(ModeloTumorAnalitico(P0, beta0, alpha).resolver(t), referencia))
+    print(f"Error relativo de ModeloTumorAnalitico (float64): max {error_float64.max():.2e}\n")
+
+    # Convergencia de orden 4 (Gauss de 2 nodos). Contra la referencia
+    # doble-doble, el piso que aparece para h pequeno es solo el redondeo
+    # acumulado del integrador; contra float64 se le suma el de la referencia
+    print(f"{'h':>10} {'vs float64':>12} {'vs alta prec.':>14}")
+    P_float64 = ModeloTumorAnalitico(P0, beta0, alpha).resolver(t)
+    for h in 2.0**-np.arange(1, 13):
+        P = ModeloTumorExponencial(P0, beta0, alpha, h=h, nodos_gauss=2).resolver(t[::400])
+        contra_float64 = np.max(np.abs(P / P_float64[::400] - 1))
+        contra_referencia = np.max(np.abs(error_relativo(P, (referencia[0][::400], referencia[1][::400]))))
+        print(f"{h:10.5f} {contra_float64:12.2e} {contra_referencia:14.2e}")
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro de Familias de Modelos de Crecimiento
+
+Cada familia declara su lado derecho f(t, P; parametros) y, si existe, su
+solucion cerrada vectorizada. ModeloCrecimiento usa la formula cerrada
+cuando la familia la tiene y, si no, integra f con el paso estatico de un
+metodo numerico (RK4 por defecto), con la misma interfaz que los demas
+modelos (resolver, obtener_trayectoria, tiempo_umbral, ...).
+
+Familias registradas:
+    'tumor'           : dP/dt = beta_0 e^(-alpha t) P
+                        P = P0 exp(beta_0/alpha (1 - e^(-alpha t)))
+    'gompertz'        : dP/dt = a P ln(K/P)
+                        P = K exp(ln(P0/K) e^(-a t))
+    'logistica'       : dP/dt = k P (M - P)            (Tarea 2.7, caso 2)
+                        P = M P0 / (P0 + (M - P0) e^(-k M t))
+    'von_bertalanffy' : dP/dt = a P^(2/3) - b P
+                        P = (a/b + (P0^(1/3) - a/b) e^(-b t / 3))^3
+
+Nuevas familias se agregan con registrar_familia(); las que no tienen
+solucion cerrada se resuelven numericamente sin cambiar a quien las usa.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+import numpy as np
+from ModeloTumorBase import ModeloTumorBase, metodo_de_un_paso
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorRK4 import ModeloTumorRK4
+from Salida_Densa import interpolar_hermite, tiempos_cruce
+
+
+# nombre -> dict con 'ecuacion', 'parametros', 'f', 'solucion' y 'limite'
+FAMILIAS = {}
+
+
+def registrar_familia(nombre, f, parametros, solucion=None, limite=None, ecuacion=''):
+    """
+    Agrega una familia de modelos al registro (o reemplaza una existente).
+
+    Parametros:
+    -----------
+    nombre : str
+        Clave de la familia
+    f : callable
+        Lado derecho f(t, P, **parametros), vectorizado en t y P
+    parametros : tuple of str
+        Nombres de los parametros de la familia (sin P0)
+    solucion : callable, opcional
+        Solucion cerrada solucion(t, P0, **parametros), vectorizada
+        (default: None, se resuelve numericamente)
+    limite : callable, opcional
+        Poblacion limite limite(P0, **parametros) cuando t -> inf
+    ecuacion : str, opcional
+        Ecuacion en texto para titulos y leyendas
+    """
+    FAMILIAS[nombre] = {
+        'ecuacion': ecuacion,
+        'parametros': tuple(parametros),
+        'f': f,
+        'solucion': solucion,
+        'limite': limite,
+    }
+
+
+def obtener_familia(nombre):
+    """
+    Retorna la entrada del registro de una familia.
+
+    Parametros:
+    -----------
+    nombre : str
+        Clave de la familia
+
+    Retorna:
+    --------
+    dict : Entrada de FAMILIAS
+    """
+    if nombre not in FAMILIAS:
+        raise ValueError(f"Familia desconocida '{nombre}'; disponibles: {', '.join(FAMILIAS)}")
+    return FAMILIAS[nombre]
+
+
+# El modelo de tumor delega en ModeloTumorAnalitico (una sola formula cerrada)
+registrar_familia(
+    'tumor',
+    f=lambda t, P, beta0, alpha: ModeloTumorAnalitico(1.0, beta0, alpha).tasa_crecimiento(t) * P,
+    parametros=('beta0', 'alpha'),
+    solucion=lambda t, P0, beta0, alpha: ModeloTumorAnalitico(P0, beta0, alpha).resolver(t),
+    limite=lambda P0, beta0, alpha: ModeloTumorAnalitico(P0, beta0, alpha).limite_asintotico(),
+    ecuacion='dP/dt = beta_0 e^(-alpha t) P',
+)
+
+registrar_familia(
+    'gompertz',
+    f=lambda t, P, a, K: a * P * np.log(K / P),
+    parametros=('a', 'K'),
+    solucion=lambda t, P0, a, K: K * np.exp(np.log(P0 / K) * np.exp(-a * t)),
+    limite=lambda P0, a, K: K * np.ones_like(P0),
+    ecuacion='dP/dt = a P ln(K/P)',
+)
+
+registrar_familia(
+    'logistica',
+    f=lambda t, P, k, M: k * P * (M - P),
+    parametros=('k', 'M'),
+    solucion=lambda t, P0, k, M: M * P0 / (P0 + (M - P0) * np.exp(-k * M * t)),
+    limite=lambda P0, k, M: M * np.ones_like(P0),
+    ecuacion='dP/dt = k P (M - P)',
+)
+
+registrar_familia(
+    'von_bertalanffy',
+    f=lambda t, P, a, b: a * np.cbrt(P)**2 - b * P,
+    parametros=('a', 'b'),
+    solucion=lambda t, P0, a, b: (a / b + (np.cbrt(P0) - a / b) * np.exp(-b * t / 3))**3,
+    limite=lambda P0, a, b: (a / b)**3 * np.ones_like(P0),
+    ecuacion='dP/dt = a P^(2/3) - b P',
+)
+
+
+class ModeloCrecimiento(ModeloTumorBase):
+    """
+    Modelo de una familia registrada, por formula cerrada o numerico.
+
+    Atributos adicionales:
+    ---------------------
+    familia : str
+        Clave de la familia en FAMILIAS
+    parametros : dict
+        Valores de los parametros de la familia
+    analitico : bool
+        True si se usa la solucion cerrada
+    metodo_numerico : type or None
+        Clase cuyo paso estatico se usa en la ruta numerica
+    h : float
+        Tamano de paso de la ruta numerica
+    t_max : float
+        Tiempo maximo (malla numerica, trayectoria y tiempo_umbral)
+    beta0, alpha : float
+        Parametros de la familia 'tumor'; np.nan en las familias que no
+        los tienen
+    orden : None
+        Sin orden de paso fijo propio: con_tolerancia() (que supone el
+        modelo de tumor) rechaza la clase con ValueError
+    """
+
+    orden = None
+
+    def __init__(self, familia, P0, metodo_numerico=None, h=0.01, t_max=10.0, **parametros):
+        """
+        Inicializa el modelo y, en la ruta numerica, precalcula la solucion.
+
+        Parametros:
+        -----------
+        familia : str
+            Clave de la familia ('tumor', 'gompertz', 'logistica', ...)
+        P0 : float or array_like
+            Poblacion inicial
+        metodo_numerico : type, opcional
+            Clase con metodo estatico paso(f, t, y, h) y evaluaciones_por_paso.
+            None usa la solucion cerrada si existe y ModeloTumorRK4 si no
+            (default: None)
+        h : float, opcional
+            Tamano de paso de la ruta numerica (default: 0.01)
+        t_max : float, opcional
+            Tiempo maximo de integracion (default: 10.0)
+        **parametros :
+            Parametros de la familia, p. ej. k=0.001, M=1000 para 'logistica'
+        """
+        entrada = obtener_familia(familia)
+        faltantes = set(entrada['parametros']) - set(parametros)
+        sobrantes = set(parametros) - set(entrada['parametros'])
+        if faltantes or sobrantes:
+            raise ValueError(f"La familia '{familia}' requiere los parametros "
+                             f"{entrada['parametros']}, no {tuple(parametros)}")
+
+        self.familia = familia
+        self.parametros = parametros
+        self.analitico = metodo_numerico is None and entrada['solucion'] is not None
+        if not self.analitico and metodo_numerico is None:
+            metodo_numerico = ModeloTumorRK4
+        self.metodo_numerico = metodo_numerico
+        self.h = h
+        self.t_max = t_max
+        self._entrada = entrada
+
+        if self.analitico:
+            metodo = 'analitica'
+        else:
+            metodo_de_un_paso(metodo_numerico)
+            nombre_metodo = getattr(metodo_numerico, 'nombre_metodo', None) or metodo_numerico.__name__
+            metodo = f"{nombre_metodo}, h={h}"
+        super().__init__(P0, parametros.get('beta0', np.nan), parametros.get('alpha', np.nan),
+                         nombre=f"{familia.capitalize()} ({metodo})")
+
+        # Precalcular la solucion numerica
+        if not self.analitico:
+            inicio = time.perf_counter()
+            self.t_vals, self.P_vals = self._integrar()
+            self.tiempo_integracion = time.perf_counter() - inicio
+
+    def f(self, t, P):
+        """
+        Lado derecho de la familia: dP/dt = f(t, P; parametros)
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo
+        P : float or array_like
+            Poblacion
+
+        Retorna:
+        --------
+        float or array_like : dP/dt
+        """
+        return self._entrada['f'](t, P, **self.parametros)
+
+    def tasa_crecimiento(self, t, P=None):
+        """
+        Tasa per capita f(t, P)/P, evaluada sobre la solucion si no se da P.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s)
+        P : float or array_like, opcional
+            Poblacion (default: P(t) del modelo)
+
+        Retorna:
+        --------
+        float or array_like : Tasa de crecimiento per capita
+        """
+        P = self.resolver(t) if P is None else P
+        return self.f(t, P) / P
+
+    def _integrar(self):
+        """
+        Integra la familia con el paso de metodo_numerico desde t=0 hasta t=t_max.
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+        """
+        # Crear malla temporal
+        t_vals = np.arange(0, self.t_max + self.h, self.h)
+        P_vals = np.zeros((len(t_vals),) + np.shape(self.P0))
+
+        # Condicion inicial
+        P_vals[0] = self.P0
+
+        paso, evaluaciones_por_paso = metodo_de_un_paso(self.metodo_numerico)
+        for i in range(len(t_vals) - 1):
+            P_vals[i + 1] = paso(self.f, t_vals[i], P_vals[i], self.h)
+
+        # Pendientes en los nodos para la salida densa de Hermite
+        self.dP_vals = self.f(t_vals.reshape((-1,) + (1,) * (P_vals.ndim - 1)), P_vals)
+
+        self.pasos = len(t_vals) - 1
+        self.evaluaciones_f = evaluaciones_por_paso * self.pasos + len(t_vals)
+
+        return t_vals, P_vals
+
+    def resolver(self, t):
+        """
+        Retorna P(t): formula cerrada o salida densa de la solucion numerica.
+
+        En la ruta numerica se usa el interpolante de Hermite cubico con
+        las pendientes f(t_n, P_n), de modo que el error entre nodos no
+        oculta el del metodo.
+
+        Parametros:
+        -----------
+        t : float or array_like
+            Tiempo(s) donde evaluar la solucion
+
+        Retorna:
+        --------
+        float or array_like : P(t)
+        """
+        if self.analitico:
+            return self._entrada['solucion'](t, self.P0, **self.parametros)
+
+        return interpolar_hermite(t, self.t_vals, self.P_vals, self.dP_vals)
+
+    def obtener_trayectoria(self, n_puntos=1001):
+        """
+        Retorna la trayectoria en [0, t_max].
+
+        En la ruta numerica son los nodos integrados; en la analitica se
+        evalua la formula en n_puntos puntos equiespaciados. Con P0 en lote
+        P_vals tiene forma (len(t_vals),) + forma de P0 en ambas rutas.
+
+        Parametros:
+        -----------
+        n_puntos : int, opcional
+            Puntos de la ruta analitica (default: 1001)
+
+        Retorna:
+        --------
+        tuple : (t_vals, P_vals)
+        """
+        if not self.analitico:
+            return self.t_vals, self.P_vals
+        t_vals = np.linspace(0, self.t_max, n_puntos)
+        return t_vals, self.resolver(t_vals.reshape((-1,) + (1,) * np.ndim(self.P0)))
+
+    def tiempo_umbral(self, umbrales):
+        """
+        Calcula el primer tiempo en que P(t) alcanza cada umbral.
+
+        Con P0 en lote cada trayectoria busca su propio cruce: umbrales se
+        difunde contra la forma de P0 (un escalar vale para todas; use
+        umbrales[:, None] para varios umbrales por trayectoria).
+
+        Parametros:
+        -----------
+        umbrales : float or array_like
+            Valor(es) de poblacion a alcanzar
+
+        Retorna:
+        --------
+        float or array_like : Tiempos de cruce (np.inf si no se alcanzan en
+                              [0, t_max]), con la forma difundida
+        """
+        t_vals, P_vals = self.obtener_trayectoria()
+        dP_vals = self.f(t_vals.reshape((-1,) + (1,) * (P_vals.ndim - 1)), P_vals)
+        if P_vals.ndim == 1:
+            return tiempos_cruce(t_vals, P_vals, umbrales, dP_vals)
+
+        # Una busqueda de cruce por trayectoria del lote
+        forma = np.broadcast_shapes(np.shape(umbrales), P_vals.shape[1:])
+        P_vals = P_vals.reshape(len(t_vals), -1)
+        dP_vals = dP_vals.reshape(len(t_vals), -1)
+        umbrales = np.broadcast_to(umbrales, forma).reshape(-1, P_vals.shape[1])
+        tiempos = np.empty(umbrales.shape)
+        for j in range(P_vals.shape[1]):
+            tiempos[:, j] = tiempos_cruce(t_vals, P_vals[:, j], umbrales[:, j], dP_vals[:, j])
+        return tiempos.reshape(forma)
+
+    def limite_asintotico(self):
+        """
+        Poblacion limite cuando t tiende a infinito, declarada por la familia.
+
+        Retorna:
+        --------
+        float : P_inf
+        """
+        if self._entrada['limite'] is None:
+            raise ValueError(f"La familia '{self.familia}' no declara limite asintotico")
+        return self._entrada['limite'](self.P0, **self.parametros)
+
+    def limite_asintotico_log(self):
+        """
+        Retorna log del limite asintotico.
+
+        Retorna:
+        --------
+        float : log(P_inf)
+        """
+        return np.log(self.limite_asintotico())
+
+    def factor_crecimiento(self):
+        """
+        Calcula el factor de crecimiento total P_inf / P0.
+
+        Retorna:
+        --------
+        float : Factor de crecimiento
+        """
+        return self.limite_asintotico() / self.P0
+
+    def __repr__(self):
+        """Representacion en string del modelo."""
+        valores = ', '.join(f"{clave}={valor}" for clave, valor in self.parametros.items())
+        texto = (f"{self.nombre}\n"
+                 f"  {self._entrada['ecuacion']}\n"
+                 f"  P0={self.P0}, {valores}")
+        if self._entrada['limite'] is not None:
+            texto += f"\n  Limite asintotico: {self.limite_asintotico():.4f}"
+        return texto
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+    print("=== Registro de Familias de Modelos de Crecimiento ===\n")
+
+    casos = {
+        'tumor': {'beta0': 2.0, 'alpha': 0.5},
+        'gompertz': {'a': 0.4, 'K': 5000.0},
+        'logistica': {'k': 0.0005, 'M': 1000.0},
+        'von_bertalanffy': {'a': 10.0, 'b': 0.5},
+    }
+    t = np.linspace(0, 10, 11)
+
+    # La ruta cerrada coincide con ModeloTumorAnalitico
+    tumor = ModeloCrecimiento('tumor', 100.0, **casos['tumor'])
+    error = np.max(np.abs(tumor.resolver(t) / ModeloTumorAnalitico(100.0, 2.0, 0.5).resolver(t) - 1))
+    print(f"'tumor' vs ModeloTumorAnalitico: error relativo maximo = {error:.2e}\n")
+
+    # Formula cerrada vs RK4 en cada familia
+    print(f"{'Familia':>16} {'P(10) cerrada':>14} {'P_inf':>10} {'Error RK4 h=0.1':>16}")
+    for familia, parametros in casos.items():
+        exacto = ModeloCrecimiento(familia, 100.0, **parametros)
+        rk4 = ModeloCrecimiento(familia, 100.0, metodo_numerico=ModeloTumorRK4, h=0.1, **parametros)
+        error = np.max(np.abs(rk4.resolver(t) / exacto.resolver(t) - 1))
+        print(f"{familia:>16} {exacto.resolver(10.0):14.4f} {exacto.limite_asintotico():10.2f} {error:16.2e}")
+
+    # Una familia sin solucion cerrada cae automaticamente en la ruta numerica
+    registrar_familia(
+        'allee',
+        f=lambda t, P, r, A, K: r * P * (P / A - 1) * (1 - P / K),
+        parametros=('r', 'A', 'K'),
+        limite=lambda P0, r, A, K: np.where(P0 > A, K, 0.0),
+        ecuacion='dP/dt = r P (P/A - 1)(1 - P/K)',
+    )
+    allee = ModeloCrecimiento('allee', 100.0, r=0.8, A=50.0, K=1000.0)
+    print(f"\n{allee}")
+    print(f"Tiempo hasta 0.9*K: {allee.tiempo_umbral(900.0):.4f}")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Salida Densa y Deteccion de Eventos
+
+Utilidades para evaluar una solucion numerica entre nodos de la malla
+(interpolacion de Hermite cubica con las pendientes f(t_n, P_n)) y para
+encontrar los tiempos en que la solucion cruza umbrales dados.
+
+La busqueda del paso que contiene cada cruce se hace con busqueda binaria
+cuando la trayectoria es monotona (el caso del modelo de tumor), y la raiz
+dentro del paso se encuentra con Newton salvaguardado por biseccion sobre
+el interpolante, vectorizado sobre todos los umbrales a la vez.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import numpy as np
+
+
+def _bases_hermite(s):
+    """Polinomios base de Hermite cubicos en s in [0, 1]."""
+    s2 = s * s
+    s3 = s2 * s
+    return 2*s3 - 3*s2 + 1, s3 - 2*s2 + s, -2*s3 + 3*s2, s3 - s2
+
+
+def _derivadas_bases_hermite(s):
+    """Derivadas respecto a s de los polinomios base de Hermite."""
+    s2 = s * s
+    return 6*s2 - 6*s, 3*s2 - 4*s + 1, -6*s2 + 6*s, 3*s2 - 2*s
+
+
+def interpolar_lineal(t, t_vals, y_vals):
+    """
+    Evalua el interpolante lineal por tramos a lo largo del primer eje.
+
+    Equivale a np.interp (constante fuera de la malla), pero y_vals puede
+    tener ejes adicionales, como la trayectoria de un modelo en lote con
+    parametros array o las sensibilidades de forma (n, ..., 3).
+
+    Parametros:
+    -----------
+    t : float or array_like
+        Tiempo(s) donde evaluar
+    t_vals : array_like
+        Nodos de la malla (crecientes)
+    y_vals : array_like
+        Valores en los nodos, forma (n, ...)
+
+    Retorna:
+    --------
+    float or array_like : Valores interpolados, forma t.shape + y_vals.shape[1:]
+    """
+    y_vals = np.asarray(y_vals)
+    if y_vals.ndim == 1:
+        return np.interp(t, t_vals, y_vals)
+
+    t = np.asarray(t, dtype=float)
+    k = np.clip(np.searchsorted(t_vals, t, side='right') - 1, 0, len(t_vals) - 2)
+    s = np.clip((t - t_vals[k]) / (t_vals[k + 1] - t_vals[k]), 0.0, 1.0)
+
+    # Un eje de broadcast por cada eje extra de y_vals
+    s = s.reshape(s.shape + (1,) * (y_vals.ndim - 1))
+    return y_vals[k] + s * (y_vals[k + 1] - y_vals[k])
+
+
+def interpolar_hermite(t, t_vals, y_vals, dy_vals):
+    """
+    Evalua el interpolante de Hermite cubico por tramos.
+
+    Parametros:
+    -----------
+    t : float or array_like
+        Tiempo(s) donde evaluar
+    t_vals : array_like
+        Nodos de la malla (crecientes)
+    y_vals : array_like
+        Valores de la solucion en los nodos
+    dy_vals : array_like
+        Derivadas dy/dt en los nodos
+
+    Retorna:
+    --------
+    float or array_like : Valores interpolados
+    """
+    t_escalar = np.isscalar(t)
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+
+    k = np.clip(np.searchsorted(t_vals, t, side='right') - 1, 0, len(t_vals) - 2)
+    h = t_vals[k + 1] - t_vals[k]
+    s = (t - t_vals[k]) / h
+
+    b00, b10, b01, b11 = _bases_hermite(s)
+    y = b00 * y_vals[k] + b10 * h * dy_vals[k] + b01 * y_vals[k + 1] + b11 * h * dy_vals[k + 1]
+
+    return y[0] if t_escalar else y
+
+
+def _paso_de_cruce(P_vals, umbrales):
+    """
+    Indice del primer nodo i con P_vals[i] en o mas alla de cada umbral.
+
+    Retorna len(P_vals) para los umbrales que nunca se alcanzan.
+    """
+    n = len(P_vals)
+    diferencias = np.diff(P_vals)
+
+    # Caso monotono: busqueda binaria, O(log n) por umbral
+    if np.all(diferencias >= 0):
+        return np.searchsorted(P_vals, umbrales, side='left')
+    if np.all(diferencias <= 0):
+        return n - np.searchsorted(P_vals[::-1], umbrales, side='right')
+
+    # Caso general: primer cambio de signo de P - umbral respecto a t=0
+    signo = np.sign(P_vals[None, :] - umbrales[:, None])
+    cambio = (signo == 0) | (signo != signo[:, :1])
+    return np.where(cambio.any(axis=1), np.argmax(cambio, axis=1), n)
+
+
+def tiempos_cruce(t_vals, P_vals, umbrales, dP_vals=None, iteraciones=30):
+    """
+    Calcula el primer tiempo t >= t_vals[0] en que la solucion alcanza cada umbral.
+
+    Si dP_vals es None la solucion se interpola linealmente entre nodos
+    (la extension continua natural del metodo de Euler); si no, se usa el
+    interpolante de Hermite cubico con las pendientes dadas.
+
+    Parametros:
+    -----------
+    t_vals : array_like
+        Nodos de la malla
+    P_vals : array_like
+        Solucion en los nodos
+    umbrales : float or array_like
+        Valor(es) de P cuyo tiempo de cruce se busca
+    dP_vals : array_like, opcional
+        Derivadas dP/dt en los nodos (default: None, interpolacion lineal)
+    iteraciones : int, opcional
+        Iteraciones maximas de Newton-biseccion dentro del paso (default: 30)
+
+    Retorna:
+    --------
+    float or array_like : Tiempos de cruce (np.inf si no se alcanza en la malla)
+    """
+    t_vals = np.asarray(t_vals, dtype=float)
+    P_vals = np.asarray(P_vals, dtype=float)
+    umbrales_arr = np.asarray(umbrales, dtype=float)
+    c = umbrales_arr.ravel()
+
+    i = _paso_de_cruce(P_vals, c)
+    tiempos = np.full(c.shape, np.inf)
+
+    # Umbral igual a la condicion inicial
+    en_inicio = (i == 0) & (P_vals[0] == c)
+    tiempos[en_inicio] = t_vals[0]
+
+    # Cruces interiores: la raiz esta en el paso [t_k, t_{k+1}]
+    interior = (i > 0) & (i < len(P_vals))
+    k = i[interior] - 1
+    c_int = c[interior]
+    t0, t1 = t_vals[k], t_vals[k + 1]
+    y0, y1 = P_vals[k], P_vals[k + 1]
+    h = t1 - t0
+
+    # Estimacion lineal (exacta si no hay salida densa de Hermite)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        s = np.where(y1 != y0, (c_int - y0) / (y1 - y0), 0.0)
+    s = np.clip(s, 0.0, 1.0)
+
+    if dP_vals is not None:
+        dP_vals = np.asarray(dP_vals, dtype=float)
+        m0, m1 = h * dP_vals[k], h * dP_vals[k + 1]
+        creciente = y1 >= y0
+        bajo, alto = np.zeros_like(s), np.ones_like(s)
+
+        for _ in range(iteraciones):
+            b00, b10, b01, b11 = _bases_hermite(s)
+            g = b00 * y0 + b10 * m0 + b01 * y1 + b11 * m1 - c_int
+
+            # Actualizar el intervalo que encierra la raiz
+            debajo = np.where(creciente, g < 0, g > 0)
+            bajo = np.where(debajo, s, bajo)
+            alto = np.where(debajo, alto, s)
+
+            d00, d10, d01, d11 = _derivadas_bases_hermite(s)
+            dg = d00 * y0 + d10 * m0 + d01 * y1 + d11 * m1
+            with np.errstate(invalid='ignore', divide='ignore'):
+                s_newton = s - g / dg
+
+            # Newton si cae dentro del intervalo; si no, biseccion
+            fuera = ~np.isfinite(s_newton) | (s_newton <= bajo) | (s_newton >= alto)
+            s_nuevo = np.where(fuera, 0.5 * (bajo + alto), s_newton)
+
+            if np.all(np.abs(s_nuevo - s) <= 4 * np.finfo(float).eps):
+                s = s_nuevo
+                break
+            s = s_nuevo
+
+    tiempos[interior] = t0 + s * h
+
+    tiempos = tiempos.reshape(umbrales_arr.shape)
+    return tiempos[()] if tiempos.ndim == 0 else tiempos
+
+
+if __name__ == '__main__':
+    print("=== Salida Densa y Deteccion de Umbrales ===\n")
+
+    t_vals = np.linspace(0, 2, 5)
+    P_vals = np.exp(t_vals)
+    umbrales = np.array([1.5, 2.0, 5.0, 100.0])
+
+    t_lineal = tiempos_cruce(t_vals, P_vals, umbrales)
+    t_hermite = tiempos_cruce(t_vals, P_vals, umbrales, dP_vals=P_vals)
+
+    print(f"{'Umbral':>8} {'Lineal':>10} {'Hermite':>10} {'Exacto':>10}")
+    for c, tl, th in zip(umbrales, t_lineal, t_hermite):
+        print(f"{c:8.2f} {tl:10.6f} {th:10.6f} {np.log(c):10.6f}")
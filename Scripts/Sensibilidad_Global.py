@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analisis de Sensibilidad Global - Indices de Sobol
+
+Estima que parte de la varianza de P(t) (o del error numerico) se debe a
+cada parametro entre P0, beta0, alpha y el paso h, usando el esquema de
+muestreo de Saltelli:
+
+    A, B      : dos matrices N x k de muestras (Sobol en 2k dimensiones)
+    AB_i      : A con la columna i tomada de B
+    S_i  = mean(f(B) * (f(AB_i) - f(A))) / Var(f)          (primer orden)
+    ST_i = mean((f(A) - f(AB_i))^2) / (2 Var(f))           (total, Jansen)
+
+con N*(k+2) evaluaciones del modelo. El modelo analitico se evalua por
+broadcasting; Euler y RK4 se integran en lote (cada muestra con su propio
+h) con los pasos ModeloTumorEuler.paso / ModeloTumorRK4.paso. Los bloques
+se pueden repartir entre procesos.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import qmc
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+PARAMETROS = ('P0', 'beta0', 'alpha', 'h')
+
+METODOS_PASO = {
+    'euler': ModeloTumorEuler.paso,
+    'rk4': ModeloTumorRK4.paso,
+}
+
+
+def integrar_lote(paso, P0, beta0, alpha, h, t_salida):
+    """
+    Integra muchas trayectorias a la vez, cada una con sus parametros y su h.
+
+    Todas avanzan en el mismo ciclo; la muestra k esta en t = n*h_k tras n
+    pasos. La salida se interpola linealmente entre nodos, igual que
+    resolver() en las clases numericas. Las muestras que ya cubrieron todos
+    los tiempos de salida dejan de calcularse.
+
+    Parametros:
+    -----------
+    paso : callable
+        Paso del metodo, paso(f, t, y, h) (p. ej. ModeloTumorRK4.paso)
+    P0, beta0, alpha, h : array_like
+        Parametros por muestra, forma (n,)
+    t_salida : array_like
+        Tiempos de salida crecientes, forma (T,)
+
+    Retorna:
+    --------
+    array : P en los tiempos de salida, forma (n, T)
+    """
+    P0, beta0, alpha, h = (np.asarray(x, dtype=float) for x in np.broadcast_arrays(P0, beta0, alpha, h))
+    t_salida = np.asarray(t_salida, dtype=float)
+    n = P0.size
+    # Con h <= 0 (o NaN) o un tiempo no finito el ciclo no terminaria
+    if not np.all(h > 0):
+        raise ValueError("h debe ser positivo en todas las muestras")
+    if not np.all(np.isfinite(t_salida)):
+        raise ValueError("t_salida debe ser finito")
+
+    salida = np.empty((n, t_salida.size))
+    hecho = np.repeat(t_salida[None, :] <= 0, n, axis=0)
+    salida[hecho] = np.broadcast_to(P0[:, None], salida.shape)[hecho]
+
+    activos = np.arange(n)
+    P, beta0_act, alpha_act, h_act = P0.copy(), beta0, alpha, h
+
+    def f(t, y):
+        # Lado derecho de las muestras activas (beta0_act, alpha_act se recortan abajo)
+        return beta0_act * np.exp(-alpha_act * t) * y
+
+    contador = 0
+    while activos.size:
+        t_n = contador * h_act
+        P_sig = paso(f, t_n, P, h_act)
+        t_sig = (contador + 1) * h_act
+        contador += 1
+
+        # Tiempos de salida alcanzados en este paso: interpolacion lineal
+        nuevos = ~hecho[activos] & (t_salida[None, :] <= t_sig[:, None])
+        peso = (t_salida[None, :] - t_n[:, None]) / h_act[:, None]
+        valores = P[:, None] + peso * (P_sig - P)[:, None]
+        filas, cols = np.nonzero(nuevos)
+        salida[activos[filas], cols] = valores[filas, cols]
+        hecho[activos] |= nuevos
+
+        # Seguir solo con las muestras que aun tienen salidas pendientes
+        sigue = ~hecho[activos].all(axis=1)
+        activos, P = activos[sigue], P_sig[sigue]
+        beta0_act, alpha_act, h_act = beta0_act[sigue], alpha_act[sigue], h_act[sigue]
+
+    return salida
+
+
+def evaluar_modelo(theta, t, metodo='analitico', salida='P'):
+    """
+    Evalua el modelo para un bloque de muestras de (P0, beta0, alpha, h).
+
+    Parametros:
+    -----------
+    theta : array_like
+        Muestras, forma (n, 4) con columnas (P0, beta0, alpha, h)
+    t : array_like
+        Tiempos de salida, forma (T,)
+    metodo : str, opcional
+        'analitico', 'euler' o 'rk4' (default: 'analitico')
+    salida : str, opcional
+        'P' para P(t) o 'error' para el error relativo |P_num - P|/P
+        (default: 'P')
+
+    Retorna:
+    --------
+    array : Salida del modelo, forma (n, T)
+    """
+    theta = np.asarray(theta, dtype=float)
+    exacto = ModeloTumorAnalitico(theta[:, 0:1], theta[:, 1:2], theta[:, 2:3]).resolver(t)
+
+    if metodo == 'analitico':
+        P = exacto
+    else:
+        P = integrar_lote(METODOS_PASO[metodo], theta[:, 0], theta[:, 1], theta[:, 2], theta[:, 3], t)
+
+    if salida == 'error':
+        return np.abs(P - exacto) / exacto
+    return P
+
+
+def _evaluar_bloque(argumentos):
+    """Envoltorio de evaluar_modelo para ProcessPoolExecutor."""
+    return evaluar_modelo(*argumentos)
+
+
+def matrices_saltelli(rangos, n_base, semilla=None):
+    """
+    Construye las matrices A, B y AB_i del esquema de Saltelli.
+
+    Parametros:
+    -----------
+    rangos : dict
+        Rango uniforme (min, max) de cada parametro variable
+    n_base : int
+        Numero de filas N de A y B (potencia de 2 recomendada)
+    semilla : int, opcional
+        Semilla del Sobol con scrambling
+
+    Retorna:
+    --------
+    tuple : (A, B, AB) con formas (N, k), (N, k) y (k, N, k)
+    """
+    k = len(rangos)
+    limites = np.array(list(rangos.values()), dtype=float)
+
+    # Una sola secuencia en 2k dimensiones: A y B son sus dos mitades
+    u = qmc.Sobol(d=2 * k, scramble=True, seed=semilla).random(n_base)
+    A = limites[:, 0] + (limites[:, 1] - limites[:, 0]) * u[:, :k]
+    B = limites[:, 0] + (limites[:, 1] - limites[:, 0]) * u[:, k:]
+
+    AB = np.repeat(A[None, :, :], k, axis=0)
+    for i in range(k):
+        AB[i, :, i] = B[:, i]
+
+    return A, B, AB
+
+
+def indices_sobol(t, rangos, valores_fijos=None, n_base=2**14, metodo='analitico',
+                  salida='P', n_procesos=1, tam_bloque=2**16, semilla=None):
+    """
+    Calcula los indices de Sobol de primer orden y totales por tiempo de salida.
+
+    Parametros:
+    -----------
+    t : array_like
+        Tiempos de salida, forma (T,)
+    rangos : dict
+        Rango (min, max) de los parametros que varian, subconjunto de
+        ('P0', 'beta0', 'alpha', 'h'). Ejemplo: {'beta0': (1.5, 2.5), 'h': (0.01, 0.1)}
+    valores_fijos : dict, opcional
+        Valores de los parametros que no varian (default: P0=100, beta0=2,
+        alpha=0.5, h=0.01)
+    n_base : int, opcional
+        Filas N de las matrices A y B; el total de evaluaciones es N*(k+2)
+        (default: 2**14)
+    metodo : str, opcional
+        'analitico', 'euler' o 'rk4' (default: 'analitico')
+    salida : str, opcional
+        'P' o 'error' (error relativo contra la solucion analitica) (default: 'P')
+    n_procesos : int, opcional
+        Procesos para evaluar los bloques (default: 1)
+    tam_bloque : int, opcional
+        Filas evaluadas por llamada (default: 2**16)
+    semilla : int, opcional
+        Semilla del muestreo
+
+    Retorna:
+    --------
+    dict : Con claves 'nombres', 't', 'S1' y 'ST' (forma (k, T)),
+           'varianza' (T,), 'evaluaciones' y 'tiempo_s'
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    fijos = {'P0': 100.0, 'beta0': 2.0, 'alpha': 0.5, 'h': 0.01}
+    fijos.update(valores_fijos or {})
+    nombres = list(rangos)
+    k = len(nombres)
+
+    A, B, AB = matrices_saltelli(rangos, n_base, semilla)
+    X = np.vstack([A, B, AB.reshape(-1, k)])
+
+    # Completar las columnas (P0, beta0, alpha, h) con los valores fijos
+    theta = np.empty((X.shape[0], len(PARAMETROS)))
+    for j, nombre in enumerate(PARAMETROS):
+        theta[:, j] = X[:, nombres.index(nombre)] if nombre in rangos else fijos[nombre]
+
+    inicio = time.perf_counter()
+    tareas = [(theta[i:i + tam_bloque], t, metodo, salida)
+              for i in range(0, theta.shape[0], tam_bloque)]
+    if n_procesos > 1:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            Y = np.vstack(list(ejecutor.map(_evaluar_bloque, tareas)))
+    else:
+        Y = np.vstack([_evaluar_bloque(tarea) for tarea in tareas])
+    duracion = time.perf_counter() - inicio
+
+    Y_A, Y_B = Y[:n_base], Y[n_base:2 * n_base]
+    Y_AB = Y[2 * n_base:].reshape(k, n_base, t.size)
+
+    varianza = np.var(np.vstack([Y_A, Y_B]), axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        S1 = np.mean(Y_B[None] * (Y_AB - Y_A[None]), axis=1) / varianza
+        ST = 0.5 * np.mean((Y_A[None] - Y_AB)**2, axis=1) / varianza
+
+    return {
+        'nombres': nombres,
+        't': t,
+        'S1': S1,
+        'ST': ST,
+        'varianza': varianza,
+        'evaluaciones': theta.shape[0],
+        'tiempo_s': duracion,
+    }
+
+
+def graficar_indices_sobol(resultado, figsize=(12, 5), guardar=None):
+    """
+    Grafica los indices de primer orden y totales en funcion del tiempo.
+
+    Parametros:
+    -----------
+    resultado : dict
+        Salida de indices_sobol()
+    figsize : tuple, opcional
+        Tamano de la figura (default: (12, 5))
+    guardar : str, opcional
+        Ruta del archivo para guardar el grafico (default: None, no guarda)
+
+    Retorna:
+    --------
+    tuple : (fig, axes)
+    """
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 2, figsize=figsize, sharey=True)
+    for ax, clave, titulo in [(axes[0], 'S1', 'Indices de primer orden S_i'),
+                              (axes[1], 'ST', 'Indices totales ST_i')]:
+        for nombre, valores in zip(resultado['nombres'], resultado[clave]):
+            ax.plot(resultado['t'], valores, linewidth=2, label=nombre)
+        ax.set_xlabel('Tiempo t', fontsize=12)
+        ax.set_title(titulo, fontsize=13, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+    axes[0].set_ylabel('Indice de Sobol', fontsize=12)
+    plt.tight_layout()
+
+    # Guardar si se especifica
+    if guardar:
+        plt.savefig(guardar, dpi=300, bbox_inches='tight')
+        print(f"Grafico guardado: {guardar}")
+
+    return fig, axes
+
+
+if __name__ == '__main__':
+    print("=== Indices de Sobol (Saltelli) ===\n")
+
+    t = np.linspace(0.5, 10, 20)
+    rangos = {'P0': (50, 150), 'beta0': (1.5, 2.5), 'alpha': (0.3, 0.7)}
+
+    res = indices_sobol(t, rangos, n_base=2**17, semilla=1)
+    print(f"Modelo analitico: {res['evaluaciones']} evaluaciones en {res['tiempo_s']:.2f} s")
+    print(f"{'t':>6} " + " ".join(f"{'S1_' + n:>10} {'ST_' + n:>10}" for n in res['nombres']))
+    for j in [0, 4, 9, 19]:
+        print(f"{t[j]:6.2f} " + " ".join(f"{res['S1'][i, j]:10.3f} {res['ST'][i, j]:10.3f}"
+                                         for i in range(len(res['nombres']))))
+
+    # Error numerico de Euler: que parametro lo controla?
+    rangos_error = {'beta0': (1.5, 2.5), 'alpha': (0.3, 0.7), 'h': (0.01, 0.1)}
+    res = indices_sobol([10.0], rangos_error, n_base=2**11, metodo='euler', salida='error', semilla=1)
+    print(f"\nError relativo de Euler en t=10: {res['evaluaciones']} evaluaciones en {res['tiempo_s']:.2f} s")
+    for nombre, s1, st in zip(res['nombres'], res['S1'][:, 0], res['ST'][:, 0]):
+        print(f"  {nombre:>6}: S1 = {s1:6.3f}  ST = {st:6.3f}")
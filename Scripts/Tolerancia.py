@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eleccion Automatica del Paso h para una Tolerancia
+
+En lugar de adivinar h (y sobre-resolver "por si acaso"), se estima la
+constante del error global E(h) ~ C h^p de cada metodo con un par piloto
+barato y se toma el mayor h que cumple el error relativo pedido:
+
+1. Piloto: resolver con h_p y h_p/2 y comparar en los nodos comunes.
+   Por extrapolacion de Richardson, el error de la solucion fina es
+   E(h_p/2) ~ |P_{h_p/2} - P_{h_p}| / (2^p - 1), de donde C = E / (h_p/2)^p.
+2. Integracion: h_int = seguridad * (tol / C)^(1/p).
+3. Interpolacion: resolver() interpola linealmente entre nodos, con error
+   relativo <= h^2/8 * max|P''/P| = h^2/8 * max|r^2 - alpha r| (cota a priori),
+   de donde h_interp = sqrt(8 tol / max|r^2 - alpha r|).
+4. h = min(h_int, h_interp), ajustado para que divida a t_max.
+
+El orden p lo declara cada clase en su atributo `orden`.
+
+Autores: Enrique A. Gonzalez Moreira, Heily Rodriguez Rodriguez, Alex L. Cuervo Grillo
+Asignatura: Matematica Numerica y Ecuaciones Diferenciales Ordinarias
+"""
+
+import numpy as np
+
+
+def elegir_paso(clase, P0, beta0, alpha, tol, t_max=10.0, h_piloto=None,
+                seguridad=0.8, interpolacion=True, **kwargs):
+    """
+    Elige el mayor h con el que el error relativo de la clase no supera tol.
+
+    Parametros:
+    -----------
+    clase : type
+        Clase del metodo de paso fijo (con atributo `orden`), p. ej.
+        ModeloTumorEuler, ModeloTumorRK4 o ModeloTumorABM4
+    P0, beta0, alpha : float
+        Parametros del modelo
+    tol : float
+        Error relativo maximo deseado, max |P_h - P| / P en [0, t_max]
+    t_max : float, opcional
+        Tiempo maximo de integracion (default: 10.0)
+    h_piloto : float, opcional
+        Paso grueso del par piloto (default: t_max / 64)
+    seguridad : float, opcional
+        Factor de seguridad sobre el h estimado (default: 0.8)
+    interpolacion : bool, opcional
+        Incluir la cota del error de interpolacion lineal; usar False si
+        solo se evalua en los nodos (default: True)
+    **kwargs :
+        Argumentos adicionales del constructor de la clase
+
+    Retorna:
+    --------
+    tuple : (h, info) con info un dict con 'orden', 'constante',
+            'h_integracion', 'h_interpolacion' y 'evaluaciones_piloto'
+    """
+    p = getattr(clase, 'orden', None)
+    if p is None:
+        raise ValueError(f"{clase.__name__} no declara un orden; no se puede elegir h")
+    if tol <= 0:
+        raise ValueError("tol debe ser positiva")
+
+    h_piloto = h_piloto or t_max / 64
+
+    # Par piloto h_p, h_p/2 comparado en los nodos comunes (sin interpolar)
+    grueso = clase(P0, beta0, alpha, h=h_piloto, t_max=t_max, **kwargs)
+    fino = clase(P0, beta0, alpha, h=h_piloto / 2, t_max=t_max, **kwargs)
+    n = min(len(grueso.P_vals), len(fino.P_vals[::2]))
+    P_grueso, P_fino = grueso.P_vals[:n], fino.P_vals[::2][:n]
+
+    error_fino = np.max(np.abs(P_fino - P_grueso) / np.abs(P_fino)) / (2**p - 1)
+    constante = error_fino / (h_piloto / 2)**p
+
+    if constante > 0:
+        h_integracion = seguridad * (tol / constante)**(1 / p)
+    else:
+        h_integracion = t_max
+
+    # Cota a priori de la interpolacion lineal: |P''/P| = |r^2 - alpha r|
+    if interpolacion:
+        r = grueso.tasa_crecimiento(np.linspace(0, t_max, 1001))
+        curvatura = np.max(np.abs(r**2 - alpha * r))
+        h_interpolacion = np.sqrt(8 * tol / curvatura) if curvatura > 0 else t_max
+    else:
+        h_interpolacion = t_max
+
+    # Ajustar h para que la malla termine exactamente en t_max
+    h = min(h_integracion, h_interpolacion, t_max)
+    h = t_max / np.ceil(t_max / h)
+
+    return h, {
+        'orden': p,
+        'constante': constante,
+        'h_integracion': h_integracion,
+        'h_interpolacion': h_interpolacion,
+        'evaluaciones_piloto': grueso.evaluaciones_f + fino.evaluaciones_f,
+    }
+
+
+def resolver_con_tolerancia(clase, P0, beta0, alpha, t, tol, t_max=None, **kwargs):
+    """
+    Resuelve el modelo en t con el h mas grande que cumple la tolerancia.
+
+    Parametros:
+    -----------
+    clase : type
+        Clase del metodo de paso fijo (ver elegir_paso)
+    P0, beta0, alpha : float
+        Parametros del modelo
+    t : float or array_like
+        Tiempo(s) donde evaluar la solucion
+    tol : float
+        Error relativo maximo deseado
+    t_max : float, opcional
+        Tiempo maximo de integracion (default: max(t))
+    **kwargs :
+        Argumentos de elegir_paso y del constructor de la clase
+
+    Retorna:
+    --------
+    tuple : (P, modelo)
+        P : P(t) aproximado
+        modelo : instancia resuelta (ver modelo.h y modelo.estadisticas_trabajo())
+    """
+    if t_max is None:
+        t_max = float(np.max(t))
+
+    opciones = {clave: kwargs.pop(clave) for clave in ('h_piloto', 'seguridad', 'interpolacion')
+                if clave in kwargs}
+    h, _ = elegir_paso(clase, P0, beta0, alpha, tol, t_max, **opciones, **kwargs)
+    modelo = clase(P0, beta0, alpha, h=h, t_max=t_max, **kwargs)
+
+    return modelo.resolver(t), modelo
+
+
+if __name__ == '__main__':
+    from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+    from ModeloTumorEuler import ModeloTumorEuler
+    from ModeloTumorRK4 import ModeloTumorRK4
+    from ModeloTumorABM4 import ModeloTumorABM4
+
+    print("=== Eleccion automatica de h por tolerancia ===\n")
+
+    P0, beta0, alpha = 100, 2.0, 0.5
+    t = np.linspace(0, 10, 1001)
+    P_exacto = ModeloTumorAnalitico(P0, beta0, alpha).resolver(t)
+
+    print(f"{'Metodo':<10} {'tol':>8} {'h elegido':>11} {'Error real':>11} "
+          f"{'Evals f':>9} {'Evals h=1e-3':>13}")
+    print("-" * 68)
+    for clase in [ModeloTumorEuler, ModeloTumorRK4, ModeloTumorABM4]:
+        for tol in [1e-2, 1e-4, 1e-6]:
+            if clase is ModeloTumorEuler and tol < 1e-4:
+                continue
+            h, info = elegir_paso(clase, P0, beta0, alpha, tol)
+            P, modelo = resolver_con_tolerancia(clase, P0, beta0, alpha, t, tol)
+            error = np.max(np.abs(P - P_exacto) / P_exacto)
+            seguro = clase(P0, beta0, alpha, h=1e-3)
+            print(f"{clase.nombre_metodo:<10} {tol:8.0e} {modelo.h:11.3e} {error:11.2e} "
+                  f"{modelo.evaluaciones_f + info['evaluaciones_piloto']:9d} "
+                  f"{seguro.evaluaciones_f:13d}")
+
+    # Misma API desde la clase
+    modelo = ModeloTumorRK4.con_tolerancia(P0, beta0, alpha, tol=1e-8)
+    print(f"\nModeloTumorRK4.con_tolerancia(tol=1e-8): h = {modelo.h:.4e}")
+
+    # Si solo se usan los nodos, la cota de interpolacion no limita a RK4
+    h_nodos, info = elegir_paso(ModeloTumorRK4, P0, beta0, alpha, tol=1e-6, interpolacion=False)
+    print(f"RK4 tol=1e-6 solo en nodos: h = {h_nodos:.4e} "
+          f"(h_integracion = {info['h_integracion']:.4e}, h_interpolacion = {info['h_interpolacion']:.4e})")
@@ -0,0 +1,9 @@
+"""
+Configuracion de pytest: los scripts se importan por nombre de modulo
+(como en los __main__), asi que se agrega Scripts/ al sys.path.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
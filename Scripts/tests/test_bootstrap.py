@@ -0,0 +1,62 @@
+"""Pruebas de regresion de los intervalos bootstrap."""
+
+import numpy as np
+import pytest
+
+from Bootstrap import bootstrap_parametros, intervalos_bca
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+
+T = np.linspace(0, 8, 20)
+P_OBS = ModeloTumorAnalitico(100.0, 2.0, 0.5).resolver(T) * np.exp(
+    0.05 * np.random.default_rng(4).standard_normal(T.size))
+
+
+def test_bca_sin_sesgo_ni_aceleracion_es_el_percentil():
+    replicas = np.sort(np.random.default_rng(0).standard_normal(1000))[:, None]
+    estimacion = np.array([0.5 * (replicas[499, 0] + replicas[500, 0])])
+    jackknife = np.array([[-1.0], [1.0]])
+    np.testing.assert_allclose(intervalos_bca(replicas, estimacion, jackknife)[0],
+                               np.quantile(replicas[:, 0], [0.025, 0.975]))
+
+
+@pytest.mark.parametrize('metodo', ['residuos', 'casos'])
+def test_intervalos_contienen_los_parametros(metodo):
+    res = bootstrap_parametros(T, P_OBS, n_bootstrap=500, metodo=metodo, semilla=1)
+    assert res['convergieron'] > 450
+    assert np.all(np.isfinite(res['replicas']))
+    for j, real in enumerate([100.0, 2.0, 0.5]):
+        for limites in (res['percentil'][j], res['bca'][j]):
+            assert limites[0] < real < limites[1]
+
+
+def test_procesos_reproducen_el_resultado():
+    serie = bootstrap_parametros(T, P_OBS, n_bootstrap=300, tam_lote=100, semilla=2)
+    paralelo = bootstrap_parametros(T, P_OBS, n_bootstrap=300, tam_lote=100, semilla=2,
+                                    n_procesos=2)
+    np.testing.assert_array_equal(paralelo['replicas'], serie['replicas'])
+
+
+def test_metodo_invalido():
+    with pytest.raises(ValueError):
+        bootstrap_parametros(T, P_OBS, metodo='parametrico')
+
+
+def test_jackknife_descarta_ajustes_no_convergidos(monkeypatch):
+    import Bootstrap
+    original = Bootstrap.ajustar_lote
+    capturado = {}
+
+    def ajustar_con_fallo(t, P_obs, **kwargs):
+        ajuste = original(t, P_obs, **kwargs)
+        if np.ndim(t) == 2:
+            # Llamada del jackknife: el primer ajuste "no converge" y queda lejos
+            capturado['validos'] = Bootstrap._cantidades(ajuste)[1:]
+            ajuste['convergio'][0] = False
+            ajuste['P0'][0] *= 1e3
+        return ajuste
+
+    monkeypatch.setattr(Bootstrap, 'ajustar_lote', ajustar_con_fallo)
+    res = bootstrap_parametros(T, P_OBS, n_bootstrap=200, semilla=3)
+    np.testing.assert_allclose(res['bca'], intervalos_bca(res['replicas'], res['estimacion'],
+                                                          capturado['validos']))
@@ -0,0 +1,74 @@
+"""Pruebas de regresion del cache de resultados en disco."""
+
+import os
+
+import numpy as np
+import pytest
+
+from Cache_Resultados import CacheResultados, guardar_atomico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+def _derivada(t, P):
+    return P
+
+
+def test_argumentos_por_nombre_y_posicionales(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path))
+    assert (cache.clave(ModeloTumorEuler, {'P0': 100.0}) == cache.clave(ModeloTumorEuler, {'P0': 100.0})
+            != cache.clave(ModeloTumorEuler, {'P0': 100.0 + 1e-13}))
+    cache.modelo(ModeloTumorEuler, 100, 2.0, 0.5, h=0.01)
+    cache.modelo(ModeloTumorEuler, P0=100, beta0=2.0, alpha=0.5, h=0.01, t_max=10.0)
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+
+
+def test_restaura_el_modelo(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path))
+    original = cache.modelo(ModeloTumorRK4, 100.0, 2.0, 0.5, h=0.05)
+    restaurado = cache.modelo(ModeloTumorRK4, 100.0, 2.0, 0.5, h=0.05)
+    assert cache.aciertos == 1 and type(restaurado) is ModeloTumorRK4
+    np.testing.assert_array_equal(restaurado.P_vals, original.P_vals)
+    assert (restaurado.nombre, restaurado.pasos, restaurado.evaluaciones_f) == \
+        (original.nombre, original.pasos, original.evaluaciones_f)
+    assert restaurado.resolver(3.3) == original.resolver(3.3)
+    assert restaurado.tiempo_umbral(1000.0) == original.tiempo_umbral(1000.0)
+    # No se integro nada al restaurar
+    assert original.tiempo_integracion > 0 and restaurado.tiempo_integracion == 0.0
+
+
+def test_desalojo_de_las_menos_usadas(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path), limite_bytes=2**18)
+    for h in np.linspace(1e-3, 2e-3, 6):
+        cache.modelo(ModeloTumorEuler, 100.0, 2.0, 0.5, h=h)
+    assert 0 < len(cache._entradas()) < 6
+    assert cache.tamano_total() <= cache.limite_bytes
+    # La ultima entrada escrita sobrevive
+    cache.modelo(ModeloTumorEuler, 100.0, 2.0, 0.5, h=2e-3)
+    assert cache.aciertos == 1
+
+
+def test_rechaza_lambdas_y_funciones_locales(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path))
+
+    def local(t, P):
+        return P
+
+    for funcion in (lambda t, P: P, local):
+        with pytest.raises(TypeError):
+            cache.clave(funcion)
+    assert len(cache.clave(_derivada)) == 64
+
+
+def test_temporales_no_cuentan_ni_quedan(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path))
+    cache.escribir('a' * 64, x=np.zeros(1000))
+    (tmp_path / 'escribiendo.tmp').write_bytes(b'\0' * 10**6)
+    assert len(cache._entradas()) == 1 and cache.tamano_total() < 10**5
+
+    # Un os.replace fallido borra su temporal
+    destino = tmp_path / 'directorio.npz'
+    destino.mkdir()
+    with pytest.raises(OSError):
+        guardar_atomico(str(destino), x=np.zeros(3))
+    assert sorted(os.listdir(tmp_path)) == ['a' * 64 + '.npz', 'directorio.npz', 'escribiendo.tmp']
@@ -0,0 +1,45 @@
+"""Pruebas de regresion de la clasificacion en lote de sistemas 2x2."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from Clasificacion_Estabilidad import clasificar_sistemas
+
+
+@pytest.mark.parametrize('J, nombre', [
+    ([[1, -1], [2, -3]], 'silla'),
+    ([[-1, 0], [0, -2]], 'nodo estable'),
+    ([[1, 0], [0, 2]], 'nodo inestable'),
+    ([[-1, 1], [0, -1]], 'nodo degenerado estable'),
+    ([[1, 1], [0, 1]], 'nodo degenerado inestable'),
+    ([[-1, -2], [2, -1]], 'espiral estable'),
+    ([[1, -2], [2, 1]], 'espiral inestable'),
+    ([[0, -1], [1, 0]], 'centro'),
+    ([[1, 2], [2, 4]], 'degenerado'),
+])
+def test_tipos(J, nombre):
+    res = clasificar_sistemas(J)
+    assert res['nombre'] == nombre
+    assert res['estable'] == (nombre in ('nodo estable', 'nodo degenerado estable', 'espiral estable'))
+
+
+def test_lote_contra_eigvals():
+    J = np.random.default_rng(0).normal(size=(5000, 2, 2))
+    res = clasificar_sistemas(J)
+    np.testing.assert_allclose(np.sort_complex(res['autovalores']),
+                               np.sort_complex(np.linalg.eigvals(J)), atol=1e-12)
+    residuo = (np.einsum('nij,njk->nik', J, res['autovectores'])
+               - res['autovectores'] * res['autovalores'][:, None, :])
+    assert np.max(np.abs(residuo)) < 1e-10
+    np.testing.assert_array_equal(res['tipo'] == 0, res['determinante'] < 0)
+
+
+def test_no_importa_matplotlib():
+    # La clasificacion no debe arrastrar matplotlib (solo la grafica lo usa)
+    codigo = "import sys, Clasificacion_Estabilidad; assert 'matplotlib' not in sys.modules"
+    subprocess.run([sys.executable, '-c', codigo], check=True,
+                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
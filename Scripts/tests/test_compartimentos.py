@@ -0,0 +1,63 @@
+"""Pruebas de regresion del modelo de N compartimentos."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorCompartimentos import ModeloTumorCompartimentos
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+def cadena(N):
+    """Proliferacion en la diagonal y paso al compartimento siguiente."""
+    p = np.linspace(0.5, 1.0, N)
+    d = np.full(N - 1, 0.3)
+    return sparse.diags([p - np.append(d, 0.0), d], [0, -1], format='csr')
+
+
+def test_un_compartimento_es_el_modelo_escalar():
+    t = np.linspace(0, 10, 11)
+    uno = ModeloTumorCompartimentos([100.0], [[1.0]], beta0=2.0, alpha=0.5)
+    analitico = ModeloTumorAnalitico(100.0, 2.0, 0.5)
+    np.testing.assert_allclose(uno.resolver(t), analitico.resolver(t), rtol=1e-10)
+    np.testing.assert_allclose(uno.limite_asintotico(), analitico.limite_asintotico(), rtol=1e-10)
+
+
+def test_krylov_contra_rk4():
+    t = np.array([0.0, 0.37, 2.0, 5.0])
+    X0 = np.linspace(1.0, 2.0, 50)
+    krylov = ModeloTumorCompartimentos(X0, cadena(50), beta0=2.0, alpha=0.5)
+    rk4 = ModeloTumorCompartimentos(X0, cadena(50), beta0=2.0, alpha=0.5,
+                                    metodo_numerico=ModeloTumorRK4, h=0.01)
+    np.testing.assert_allclose(rk4.resolver_estados(t), krylov.resolver_estados(t), rtol=1e-8)
+    assert rk4.evaluaciones_f == ModeloTumorRK4.evaluaciones_por_paso * rk4.pasos
+
+
+def test_sin_decaimiento_el_limite_es_infinito():
+    modelo = ModeloTumorCompartimentos([1.0, 1.0], cadena(2), beta0=1.0, alpha=0.0)
+    assert modelo.limite_asintotico() == np.inf
+    assert modelo.tiempo_fraccion_limite(0.5) == np.inf
+    np.testing.assert_array_equal(modelo.tiempo_fraccion_limite([0.5, 0.9]), [np.inf, np.inf])
+
+
+def test_sin_decaimiento_el_espectro_decide_el_limite():
+    # J que decae: la poblacion se extingue aunque alpha = 0
+    decae = ModeloTumorCompartimentos([1.0], [[-1.0]], beta0=1.0, alpha=0.0)
+    assert decae.limite_asintotico() == 0.0 and decae.resolver(50.0) < 1e-20
+    assert decae.tiempo_fraccion_limite(0.5) == np.inf
+    # Mismo criterio por ARPACK para N grande (un modo inestable aislado)
+    N = 3000
+    diagonal = -np.linspace(1.0, 2.0, N)
+    diagonal[N // 2] = 0.5
+    grande = ModeloTumorCompartimentos(np.ones(N), sparse.diags(diagonal), beta0=1.0, alpha=0.0)
+    np.testing.assert_allclose(grande.abscisa_espectral(), 0.5, rtol=1e-8)
+    assert grande.limite_asintotico() == np.inf
+    with pytest.raises(ValueError, match="abscisa espectral nula"):
+        ModeloTumorCompartimentos([1.0, 1.0], [[0.0, 1.0], [0.0, 0.0]], alpha=0.0).limite_asintotico()
+
+
+def test_rechaza_metodo_multipaso():
+    with pytest.raises(ValueError, match="no es un metodo de un paso"):
+        ModeloTumorCompartimentos([1.0], lambda t: sparse.eye(1), metodo_numerico=ModeloTumorABM4)
@@ -0,0 +1,36 @@
+"""Pruebas de regresion de los numeros de condicion."""
+
+import numpy as np
+import pytest
+
+from Condicionamiento import digitos_perdidos, mal_condicionado, mapa_condicionamiento, numeros_condicion
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+
+
+def test_contra_el_jacobiano():
+    t = np.linspace(0.5, 20, 40)
+    modelo = ModeloTumorAnalitico(100.0, 2.0, 0.5)
+    esperado = np.abs(np.array([100.0, 2.0, 0.5]) / modelo.resolver(t)[:, None] * modelo.jacobiano(t))
+    kappa = numeros_condicion(100.0, 2.0, 0.5, t)
+    for j, clave in enumerate(['P0', 'beta0', 'alpha']):
+        np.testing.assert_allclose(kappa[clave], esperado[:, j], rtol=1e-12)
+    np.testing.assert_allclose(kappa['amplificacion'], modelo.resolver(t) / 100.0, rtol=1e-12)
+
+
+def test_alpha_cero_y_sin_desbordamiento():
+    kappa = numeros_condicion(1.0, 2.0, [0.0, 1e-300], 5.0)
+    np.testing.assert_allclose(kappa['beta0'], 10.0)
+    np.testing.assert_allclose(kappa['alpha'], 0.0, atol=1e-12)
+    grande = numeros_condicion(1.0, 2000.0, 0.5, 10.0)
+    assert np.isfinite(grande['total']) and np.isinf(grande['amplificacion'])
+
+
+def test_mapa_formas_y_clasificacion():
+    x, y = np.linspace(0.1, 20, 7), np.linspace(0.02, 3, 5)
+    mapa = mapa_condicionamiento(x, y, ejes=('beta0', 'alpha'), t=20.0)
+    assert mapa['total'].shape == (5, 7)
+    np.testing.assert_allclose(mapa['total'][3, 4], numeros_condicion(1.0, x[4], y[3], 20.0)['total'])
+    assert mapa['fijos'] == {'P0': 1.0, 't': 20.0}
+    np.testing.assert_array_equal(mal_condicionado(mapa['total']), digitos_perdidos(mapa['total']) > 2)
+    with pytest.raises(ValueError):
+        mapa_condicionamiento(x, y, ejes=('beta0', 'beta0'))
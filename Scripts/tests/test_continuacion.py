@@ -0,0 +1,30 @@
+"""Pruebas de regresion de la continuacion por pseudo-longitud de arco."""
+
+import numpy as np
+
+from Continuacion import Horquilla, continuar, diagrama_bifurcacion
+
+
+def test_horquilla_perfecta():
+    diagrama = diagrama_bifurcacion(Horquilla(), z0=0.0, mu0=-2.0, mu_min=-2.0, mu_max=2.0)
+    assert [p['tipo'] for p in diagrama['puntos']] == ['horquilla']
+    assert abs(diagrama['puntos'][0]['mu']) < 1e-8
+    rama = diagrama['ramas'][1]
+    exacta = np.sign(rama['z']) * np.sqrt(np.maximum(rama['mu'], 0))
+    np.testing.assert_allclose(rama['z'], exacta, atol=1e-10)
+    # Las ramas no triviales z = +/- sqrt(mu) son estables
+    assert np.all(rama['estable'][np.abs(rama['z']) > 0.1])
+
+
+def test_pliegue_de_la_horquilla_imperfecta():
+    diagrama = diagrama_bifurcacion(Horquilla(imperfeccion=0.1), z0=0.0, mu0=-2.0,
+                                    otros_inicios=[(-1.35, 2.0)], mu_min=-2.0, mu_max=2.0)
+    pliegues = [p for p in diagrama['puntos'] if p['tipo'] == 'pliegue']
+    assert len(pliegues) == 1
+    np.testing.assert_allclose(pliegues[0]['mu'], 3 * 0.05**(2 / 3), rtol=1e-8)
+
+
+def test_rama_satisface_la_ecuacion():
+    ecuacion = Horquilla(imperfeccion=0.1)
+    rama = continuar(ecuacion, -1.35, 2.0, mu_min=-2.0, mu_max=2.0)
+    assert np.max(np.abs(ecuacion.f(rama['z'], rama['mu']))) < 1e-10
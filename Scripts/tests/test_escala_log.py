@@ -0,0 +1,40 @@
+"""Pruebas de regresion del modo de integracion en espacio logaritmico."""
+
+import numpy as np
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorExponencial import ModeloTumorExponencial
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+T = np.linspace(0, 10, 41)
+
+
+def test_log_coincide_con_integracion_directa():
+    directo = ModeloTumorRK4(100, 2.0, 0.5, h=0.01).resolver(T)
+    logaritmico = ModeloTumorRK4(100, 2.0, 0.5, h=0.01, escala_log=True).resolver(T)
+    np.testing.assert_allclose(logaritmico, directo, rtol=1e-6)
+
+
+def test_parametros_extremos_no_desbordan():
+    analitico = ModeloTumorAnalitico(100, 2000.0, 0.5)
+    with np.errstate(over='ignore'):
+        assert np.isinf(analitico.resolver(10.0))
+    exacto = analitico.resolver_log(T)
+    assert np.all(np.isfinite(exacto))
+
+    for modelo, rtol in [(ModeloTumorRK4(100, 2000.0, 0.5, h=0.01, escala_log=True), 1e-8),
+                         (ModeloTumorEuler(100, 2000.0, 0.5, h=0.001, escala_log=True), 1e-3),
+                         (ModeloTumorExponencial(100, 2000.0, 0.5, h=0.5), 1e-12)]:
+        np.testing.assert_allclose(modelo.resolver_log(T), exacto, rtol=rtol)
+
+
+def test_resolver_escalado():
+    # Tramo donde P cambia menos de e^700 (la mantisa no se anula)
+    t = np.linspace(5, 10, 21)
+    modelo = ModeloTumorAnalitico(100, 2000.0, 0.5)
+    mantisa, log_escala = modelo.resolver_escalado(t)
+    assert np.all((mantisa > 0) & (mantisa <= 1)) and mantisa.max() == 1.0
+    np.testing.assert_allclose(np.log(mantisa) + log_escala, modelo.resolver_log(t), rtol=1e-14)
+    np.testing.assert_allclose(modelo.limite_asintotico_log(), np.log(100) + 4000.0)
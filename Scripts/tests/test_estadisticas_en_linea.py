@@ -0,0 +1,33 @@
+"""Pruebas de regresion de los cuantiles en linea (P^2)."""
+
+import numpy as np
+import pytest
+
+from Estadisticas_En_Linea import CuantilP2
+
+
+def test_p2_aproxima_los_cuantiles():
+    escala = np.array([1.0, 2.0, 5.0])
+    datos = np.random.default_rng(0).standard_normal((20000, 3)) * escala
+    p2 = CuantilP2([0.05, 0.5, 0.95], 3)
+    for inicio in range(0, len(datos), 4096):
+        p2.actualizar(datos[inicio:inicio + 4096])
+    exactos = np.quantile(datos, [0.05, 0.5, 0.95], axis=0)
+    np.testing.assert_allclose(p2.cuantiles() / escala, exactos / escala, atol=0.05)
+
+
+def test_bloques_equivalen_a_filas():
+    datos = np.random.default_rng(1).exponential(size=(300, 2))
+    por_bloque, por_fila = CuantilP2([0.25, 0.9], 2), CuantilP2([0.25, 0.9], 2)
+    por_bloque.actualizar(datos)
+    for fila in datos:
+        por_fila.actualizar(fila)
+    np.testing.assert_array_equal(por_bloque.cuantiles(), por_fila.cuantiles())
+
+
+def test_pocas_observaciones():
+    p2 = CuantilP2([0.5], 2)
+    with pytest.raises(ValueError, match="no ha recibido observaciones"):
+        p2.cuantiles()
+    p2.actualizar([[1.0, 10.0], [3.0, 30.0]])
+    np.testing.assert_allclose(p2.cuantiles(), [[2.0, 20.0]])
@@ -0,0 +1,47 @@
+"""Pruebas de regresion de la propagacion de incertidumbre (QMC)."""
+
+import numpy as np
+import pytest
+
+from Incertidumbre import propagar_incertidumbre, rango_solucion
+
+
+# Con solo beta0 ~ U(a, b), P(t) = P0 exp(beta0 g) tiene media y cuantiles cerrados
+A, B, ALPHA, P0 = 1.5, 2.5, 0.5, 100.0
+DISTRIBUCIONES = {'P0': P0, 'beta0': ('uniforme', A, B), 'alpha': ALPHA}
+T = np.array([1.0, 5.0, 10.0])
+G = -np.expm1(-ALPHA * T) / ALPHA
+
+
+def test_media_sobol_contra_cerrada():
+    exacta = P0 * (np.exp(B * G) - np.exp(A * G)) / ((B - A) * G)
+    res = propagar_incertidumbre(DISTRIBUCIONES, T, n_muestras=2**14, semilla=1)
+    np.testing.assert_allclose(res['media'], exacta, rtol=1e-6)
+
+
+@pytest.mark.parametrize('metodo', ['histograma', 'p2'])
+def test_cuantiles_contra_cerrados(metodo):
+    niveles = (0.05, 0.5, 0.95)
+    exactos = P0 * np.exp(np.outer(A + (B - A) * np.array(niveles), G))
+    res = propagar_incertidumbre(DISTRIBUCIONES, T, n_muestras=2**14, niveles=niveles,
+                                 metodo_cuantiles=metodo, semilla=1)
+    np.testing.assert_allclose(res['cuantiles'], exactos, rtol=1e-2)
+
+
+def test_sobol_mas_preciso_que_aleatorio():
+    exacta = P0 * (np.exp(B * G[-1]) - np.exp(A * G[-1])) / ((B - A) * G[-1])
+    errores = {m: abs(propagar_incertidumbre(DISTRIBUCIONES, T[-1:], n_muestras=2**12,
+                                             tam_bloque=2**12, muestreo=m, semilla=3)['media'][0]
+                      - exacta) for m in ('aleatorio', 'sobol')}
+    assert errores['sobol'] < 0.1 * errores['aleatorio']
+
+
+def test_rango_solucion_contiene_las_esquinas():
+    P_min, P_max = rango_solucion(DISTRIBUCIONES, T)
+    np.testing.assert_allclose(P_min, P0 * np.exp(A * G))
+    np.testing.assert_allclose(P_max, P0 * np.exp(B * G))
+
+
+def test_muestreo_invalido():
+    with pytest.raises(ValueError):
+        propagar_incertidumbre(DISTRIBUCIONES, T, muestreo='halton')
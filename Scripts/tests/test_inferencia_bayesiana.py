@@ -0,0 +1,54 @@
+"""Pruebas de regresion del MCMC por ensamble y sus puntos de control."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Inferencia_Bayesiana import muestrear_posterior, rhat
+
+
+T = np.linspace(0, 8, 15)
+P_OBS = ModeloTumorAnalitico(100.0, 2.0, 0.5).resolver(T) * np.exp(
+    0.05 * np.random.default_rng(1).standard_normal(T.size))
+OPCIONES = dict(n_cadenas=1, n_caminantes=16, semilla=3)
+
+
+def test_posterior_contiene_los_parametros_reales():
+    res = muestrear_posterior(T, P_OBS, n_cadenas=2, n_caminantes=32, n_pasos=1500, semilla=7)
+    for nombre, real in [('P0', 100.0), ('beta0', 2.0), ('alpha', 0.5)]:
+        q_inf, _, q_sup = res['intervalos'][nombre]
+        assert q_inf < real < q_sup
+    assert np.all(res['rhat'] < 1.1)
+    assert 0.2 < res['aceptacion'] < 0.8
+
+
+def test_reanudar_reproduce_la_corrida_completa(tmp_path):
+    completa = muestrear_posterior(T, P_OBS, n_pasos=120, **OPCIONES)
+    muestrear_posterior(T, P_OBS, n_pasos=60, directorio_control=tmp_path, cada=30, **OPCIONES)
+    reanudada = muestrear_posterior(T, P_OBS, n_pasos=120, directorio_control=tmp_path, cada=30,
+                                    **OPCIONES)
+    np.testing.assert_array_equal(reanudada['cadenas'], completa['cadenas'])
+    assert reanudada['aceptacion'] == completa['aceptacion']
+
+
+def test_punto_de_control_mas_largo_se_recorta(tmp_path):
+    muestrear_posterior(T, P_OBS, n_pasos=120, directorio_control=tmp_path, cada=40, **OPCIONES)
+    corta = muestrear_posterior(T, P_OBS, n_pasos=60, **OPCIONES)
+    recortada = muestrear_posterior(T, P_OBS, n_pasos=60, directorio_control=tmp_path, **OPCIONES)
+    np.testing.assert_array_equal(recortada['cadenas'], corta['cadenas'])
+    assert recortada['aceptacion'] == corta['aceptacion']
+
+
+@pytest.mark.parametrize('cambio', [dict(P_obs=10 * P_OBS), dict(sigma=0.2),
+                                    dict(n_caminantes=8), dict(semilla=4)])
+def test_configuracion_distinta_se_rechaza(tmp_path, cambio):
+    muestrear_posterior(T, P_OBS, n_pasos=40, directorio_control=tmp_path, cada=20, **OPCIONES)
+    argumentos = dict(OPCIONES, P_obs=P_OBS, n_pasos=40, directorio_control=tmp_path)
+    argumentos.update(cambio)
+    with pytest.raises(ValueError, match='otra configuracion'):
+        muestrear_posterior(T, **argumentos)
+
+
+def test_rhat_cercano_a_1_para_muestras_iid():
+    muestras = np.random.default_rng(0).standard_normal((2000, 8, 2))
+    np.testing.assert_allclose(rhat(muestras), 1.0, atol=0.01)
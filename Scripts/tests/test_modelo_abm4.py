@@ -0,0 +1,31 @@
+"""Pruebas de regresion del metodo multipaso ABM4."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+
+
+T_NODOS = np.linspace(0, 10, 11)
+P_EXACTO = ModeloTumorAnalitico(100, 2.0, 0.5).resolver(T_NODOS)
+
+
+@pytest.mark.parametrize('modo', ['PEC', 'PECE'])
+def test_orden_observado_cercano_a_4(modo):
+    errores = [np.max(np.abs(ModeloTumorABM4(100, 2.0, 0.5, h=h, modo=modo).resolver(T_NODOS)
+                             - P_EXACTO)) for h in (0.05, 0.025)]
+    assert 3.5 < np.log2(errores[0] / errores[1]) < 4.5
+
+
+def test_pec_evalua_f_una_vez_por_paso():
+    pec = ModeloTumorABM4(100, 2.0, 0.5, h=0.01, modo='PEC').estadisticas_trabajo()
+    pece = ModeloTumorABM4(100, 2.0, 0.5, h=0.01, modo='PECE').estadisticas_trabajo()
+    # Solo el arranque con RK4 agrega evaluaciones extra
+    assert pec['evaluaciones_por_paso'] < 1.02
+    assert 1.98 < pece['evaluaciones_por_paso'] < 2.02
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        ModeloTumorABM4(100, 2.0, 0.5, modo='PC')
@@ -0,0 +1,54 @@
+"""Pruebas de regresion del modelo estocastico (Monte Carlo de la EDE)."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Estadisticas_En_Linea import AcumuladorMomentos
+from ModeloTumorEstocastico import ModeloTumorEstocastico
+from ModeloTumorEuler import ModeloTumorEuler
+
+
+def test_media_monte_carlo_contra_euler_deterministico():
+    # E[1 + r h + sigma dW] = 1 + r h: la media del esquema es Euler sin ruido
+    modelo = ModeloTumorEstocastico(100, 2.0, 0.5, sigma=0.1, h=0.01, t_max=5.0)
+    resultado = modelo.simular(20000, t_salida=[0, 1, 5], semilla=1)
+    exacta = ModeloTumorEuler(100, 2.0, 0.5, h=0.01, t_max=5.0).resolver(resultado['t'])
+    error_estandar = np.sqrt(resultado['varianza'] / resultado['n_trayectorias'])
+    assert np.all(np.abs(resultado['media'] - exacta) <= 5 * error_estandar + 1e-9)
+    assert resultado['fuera_de_rango'] == 0
+
+
+def test_reproducible_con_semilla():
+    modelo = ModeloTumorEstocastico(100, 2.0, 0.5, h=0.05, t_max=2.0)
+    a = modelo.simular(3000, semilla=7, tam_bloque=1000)
+    b = modelo.simular(3000, semilla=7, tam_bloque=1000)
+    np.testing.assert_array_equal(a['media'], b['media'])
+    np.testing.assert_array_equal(a['cuantiles'], b['cuantiles'])
+
+
+def test_acumulador_combinado_igual_a_directo():
+    rng = np.random.default_rng(0)
+    datos = rng.lognormal(size=(500, 4))
+    a, b = AcumuladorMomentos(4), AcumuladorMomentos(4)
+    a.actualizar(datos[:123])
+    b.actualizar(datos[123:])
+    a.combinar(b)
+    np.testing.assert_allclose(a.media, datos.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(a.varianza(), datos.var(axis=0, ddof=1), rtol=1e-10)
+
+
+def test_consultas_de_umbral_usan_la_media():
+    modelo = ModeloTumorEstocastico(100, 2.0, 0.5, sigma=0.2)
+    analitico = ModeloTumorAnalitico(100, 2.0, 0.5)
+    umbrales = np.array([500.0, 5000.0, 1e9])
+    np.testing.assert_allclose(modelo.tiempo_umbral(umbrales), analitico.tiempo_umbral(umbrales))
+    np.testing.assert_allclose(modelo.tiempo_fraccion_limite(0.9), analitico.tiempo_fraccion_limite(0.9))
+    t_vals, P_vals = modelo.obtener_trayectoria()
+    np.testing.assert_allclose(P_vals, analitico.resolver(t_vals))
+
+
+def test_con_tolerancia_no_soportado():
+    # Sin orden de paso fijo, elegir_paso rechaza la clase
+    with pytest.raises(ValueError, match="no declara un orden"):
+        ModeloTumorEstocastico.con_tolerancia(100, 2.0, 0.5, tol=1e-3)
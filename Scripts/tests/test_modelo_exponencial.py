@@ -0,0 +1,28 @@
+"""Pruebas de regresion del integrador exponencial (ModeloTumorExponencial)."""
+
+import numpy as np
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorExponencial import ModeloTumorExponencial
+
+
+def test_propagador_exacto_con_pasos_grandes():
+    t = np.arange(0, 11.0)
+    exacto = ModeloTumorAnalitico(100, 2.0, 0.5).resolver(t)
+    np.testing.assert_allclose(ModeloTumorExponencial(100, 2.0, 0.5, h=1.0).resolver(t), exacto,
+                               rtol=1e-13)
+
+
+def test_gauss_2_converge_con_orden_4():
+    t = np.arange(0, 11.0)
+    exacto = ModeloTumorAnalitico(100, 2.0, 0.5).resolver(t)
+    errores = [np.max(np.abs(ModeloTumorExponencial(100, 2.0, 0.5, h=h, nodos_gauss=2).resolver(t)
+                             / exacto - 1)) for h in (0.5, 0.25)]
+    assert 3.7 < np.log2(errores[0] / errores[1]) < 4.3
+
+
+def test_estable_con_beta0_h_grande():
+    exacto = ModeloTumorAnalitico(100, -50.0, 0.5).resolver(10.0)
+    P = ModeloTumorExponencial(100, -50.0, 0.5, h=0.1).resolver(10.0)
+    assert P > 0
+    np.testing.assert_allclose(P, exacto, rtol=1e-10)
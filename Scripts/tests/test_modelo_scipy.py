@@ -0,0 +1,54 @@
+"""Pruebas de regresion del envoltorio de scipy.integrate.solve_ivp."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorScipy import ModeloTumorScipy
+
+T = np.linspace(0, 10, 21)
+EXACTO = ModeloTumorAnalitico(100.0, 2.0, 0.5)
+
+
+@pytest.mark.parametrize('metodo', ['RK45', 'DOP853', 'LSODA', 'Radau'])
+def test_contra_analitico(metodo):
+    modelo = ModeloTumorScipy(100.0, 2.0, 0.5, metodo=metodo, rtol=1e-10, atol=1e-10)
+    np.testing.assert_allclose(modelo.resolver(T), EXACTO.resolver(T), rtol=1e-7)
+    stats = modelo.estadisticas_trabajo()
+    assert stats['evaluaciones_f'] > 0 and stats['pasos'] == len(modelo.solucion.t) - 1
+
+
+def test_tiempo_umbral_sobre_la_salida_densa():
+    modelo = ModeloTumorScipy(100.0, 2.0, 0.5, metodo='DOP853', rtol=1e-10, atol=1e-10)
+    umbrales = np.array([100.0, 500.0, 2000.0, 5000.0, 1e5])
+    np.testing.assert_allclose(modelo.tiempo_umbral(umbrales)[:-1],
+                               EXACTO.tiempo_umbral(umbrales[:-1]), rtol=1e-8)
+    assert modelo.tiempo_umbral(1e5) == np.inf
+
+
+def test_con_tolerancia_usa_rtol():
+    modelo = ModeloTumorScipy.con_tolerancia(100.0, 2.0, 0.5, 1e-8, metodo='DOP853')
+    assert modelo.rtol == 1e-8 and modelo.metodo == 'DOP853'
+    np.testing.assert_allclose(modelo.resolver(T), EXACTO.resolver(T), rtol=1e-6)
+
+
+@pytest.mark.parametrize('metodo', ['DOP853', 'Radau', 'BDF'])
+def test_lote_de_parametros(metodo):
+    P0 = np.array([100.0, 60.0, 150.0])
+    beta0 = np.array([2.0, 1.5, 2.5])
+    modelo = ModeloTumorScipy(P0, beta0, 0.5, metodo=metodo, rtol=1e-10, atol=1e-10)
+    exacta = ModeloTumorAnalitico(P0, beta0, 0.5).resolver(T[:, None])
+    np.testing.assert_allclose(modelo.resolver(T), exacta, rtol=1e-6)
+    assert modelo.resolver(5.0).shape == (3,)
+    t_vals, P_vals = modelo.obtener_trayectoria()
+    assert P_vals.shape == t_vals.shape + (3,)
+    with pytest.raises(ValueError, match="escalares"):
+        modelo.tiempo_umbral(500.0)
+
+
+def test_jacobiano_f_es_df_dP():
+    escalar = ModeloTumorScipy(100.0, 2.0, 0.5)
+    np.testing.assert_allclose(escalar.jacobiano_f(1.0, None), [[2.0 * np.exp(-0.5)]])
+    lote = ModeloTumorScipy(np.array([100.0, 50.0]), np.array([2.0, 1.0]), 0.5)
+    np.testing.assert_allclose(lote.jacobiano_f(1.0, None).toarray(),
+                               np.diag([2.0, 1.0]) * np.exp(-0.5))
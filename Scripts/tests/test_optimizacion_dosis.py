@@ -0,0 +1,54 @@
+"""Pruebas de regresion del gradiente adjunto y la optimizacion de dosis."""
+
+import numpy as np
+import pytest
+
+from ModeloTumorRK4 import ModeloTumorRK4
+from ModeloTumorTratamiento import ModeloTumorPorTramos
+from Optimizacion_Dosis import gradiente_adjunto, objetivo_y_gradiente, optimizar_dosis
+
+
+DOSIS = np.linspace(0.5, 9.5, 10)
+ARGUMENTOS = (100, 2.0, 0.5, DOSIS, 0.3, 0.8)
+
+
+@pytest.mark.parametrize('objetivo', ['log', 'final'])
+def test_gradiente_adjunto_contra_diferencias_finitas(objetivo):
+    u = np.random.default_rng(0).uniform(0, 1, DOSIS.size)
+    J, g = objetivo_y_gradiente(u, *ARGUMENTOS, objetivo=objetivo)
+    eps = 1e-6
+    g_fd = np.array([(objetivo_y_gradiente(u + eps * e, *ARGUMENTOS, objetivo=objetivo)[0]
+                      - objetivo_y_gradiente(u - eps * e, *ARGUMENTOS, objetivo=objetivo)[0]) / (2 * eps)
+                     for e in np.eye(DOSIS.size)])
+    np.testing.assert_allclose(g, g_fd, rtol=1e-6, atol=1e-8 * np.max(np.abs(g_fd)))
+
+
+def test_gradiente_respecto_a_los_parametros_del_tramo():
+    argumentos = dict(P0=100.0, tiempos=[0, 2, 5], beta0s=[2.0, 1.0, 1.5], alphas=[0.5, 0.3, 0.4],
+                      supervivencia=[1.0, 0.6, 0.8])
+    grad = gradiente_adjunto(ModeloTumorPorTramos(**argumentos))
+    eps = 1e-6
+    for clave in ('beta0s', 'alphas', 'supervivencia'):
+        for k in range(3):
+            mas, menos = dict(argumentos), dict(argumentos)
+            mas[clave] = np.array(argumentos[clave], dtype=float)
+            menos[clave] = mas[clave].copy()
+            mas[clave][k] += eps
+            menos[clave][k] -= eps
+            fd = (ModeloTumorPorTramos(**mas).logP_fin[-1]
+                  - ModeloTumorPorTramos(**menos).logP_fin[-1]) / (2 * eps)
+            np.testing.assert_allclose(grad[clave][k], fd, rtol=1e-6, atol=1e-9)
+
+
+def test_gradiente_requiere_modo_cerrado():
+    modelo = ModeloTumorPorTramos(100, [0, 1], 2.0, 0.5, metodo_numerico=ModeloTumorRK4)
+    with pytest.raises(ValueError):
+        gradiente_adjunto(modelo)
+
+
+def test_optimo_respeta_presupuesto_y_mejora():
+    res = optimizar_dosis(100, 2.0, 0.5, DOSIS, presupuesto=5.0, u_max=1.5, kappa=0.3, epsilon=0.8)
+    assert res['convergio']
+    assert res['u'].sum() <= 5.0 + 1e-6
+    assert np.all((res['u'] >= -1e-9) & (res['u'] <= 1.5 + 1e-9))
+    assert res['valor'] < res['valor_inicial']
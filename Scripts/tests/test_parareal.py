@@ -0,0 +1,37 @@
+"""Pruebas de regresion de Parareal."""
+
+import numpy as np
+
+from ModeloTumorParareal import ModeloTumorParareal
+from ModeloTumorRK4 import ModeloTumorRK4
+
+
+T_NODOS = np.linspace(0, 10, 11)
+
+
+def test_converge_a_rk4_secuencial():
+    serie = ModeloTumorRK4(100, 2.0, 0.5, h=0.01).resolver(T_NODOS)
+    modelo = ModeloTumorParareal(100, 2.0, 0.5, h_fino=0.01, h_grueso=0.5, n_segmentos=5,
+                                 n_procesos=1)
+    np.testing.assert_allclose(modelo.resolver(T_NODOS), serie, rtol=1e-11)
+    assert modelo.iteraciones <= modelo.n_segmentos
+    assert modelo.historial[-1]['cambio'] <= 1e-12 or modelo.iteraciones == modelo.n_segmentos
+
+
+def test_procesos_dan_el_mismo_resultado():
+    argumentos = dict(h_fino=0.01, h_grueso=0.5, n_segmentos=4)
+    serie = ModeloTumorParareal(100, 2.0, 0.5, n_procesos=1, **argumentos)
+    paralelo = ModeloTumorParareal(100, 2.0, 0.5, n_procesos=2, **argumentos)
+    np.testing.assert_array_equal(paralelo.P_vals, serie.P_vals)
+
+
+def test_error_decrece_con_las_iteraciones():
+    serie = ModeloTumorRK4(100, 2.0, 0.5, h=0.01).resolver(T_NODOS)
+    errores = []
+    for k in (1, 2, 3, 4):
+        modelo = ModeloTumorParareal(100, 2.0, 0.5, h_fino=0.01, h_grueso=0.1, n_segmentos=8,
+                                     n_procesos=1, max_iter=k)
+        assert modelo.iteraciones == k
+        errores.append(np.max(np.abs(modelo.resolver(T_NODOS) / serie - 1)))
+    assert all(b < 0.1 * a for a, b in zip(errores, errores[1:]))
+    assert errores[-1] < 1e-6
@@ -0,0 +1,60 @@
+"""Pruebas de regresion del modelo de reaccion-difusion."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorReaccionDifusion import ModeloTumorReaccionDifusion
+from ModeloTumorRK4 import ModeloTumorRK4
+
+N = 100
+DX = 1.0 / N
+X = (np.arange(N) + 0.5) * DX
+U0 = 1 + np.cos(np.pi * X)
+
+
+@pytest.mark.parametrize('esquema', ['explicito', 'imex'])
+def test_solo_difusion_conserva_la_masa(esquema):
+    u0 = np.exp(-(X - 0.3)**2 / 0.01)
+    modelo = ModeloTumorReaccionDifusion(u0, 1e-3, 0.0, 0.5, dx=DX, h=0.01, t_max=2.0,
+                                         esquema=esquema)
+    np.testing.assert_allclose(modelo.P_vals, modelo.P0, rtol=1e-12)
+
+
+def test_modo_coseno_y_masa():
+    D, t = 1e-3, 10.0
+    lambda_1 = -4 / DX**2 * np.sin(np.pi / (2 * N))**2
+    crecimiento = ModeloTumorAnalitico(1.0, 2.0, 0.5).resolver(t)
+    exacta = (1 + np.exp(D * lambda_1 * t) * np.cos(np.pi * X)) * crecimiento
+    for esquema in ('explicito', 'imex'):
+        modelo = ModeloTumorReaccionDifusion(U0, D, 2.0, 0.5, dx=DX, h=0.01, esquema=esquema)
+        np.testing.assert_allclose(modelo.resolver_campo(t), exacta, rtol=1e-7)
+        np.testing.assert_allclose(modelo.resolver(t), modelo.P0 * crecimiento, rtol=1e-8)
+        assert modelo.evaluaciones_f == ModeloTumorRK4.evaluaciones_por_paso * modelo.pasos
+
+
+def test_explicito_inestable_y_multipaso_rechazados():
+    with pytest.raises(ValueError, match="esquema='imex'"):
+        ModeloTumorReaccionDifusion(U0, 1.0, 2.0, 0.5, dx=DX, h=0.01)
+    with pytest.raises(ValueError, match="no es un metodo de un paso"):
+        ModeloTumorReaccionDifusion(U0, 1e-3, 2.0, 0.5, dx=DX, metodo_numerico=ModeloTumorABM4)
+
+
+@pytest.mark.parametrize('kwargs, mensaje', [
+    ({'n_campos': 1}, "n_campos"),
+    ({'n_campos': 0}, "n_campos"),
+    ({'h': 0.1, 't_max': 0.05}, "t_max debe ser al menos h"),
+    ({'h': 0.0}, "h debe ser positivo"),
+])
+def test_parametros_de_malla_invalidos(kwargs, mensaje):
+    with pytest.raises(ValueError, match=mensaje):
+        ModeloTumorReaccionDifusion(U0, 1e-3, 2.0, 0.5, dx=DX, esquema='imex', **kwargs)
+
+
+def test_un_solo_paso_guarda_dos_campos():
+    modelo = ModeloTumorReaccionDifusion(U0, 1e-3, 2.0, 0.5, dx=DX, h=0.1, t_max=0.1,
+                                         esquema='imex', n_campos=2)
+    assert modelo.campos.shape == (2, N)
+    np.testing.assert_allclose(modelo.resolver_campo(0.0), U0)
+    assert modelo.resolver_campo(0.05).shape == U0.shape
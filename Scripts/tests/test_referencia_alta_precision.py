@@ -0,0 +1,41 @@
+"""Pruebas de regresion de la referencia doble-doble con cache."""
+
+import mpmath
+import numpy as np
+
+import Referencia_Alta_Precision
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from Referencia_Alta_Precision import error_relativo, solucion_referencia
+
+T = np.linspace(0, 10, 41)
+
+
+def test_alto_y_bajo_contra_mpmath():
+    alto, bajo = solucion_referencia(100.0, 2.0, 0.5, T, usar_cache=False)
+    assert np.all(np.abs(bajo) <= 0.5 * np.spacing(alto))
+    with mpmath.workdps(60):
+        for t_i, a, b in zip(T[::8], alto[::8], bajo[::8]):
+            exacto = 100 * mpmath.exp(-4 * mpmath.expm1(-mpmath.mpf(float(t_i)) / 2))
+            assert abs((mpmath.mpf(a) + mpmath.mpf(b)) / exacto - 1) < 1e-30
+
+
+def test_error_relativo_por_debajo_de_un_ulp():
+    referencia = solucion_referencia(100.0, 2.0, 0.5, T, usar_cache=False)
+    alto, bajo = referencia
+    np.testing.assert_allclose(error_relativo(alto, referencia), -bajo / alto, rtol=1e-12, atol=0)
+    error = np.abs(error_relativo(ModeloTumorAnalitico(100.0, 2.0, 0.5).resolver(T), referencia))
+    assert 0 < error.max() < 1e-13
+
+
+def test_cache_en_disco(tmp_path, monkeypatch):
+    primera = solucion_referencia(100.0, 2.0, 0.5, T, directorio_cache=str(tmp_path))
+    assert list(tmp_path.iterdir())
+
+    def sin_mpmath(*args):
+        raise AssertionError("la referencia debia leerse del cache")
+
+    # Sin mpmath la segunda llamada solo puede salir del disco
+    monkeypatch.setattr(Referencia_Alta_Precision.mpmath, 'workdps', sin_mpmath)
+    segunda = solucion_referencia(100.0, 2.0, 0.5, T, directorio_cache=str(tmp_path))
+    for a, b in zip(primera, segunda):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,57 @@
+"""Pruebas de regresion del registro de familias de crecimiento."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Registro_Modelos import ModeloCrecimiento
+
+CASOS = {
+    'tumor': {'beta0': 2.0, 'alpha': 0.5},
+    'gompertz': {'a': 0.4, 'K': 5000.0},
+    'logistica': {'k': 0.0005, 'M': 1000.0},
+    'von_bertalanffy': {'a': 10.0, 'b': 0.5},
+}
+T = np.linspace(0, 10, 11)
+
+
+@pytest.mark.parametrize('familia', CASOS)
+def test_rk4_contra_formula_cerrada(familia):
+    exacto = ModeloCrecimiento(familia, 100.0, **CASOS[familia])
+    rk4 = ModeloCrecimiento(familia, 100.0, metodo_numerico=ModeloTumorRK4, h=0.1, **CASOS[familia])
+    np.testing.assert_allclose(rk4.resolver(T), exacto.resolver(T), rtol=1e-4)
+    assert rk4.nombre == f"{familia.capitalize()} (RK4, h=0.1)"
+    assert rk4.evaluaciones_f == 4 * rk4.pasos + len(rk4.t_vals)
+
+
+def test_tumor_es_el_modelo_analitico():
+    tumor = ModeloCrecimiento('tumor', 100.0, **CASOS['tumor'])
+    np.testing.assert_allclose(tumor.resolver(T), ModeloTumorAnalitico(100.0, 2.0, 0.5).resolver(T),
+                               rtol=1e-14)
+    assert (tumor.beta0, tumor.alpha) == (2.0, 0.5)
+    assert np.isnan(ModeloCrecimiento('gompertz', 100.0, **CASOS['gompertz']).beta0)
+
+
+@pytest.mark.parametrize('metodo_numerico', [None, ModeloTumorEuler])
+def test_tiempo_umbral_en_lote(metodo_numerico):
+    P0 = np.array([10.0, 100.0, 200.0])
+    lote = ModeloCrecimiento('logistica', P0, metodo_numerico=metodo_numerico, **CASOS['logistica'])
+    tiempos = lote.tiempo_umbral(np.array([300.0, 500.0])[:, None])
+    assert tiempos.shape == (2, 3)
+    for j, p in enumerate(P0):
+        uno = ModeloCrecimiento('logistica', p, metodo_numerico=metodo_numerico, **CASOS['logistica'])
+        np.testing.assert_allclose(tiempos[:, j], uno.tiempo_umbral([300.0, 500.0]), rtol=1e-12)
+    # Cada trayectoria usa su propio limite
+    np.testing.assert_allclose(lote.tiempo_fraccion_limite(0.5), tiempos[1], rtol=1e-12)
+
+
+def test_configuraciones_rechazadas():
+    with pytest.raises(ValueError, match="no declara un orden"):
+        ModeloCrecimiento.con_tolerancia(100.0, 2.0, 0.5, 1e-6)
+    with pytest.raises(ValueError, match="no es un metodo de un paso"):
+        ModeloCrecimiento('tumor', 100.0, metodo_numerico=ModeloTumorABM4, **CASOS['tumor'])
+    with pytest.raises(ValueError):
+        ModeloCrecimiento('gompertz', 100.0, a=0.4)
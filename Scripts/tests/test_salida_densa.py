@@ -0,0 +1,62 @@
+"""Pruebas de regresion de los tiempos de cruce (Salida_Densa, tiempo_umbral)."""
+
+import numpy as np
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Salida_Densa import interpolar_hermite, tiempos_cruce
+
+
+P0, BETA0, ALPHA = 100.0, 2.0, 0.5
+
+
+def test_cruce_hermite_rk4_contra_analitico():
+    umbrales = np.array([150.0, 500.0, 1000.0, 4000.0, 5000.0])
+    exacto = ModeloTumorAnalitico(P0, BETA0, ALPHA).tiempo_umbral(umbrales)
+    numerico = ModeloTumorRK4(P0, BETA0, ALPHA, h=0.01).tiempo_umbral(umbrales)
+    np.testing.assert_allclose(numerico, exacto, rtol=1e-7)
+
+
+def test_cruce_lineal_euler_es_raiz_del_interpolante():
+    modelo = ModeloTumorEuler(P0, BETA0, ALPHA, h=0.1)
+    umbrales = np.array([200.0, 1000.0, 3000.0])
+    t_cruce = modelo.tiempo_umbral(umbrales)
+    t_vals, P_vals = modelo.obtener_trayectoria()
+    np.testing.assert_allclose(np.interp(t_cruce, t_vals, P_vals), umbrales, rtol=1e-12)
+
+
+def test_umbrales_inalcanzables_y_condicion_inicial():
+    P_inf = ModeloTumorAnalitico(P0, BETA0, ALPHA).limite_asintotico()
+    modelo = ModeloTumorRK4(P0, BETA0, ALPHA, h=0.05)
+    t = modelo.tiempo_umbral(np.array([P0, 2 * P_inf, 50.0]))
+    assert t[0] == 0.0
+    assert np.isinf(t[1]) and np.isinf(t[2])
+    assert np.isinf(ModeloTumorAnalitico(P0, BETA0, ALPHA).tiempo_umbral(2 * P_inf))
+
+
+def test_inversa_cerrada_sin_limite_acotado():
+    # alpha < 0: la tasa crece y todo umbral por encima de P0 se alcanza
+    creciente = ModeloTumorAnalitico(P0, 1.0, -0.2)
+    umbrales = np.array([1000.0, 5e5])
+    t = creciente.tiempo_umbral(umbrales)
+    assert np.all(np.isfinite(t))
+    np.testing.assert_allclose(creciente.resolver(t), umbrales, rtol=1e-12)
+    np.testing.assert_allclose(t, ModeloTumorRK4(P0, 1.0, -0.2, h=0.01).tiempo_umbral(umbrales),
+                               rtol=1e-7)
+    assert creciente.tiempo_umbral(50.0) == np.inf
+    # alpha = 0: crecimiento exponencial, t = ln(c/P0)/beta0
+    np.testing.assert_allclose(ModeloTumorAnalitico(P0, 2.0, 0.0).tiempo_umbral(1000.0), np.log(10) / 2)
+
+
+def test_cruce_no_monotono_es_el_primero():
+    t_vals = np.linspace(0, 2 * np.pi, 401)
+    t = tiempos_cruce(t_vals, np.sin(t_vals), [0.5, -0.5], dP_vals=np.cos(t_vals))
+    np.testing.assert_allclose(t, [np.pi / 6, 7 * np.pi / 6], atol=1e-9)
+
+
+def test_hermite_exacto_para_cubicas():
+    t_vals = np.linspace(0, 1, 5)
+    t = np.linspace(0, 1, 37)
+    np.testing.assert_allclose(interpolar_hermite(t, t_vals, t_vals**3, 3 * t_vals**2), t**3,
+                               atol=1e-14)
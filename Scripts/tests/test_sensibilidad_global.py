@@ -0,0 +1,50 @@
+"""Pruebas de regresion de los indices de Sobol (Saltelli)."""
+
+import numpy as np
+import pytest
+
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Sensibilidad_Global import indices_sobol, integrar_lote
+
+
+def test_integrar_lote_igual_a_los_modelos():
+    P0 = np.array([100.0, 60.0])
+    beta0 = np.array([2.0, 1.0])
+    alpha = np.array([0.5, 0.3])
+    h = np.array([0.1, 0.05])
+    t = np.array([0.0, 0.5, 3.0, 10.0])
+    for clase in (ModeloTumorEuler, ModeloTumorRK4):
+        lote = integrar_lote(clase.paso, P0, beta0, alpha, h, t)
+        for i in range(2):
+            individual = clase(P0[i], beta0[i], alpha[i], h=h[i]).resolver(t)
+            np.testing.assert_allclose(lote[i], individual, rtol=1e-12)
+
+
+@pytest.mark.parametrize('h', [0.0, -0.1, np.nan])
+def test_integrar_lote_rechaza_h_no_positivo(h):
+    with pytest.raises(ValueError, match="h debe ser positivo"):
+        integrar_lote(ModeloTumorRK4.paso, [100.0, 100.0], 2.0, 0.5, [0.1, h], [1.0])
+
+
+def test_en_t_0_solo_importa_P0():
+    rangos = {'P0': (50, 150), 'beta0': (1.5, 2.5), 'alpha': (0.3, 0.7)}
+    res = indices_sobol([0.0, 10.0], rangos, n_base=2**12, semilla=1)
+    np.testing.assert_allclose(res['S1'][:, 0], [1.0, 0.0, 0.0], atol=0.02)
+    np.testing.assert_allclose(res['ST'][:, 0], [1.0, 0.0, 0.0], atol=0.02)
+
+
+def test_indices_consistentes():
+    rangos = {'P0': (50, 150), 'beta0': (1.5, 2.5), 'alpha': (0.3, 0.7)}
+    res = indices_sobol(np.linspace(1, 10, 5), rangos, n_base=2**13, semilla=2)
+    assert np.all(res['S1'] >= -0.02) and np.all(res['ST'] <= 1.02)
+    assert np.all(res['ST'] >= res['S1'] - 0.02)
+    assert np.all(res['S1'].sum(axis=0) <= 1.02)
+    # beta0 domina el crecimiento para t grande
+    assert res['ST'][1, -1] > res['ST'][0, -1]
+
+
+def test_error_de_euler_lo_controla_h():
+    rangos = {'beta0': (1.5, 2.5), 'h': (0.01, 0.1)}
+    res = indices_sobol([10.0], rangos, n_base=2**9, metodo='euler', salida='error', semilla=1)
+    assert res['ST'][1, 0] > res['ST'][0, 0]
@@ -0,0 +1,52 @@
+"""Pruebas de regresion de las sensibilidades directas (Euler/RK4), tambien en lote."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Salida_Densa import interpolar_lineal
+
+
+P0 = np.array([100.0, 50.0, 80.0])
+BETA0 = np.array([2.0, 1.0, 1.5])
+ALPHA = np.array([0.5, 0.3, 0.4])
+T = np.array([0.5, 1.0, 5.0, 10.0])
+
+
+@pytest.mark.parametrize('clase, h, rtol', [(ModeloTumorRK4, 0.01, 1e-8),
+                                            (ModeloTumorEuler, 1e-4, 1e-3)])
+def test_sensibilidades_contra_jacobiano_analitico(clase, h, rtol):
+    modelo = clase(100.0, 2.0, 0.5, h=h, sensibilidades=True)
+    exacto = ModeloTumorAnalitico(100.0, 2.0, 0.5).jacobiano(T)
+    np.testing.assert_allclose(modelo.resolver_sensibilidades(T), exacto, rtol=rtol)
+
+
+@pytest.mark.parametrize('clase', [ModeloTumorRK4, ModeloTumorEuler])
+def test_lote_igual_a_modelos_individuales(clase):
+    lote = clase(P0, BETA0, ALPHA, h=0.1, sensibilidades=True)
+    P = lote.resolver(T)
+    S = lote.resolver_sensibilidades(T)
+    assert P.shape == (T.size, 3)
+    assert S.shape == (T.size, 3, 3)
+    assert lote.resolver(5.0).shape == (3,)
+    assert lote.resolver_sensibilidades(5.0).shape == (3, 3)
+
+    for i in range(3):
+        individual = clase(P0[i], BETA0[i], ALPHA[i], h=0.1, sensibilidades=True)
+        np.testing.assert_allclose(P[:, i], individual.resolver(T), rtol=1e-13)
+        np.testing.assert_allclose(S[:, i], individual.resolver_sensibilidades(T), rtol=1e-13)
+
+
+def test_interpolar_lineal_igual_a_interp_por_columna():
+    t_vals = np.linspace(0, 1, 11)
+    y_vals = np.column_stack([t_vals**2, np.sin(t_vals)])
+    t = np.array([-0.5, 0.0, 0.37, 0.95, 1.0, 2.0])
+    esperado = np.column_stack([np.interp(t, t_vals, y_vals[:, j]) for j in range(2)])
+    np.testing.assert_allclose(interpolar_lineal(t, t_vals, y_vals), esperado, rtol=1e-15)
+
+
+def test_sin_sensibilidades_falla():
+    with pytest.raises(ValueError):
+        ModeloTumorRK4(100.0, 2.0, 0.5).resolver_sensibilidades(1.0)
@@ -0,0 +1,41 @@
+"""Pruebas de regresion de la eleccion de h por tolerancia."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from Tolerancia import elegir_paso, resolver_con_tolerancia
+
+
+T = np.linspace(0, 10, 1001)
+P_EXACTO = ModeloTumorAnalitico(100, 2.0, 0.5).resolver(T)
+
+
+@pytest.mark.parametrize('clase, tol', [(ModeloTumorEuler, 1e-2), (ModeloTumorEuler, 1e-3),
+                                        (ModeloTumorRK4, 1e-4), (ModeloTumorRK4, 1e-7),
+                                        (ModeloTumorABM4, 1e-6)])
+def test_error_real_bajo_la_tolerancia(clase, tol):
+    P, modelo = resolver_con_tolerancia(clase, 100, 2.0, 0.5, T, tol)
+    assert np.max(np.abs(P / P_EXACTO - 1)) <= tol
+    # El paso divide exactamente a t_max
+    assert np.isclose(10.0 / modelo.h, round(10.0 / modelo.h))
+
+
+def test_h_crece_con_la_tolerancia():
+    h_fino, _ = elegir_paso(ModeloTumorRK4, 100, 2.0, 0.5, 1e-8, interpolacion=False)
+    h_grueso, info = elegir_paso(ModeloTumorRK4, 100, 2.0, 0.5, 1e-4, interpolacion=False)
+    assert h_grueso > h_fino
+    assert info['orden'] == 4 and info['h_interpolacion'] == 10.0
+
+
+def test_con_tolerancia_usa_elegir_paso():
+    h, _ = elegir_paso(ModeloTumorRK4, 100, 2.0, 0.5, 1e-6)
+    assert ModeloTumorRK4.con_tolerancia(100, 2.0, 0.5, tol=1e-6).h == h
+
+
+def test_tolerancia_invalida():
+    with pytest.raises(ValueError):
+        elegir_paso(ModeloTumorRK4, 100, 2.0, 0.5, 0.0)
@@ -0,0 +1,49 @@
+"""Pruebas de regresion del diagrama trabajo-precision."""
+
+import numpy as np
+import pytest
+
+from Grafica_Trabajo_Precision import (barrido_trabajo_precision, solver_mas_barato,
+                                       tabla_trabajo_precision)
+
+
+@pytest.fixture(scope='module')
+def resultados():
+    return barrido_trabajo_precision(100.0, 2.0, 0.5, metodos=['Euler', 'RK4'], repeticiones=1)
+
+
+def test_barrido_costo_y_orden(resultados):
+    rk4 = [fila for fila in resultados if fila['metodo'] == 'RK4']
+    for fila in rk4:
+        assert fila['evaluaciones_f'] == 4 * fila['pasos']
+        np.testing.assert_allclose(fila['valor'] * fila['pasos'], 10.0)
+    # Convergencia de orden 4: el error baja ~16 veces al duplicar los pasos
+    errores = np.array([fila['error'] for fila in rk4])
+    np.testing.assert_allclose(np.log2(errores[-4:-1] / errores[-3:]), 4.0, atol=0.1)
+
+
+def test_solver_mas_barato(resultados):
+    ganador = solver_mas_barato(resultados, 1e-6)
+    assert ganador['metodo'] == 'RK4' and ganador['error'] <= 1e-6
+    assert all(fila['evaluaciones_f'] >= ganador['evaluaciones_f']
+               for fila in resultados if fila['error'] <= 1e-6)
+    assert solver_mas_barato(resultados, 1e-20) is None
+
+
+def test_tabla(resultados):
+    assert len(tabla_trabajo_precision(resultados).splitlines()) == len(resultados) + 2
+
+
+def test_t_max_no_entero_se_evalua_en_nodos():
+    # Con t_max = 7.5 los tiempos enteros no son nodos de h = 7.5 / n; si se
+    # mezclara el error de interpolacion RK4 dejaria de mostrar orden 4
+    filas = barrido_trabajo_precision(100.0, 2.0, 0.5, t_max=7.5, metodos=['RK4'], repeticiones=1)
+    errores = np.array([fila['error'] for fila in filas])
+    np.testing.assert_allclose(np.log2(errores[-4:-1] / errores[-3:]), 4.0, atol=0.1)
+
+
+def test_registrar_metodo_exige_multiplos_de_10():
+    from Grafica_Trabajo_Precision import registrar_metodo
+    from ModeloTumorRK4 import ModeloTumorRK4
+    with pytest.raises(ValueError, match="multiplos de 10"):
+        registrar_metodo('RK4 mal', ModeloTumorRK4, 'h', [10, 25])
@@ -0,0 +1,44 @@
+"""Pruebas de regresion del modelo por tramos (protocolos de tratamiento)."""
+
+import numpy as np
+import pytest
+
+from Ecuacion_De_Poblacion import ModeloTumorAnalitico
+from ModeloTumorABM4 import ModeloTumorABM4
+from ModeloTumorEuler import ModeloTumorEuler
+from ModeloTumorRK4 import ModeloTumorRK4
+from ModeloTumorTratamiento import ModeloTumorPorTramos
+
+
+T = np.linspace(0, 10, 7)
+
+
+def test_tramos_iguales_coinciden_con_analitico():
+    modelo = ModeloTumorPorTramos(100, [0, 2, 5], 2.0, 0.5)
+    np.testing.assert_allclose(modelo.resolver(T), ModeloTumorAnalitico(100, 2.0, 0.5).resolver(T),
+                               rtol=1e-12)
+
+
+def test_dosis_multiplica_por_la_supervivencia():
+    modelo = ModeloTumorPorTramos.desde_dosis(100, 2.0, 0.5, [3.0], 0.4)
+    exacto = ModeloTumorAnalitico(100, 2.0, 0.5).resolver(np.array([2.0, 8.0]))
+    np.testing.assert_allclose(modelo.resolver([2.0, 8.0]), exacto * [1.0, 0.4], rtol=1e-12)
+
+
+@pytest.mark.parametrize('clase, rtol', [(ModeloTumorRK4, 1e-5), (ModeloTumorEuler, 2e-2)])
+def test_numerico_por_tramo_contra_cerrado(clase, rtol):
+    argumentos = (100, [0, 1, 4], [2.0, 1.0, 2.0], 0.5, [1.0, 0.7, 1.0])
+    cerrado = ModeloTumorPorTramos(*argumentos)
+    numerico = ModeloTumorPorTramos(*argumentos, metodo_numerico=clase, h=0.01)
+    np.testing.assert_allclose(numerico.resolver(T), cerrado.resolver(T), rtol=rtol)
+    assert numerico.evaluaciones_f == clase.evaluaciones_por_paso * numerico.pasos
+
+
+def test_metodo_multipaso_rechazado():
+    with pytest.raises(ValueError, match='paso'):
+        ModeloTumorPorTramos(100, [0, 1], 2.0, 0.5, metodo_numerico=ModeloTumorABM4)
+
+
+def test_tiempos_invalidos():
+    with pytest.raises(ValueError):
+        ModeloTumorPorTramos(100, [1, 2], 2.0, 0.5)